@@ -0,0 +1,58 @@
+"""Start-up microbenchmark for netcupctl.
+
+Each measurement runs in a fresh interpreter, so nothing is cached between
+runs, and times only the statement itself (not interpreter start-up):
+
+- ``import netcupctl``: reads the version from ``netcupctl/_version.py``
+- ``importlib.metadata.version``: importing importlib.metadata and the
+  site-packages metadata lookup the package used to perform on every import
+- ``import netcupctl.cli``: everything needed before a command runs
+
+Usage:
+    python benchmarks/startup.py [--runs N]
+"""
+
+import argparse
+import statistics
+import subprocess
+import sys
+
+CASES = {
+    "import netcupctl": ("", "import netcupctl"),
+    "importlib.metadata.version": (
+        "",
+        "from importlib.metadata import version; version('netcupctl')",
+    ),
+    "import netcupctl.cli": ("", "import netcupctl.cli"),
+}
+
+_TIMER = """
+import time
+{setup}
+start = time.perf_counter()
+{statement}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(setup: str, statement: str) -> float:
+    """Run the statement once in a fresh interpreter and return its duration in seconds."""
+    code = _TIMER.format(setup=setup, statement=statement)
+    result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+    return float(result.stdout.strip().splitlines()[-1])
+
+
+def main() -> None:
+    """Run all cases and print a summary table."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=20, help="Interpreter runs per case (default: 20)")
+    args = parser.parse_args()
+
+    print(f"{'case':<30} {'min ms':>9} {'median ms':>10}")
+    for name, (setup, statement) in CASES.items():
+        times = [measure(setup, statement) * 1000 for _ in range(args.runs)]
+        print(f"{name:<30} {min(times):>9.2f} {statistics.median(times):>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,249 @@
+"""End-to-end performance benchmarks for netcupctl.
+
+Every case runs the real code path against a local mock SCP API
+(``netcupctl.testing.mockserver``), so no network access or account is
+needed and results only depend on the machine:
+
+- ``cold_start.*``: a fresh ``netcupctl`` process, interpreter start-up included
+- ``servers_list.<format>.<n>``: ``servers list --all`` fetching and rendering
+  n servers in each output format
+- ``firewall_cleanup.500``: ``firewall cleanup --dry-run`` over 500 servers
+  with 5 ms API latency
+- ``upload``: ``custom-images upload`` throughput of a 128 MB file
+- ``pagination``: ``client.paginate`` throughput over 20000 log entries with
+  5 ms API latency
+
+The fastest run of each case is compared with ``benchmarks/baselines.json``
+(the least noisy statistic on a busy machine); cases slower than the baseline
+by more than ``--threshold`` percent are reported as regressions and make the run exit with status 1. Baselines are machine
+specific; store your own with ``--save`` before comparing changes.
+
+Usage:
+    python benchmarks/suite.py [--runs N] [--only PATTERN] [--save] [--threshold PERCENT]
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from click.testing import CliRunner
+
+from netcupctl.auth import AuthManager
+from netcupctl.cli import cli
+from netcupctl.client import NetcupClient
+from netcupctl.config import ConfigManager
+from netcupctl.testing.mockserver import seed_tokens
+
+BASELINES = Path(__file__).with_name("baselines.json")
+FORMATS = ("list", "table", "json", "yaml")
+FLEET_SIZES = (10, 1000, 10000)
+UPLOAD_MB = 128
+LOG_ENTRIES = 20000
+LATENCY = 0.005
+
+
+class Case(NamedTuple):
+    """A benchmark case; run() returns the measured seconds of one run."""
+
+    name: str
+    run: Callable[[], float]
+    amount: float = 0.0
+    unit: str = ""
+
+
+class MockProcess:
+    """Mock API server running in its own process, so it does not compete with netcupctl for the GIL."""
+
+    def __init__(self, servers: int, latency: float, policies: int, logs: int):
+        """Start the server and wait until it listens.
+
+        Args:
+            servers: Number of servers of the mock account
+            latency: Seconds added to every response
+            policies: Number of unreferenced firewall policies
+            logs: Number of log entries per log
+        """
+        self.process = subprocess.Popen(  # pylint: disable=consider-using-with
+            [sys.executable, "-m", "netcupctl.testing.mockserver", "--port", "0", "--servers", str(servers),
+             "--latency", str(latency), "--policies", str(policies), "--logs", str(logs)],
+            stdout=subprocess.PIPE, text=True,
+        )
+        line = self.process.stdout.readline()
+        if " at " not in line:
+            self.process.kill()
+            raise RuntimeError(f"Mock server did not start: {line!r}")
+        self.url = line.split(" at ", 1)[1].split()[0]
+
+    def stop(self) -> None:
+        """Stop the server process."""
+        self.process.terminate()
+        self.process.wait()
+        self.process.stdout.close()
+
+
+class Fleet:
+    """Mock API servers shared by the cases, started on first use."""
+
+    def __init__(self, workdir: Path):
+        """Initialize fleet.
+
+        Args:
+            workdir: Directory for the configuration and upload files
+        """
+        self.workdir = workdir
+        self.config_dir = workdir / "netcupctl"
+        self._servers: Dict[str, MockProcess] = {}
+        seed_tokens(self.config_dir)
+
+    def server(self, servers: int, latency: float = 0.0, policies: int = 0, logs: int = 0) -> MockProcess:
+        """Return a running mock server with the given model size and latency."""
+        key = f"{servers}/{latency}/{policies}/{logs}"
+        if key not in self._servers:
+            self._servers[key] = MockProcess(servers, latency, policies, logs)
+        return self._servers[key]
+
+    def env(self, server: MockProcess) -> Dict[str, str]:
+        """Return the environment pointing a netcupctl process at the server."""
+        return dict(os.environ, XDG_CONFIG_HOME=str(self.workdir), NETCUPCTL_API_URL=server.url,
+                    NETCUPCTL_NO_DAEMON="1")
+
+    def invoke(self, server: MockProcess, args: List[str]) -> float:
+        """Run a netcupctl command in this process and return its duration in seconds."""
+        runner = CliRunner(env=self.env(server))
+        start = time.perf_counter()
+        result = runner.invoke(cli, ["--no-cache", *args])
+        elapsed = time.perf_counter() - start
+        if result.exit_code != 0:
+            raise RuntimeError(f"netcupctl {' '.join(args)} failed: {result.output[-500:]}")
+        return elapsed
+
+    def warm_up(self) -> None:
+        """Import the lazily loaded commands and output libraries before the first measurement."""
+        for fmt in FORMATS:
+            self.invoke(self.server(10), ["--format", fmt, "servers", "list"])
+
+    def close(self) -> None:
+        """Stop all mock servers."""
+        for server in self._servers.values():
+            server.stop()
+
+
+def _cold_start(fleet: Fleet, args: List[str]) -> float:
+    server = fleet.server(10)
+    start = time.perf_counter()
+    subprocess.run([sys.executable, "-m", "netcupctl", *args], env=fleet.env(server),
+                   capture_output=True, check=True)
+    return time.perf_counter() - start
+
+
+def _upload(fleet: Fleet) -> float:
+    image = fleet.workdir / "upload.img"
+    if not image.exists():
+        with open(image, "wb") as f:
+            for _ in range(UPLOAD_MB):
+                f.write(os.urandom(1024 * 1024))
+    return fleet.invoke(fleet.server(10), ["custom-images", "upload", str(image), "--name", "bench.img"])
+
+
+def _pagination(fleet: Fleet) -> float:
+    server = fleet.server(10, latency=LATENCY, logs=LOG_ENTRIES)
+    config = ConfigManager()
+    config.config_dir = fleet.config_dir
+    config.tokens_file = fleet.config_dir / "tokens.json"
+    client = NetcupClient(AuthManager(config=config), base_url=server.url)
+    start = time.perf_counter()
+    count = sum(1 for _ in client.paginate("/api/v1/users/user_123/logs", page_size=500, prefetch=8))
+    elapsed = time.perf_counter() - start
+    if count != LOG_ENTRIES:
+        raise RuntimeError(f"Paginated {count} of {LOG_ENTRIES} log entries")
+    return elapsed
+
+
+def build_cases(fleet: Fleet) -> List[Case]:
+    """Return all benchmark cases."""
+    cases = [
+        Case("cold_start.version", lambda: _cold_start(fleet, ["--version"])),
+        Case("cold_start.servers_list", lambda: _cold_start(fleet, ["servers", "list"])),
+    ]
+    for count in FLEET_SIZES:
+        for fmt in FORMATS:
+            cases.append(Case(
+                f"servers_list.{fmt}.{count}",
+                lambda fmt=fmt, count=count: fleet.invoke(
+                    fleet.server(count), ["--format", fmt, "servers", "list", "--all", "--limit", "1000"]
+                ),
+                count, "servers/s",
+            ))
+    cases += [
+        Case("firewall_cleanup.500", lambda: fleet.invoke(
+            fleet.server(500, latency=LATENCY, policies=50), ["firewall", "cleanup", "--dry-run"]
+        ), 500, "servers/s"),
+        Case("upload", lambda: _upload(fleet), UPLOAD_MB, "MB/s"),
+        Case("pagination", lambda: _pagination(fleet), LOG_ENTRIES, "items/s"),
+    ]
+    return cases
+
+
+def _report(name: str, times: List[float], case: Case, baseline: Optional[dict], threshold: float) -> bool:
+    """Print one result line and return whether it is a regression."""
+    median = statistics.median(times)
+    rate = f"{case.amount / median:,.0f} {case.unit}" if case.amount else ""
+    delta, regression = "", False
+    if baseline:
+        change = (min(times) / baseline["min"] - 1) * 100
+        regression = change > threshold
+        delta = f"{change:+.1f}%" + (" REGRESSION" if regression else "")
+    print(f"{name:<30} {min(times) * 1000:>10.1f} {median * 1000:>10.1f} {rate:>18}  {delta}")
+    return regression
+
+
+def main() -> None:
+    """Run the selected cases, compare them with the baselines and optionally save them."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5, help="Runs per case (default: 5)")
+    parser.add_argument("--only", default="*", help="Run only cases matching this glob pattern (default: all)")
+    parser.add_argument("--save", action="store_true", help=f"Store the results in {BASELINES.name}")
+    parser.add_argument("--threshold", type=float, default=20.0,
+                        help="Percent slowdown reported as regression (default: 20)")
+    args = parser.parse_args()
+
+    stored = json.loads(BASELINES.read_text(encoding="utf-8")) if BASELINES.exists() else {"results": {}}
+    regressions = []
+    with tempfile.TemporaryDirectory() as workdir:
+        fleet = Fleet(Path(workdir))
+        try:
+            fleet.warm_up()
+            print(f"{'case':<30} {'min ms':>10} {'median ms':>10} {'throughput':>18}  vs. baseline")
+            for case in build_cases(fleet):
+                if not fnmatch.fnmatch(case.name, args.only):
+                    continue
+                times = [case.run() for _ in range(args.runs)]
+                if _report(case.name, times, case, stored["results"].get(case.name), args.threshold):
+                    regressions.append(case.name)
+                stored["results"][case.name] = {
+                    "median": round(statistics.median(times), 4), "min": round(min(times), 4)
+                }
+        finally:
+            fleet.close()
+
+    if args.save:
+        stored["machine"] = {"python": platform.python_version(), "platform": platform.platform(),
+                             "processor": platform.processor() or platform.machine(), "cpus": os.cpu_count()}
+        BASELINES.write_text(json.dumps(stored, indent=2, sort_keys=True) + "\n", encoding="utf-8")
+        print(f"Baselines saved to {BASELINES}")
+    elif regressions:
+        print(f"{len(regressions)} regression(s): {', '.join(regressions)}")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,16 @@
 """netcup SCP CLI Client."""
 
 try:
-    from importlib.metadata import version, PackageNotFoundError
+    from netcupctl._version import __version__
 except ImportError:
-    from importlib_metadata import version, PackageNotFoundError
+    # _version.py missing (incomplete source tree); ask the installed distribution instead
+    try:
+        from importlib.metadata import version, PackageNotFoundError
+    except ImportError:
+        from importlib_metadata import version, PackageNotFoundError
 
-try:
-    __version__ = version("netcupctl")
-except PackageNotFoundError:
-    # Package not installed, fallback for development
-    __version__ = "0.0.0.dev"
+    try:
+        __version__ = version("netcupctl")
+    except PackageNotFoundError:
+        # Package not installed, fallback for development
+        __version__ = "0.0.0.dev"
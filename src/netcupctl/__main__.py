@@ -8,7 +8,7 @@ import warnings
 if "LibreSSL" in ssl.OPENSSL_VERSION:
     warnings.filterwarnings("ignore", message="urllib3 v2 only supports OpenSSL")
 
-from netcupctl.cli import main
+from netcupctl.launcher import main
 
 if __name__ == "__main__":
     sys.exit(main())
@@ -0,0 +1,6 @@
+"""Version of netcupctl.
+
+Kept in sync by release-please and read by setuptools as the package version.
+"""
+
+__version__ = "0.6.1"  # x-release-please-version
@@ -0,0 +1,215 @@
+"""Asyncio HTTP API client for netcup SCP REST API."""
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Awaitable, Dict, Iterable, List, Optional
+
+from netcupctl import tracing
+from netcupctl.auth import AuthManager
+from netcupctl.client import NetcupClient
+
+DEFAULT_CONCURRENCY = 8
+
+
+async def gather(aws: Iterable[Awaitable[Any]], limit: int = DEFAULT_CONCURRENCY,
+                 return_exceptions: bool = False) -> List[Any]:
+    """Await many awaitables with at most ``limit`` of them in flight.
+
+    Args:
+        aws: Awaitables (usually coroutines) to run
+        limit: Maximum number of awaitables running at the same time
+        return_exceptions: Return exceptions in place of results instead of raising
+
+    Returns:
+        Results in the order of the given awaitables
+    """
+    semaphore = asyncio.Semaphore(max(1, limit))
+
+    async def _bounded(aw: Awaitable[Any]) -> Any:
+        async with semaphore:
+            return await aw
+
+    return await asyncio.gather(*(_bounded(aw) for aw in aws), return_exceptions=return_exceptions)
+
+
+class AsyncNetcupClient:
+    """Asyncio client for netcup SCP REST API.
+
+    Requests are executed by a wrapped NetcupClient on a bounded thread pool,
+    so the async client shares the connection pool, authentication and
+    response handling (including APIError semantics) of the synchronous one.
+    """
+
+    def __init__(
+        self,
+        auth: Optional[AuthManager] = None,
+        verbose: bool = False,
+        client: Optional[NetcupClient] = None,
+        concurrency: int = DEFAULT_CONCURRENCY,
+    ):
+        """Initialize async API client.
+
+        Args:
+            auth: Authentication manager (ignored if client is given)
+            verbose: Enable verbose logging (ignored if client is given)
+            client: Existing synchronous client to wrap
+            concurrency: Maximum number of requests in flight; a new client's
+                connection pool keeps a connection for each
+        """
+        self.concurrency = max(1, concurrency)
+        if client is None:
+            if auth is None:
+                raise ValueError("Either auth or client must be provided")
+            client = NetcupClient(auth, verbose=verbose, pool_maxsize=self.concurrency)
+        self.client = client
+        self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix="netcupctl-async")
+
+    async def __aenter__(self) -> "AsyncNetcupClient":
+        """Enter async context."""
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Exit async context and release worker threads."""
+        self.close()
+
+    def close(self) -> None:
+        """Shut down the worker thread pool."""
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, func, *args, **kwargs) -> Any:
+        """Run a blocking client method on the worker pool.
+
+        Args:
+            func: Bound method of the wrapped client
+            *args: Positional arguments
+            **kwargs: Keyword arguments
+
+        Returns:
+            Result of the method call
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, tracing.bind(functools.partial(func, *args, **kwargs)))
+
+    async def request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        accept: str = "application/json",
+    ) -> Dict[str, Any]:
+        """Make HTTP request to API.
+
+        Args:
+            method: HTTP method (GET, POST, PUT, DELETE, PATCH)
+            path: API path (e.g., /api/v1/servers)
+            params: Query parameters
+            json: JSON request body
+            accept: Accept header value (default: application/json)
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            APIError: If request fails
+        """
+        return await self._run(self.client.request, method, path, params=params, json=json, accept=accept)
+
+    async def get(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        accept: str = "application/json",
+    ) -> Dict[str, Any]:
+        """Make GET request.
+
+        Args:
+            path: API path
+            params: Query parameters
+            accept: Accept header value (default: application/json)
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.get, path, params=params, accept=accept)
+
+    async def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make POST request.
+
+        Args:
+            path: API path
+            json: JSON request body
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.post, path, json=json)
+
+    async def put(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Make PUT request.
+
+        Args:
+            path: API path
+            json: JSON request body
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.put, path, json=json)
+
+    async def patch(
+        self, path: str, params: Optional[Dict[str, Any]] = None, json: Optional[Dict[str, Any]] = None
+    ) -> Dict[str, Any]:
+        """Make PATCH request.
+
+        Args:
+            path: API path
+            params: Query parameters
+            json: JSON request body
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.patch, path, params=params, json=json)
+
+    async def delete(self, path: str) -> Dict[str, Any]:
+        """Make DELETE request.
+
+        Args:
+            path: API path
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.delete, path)
+
+    async def put_binary(
+        self,
+        path: str,
+        data: bytes,
+        content_type: str = "application/octet-stream",
+    ) -> Dict[str, Any]:
+        """Make PUT request with binary data.
+
+        Args:
+            path: API path
+            data: Binary data to upload
+            content_type: Content type header
+
+        Returns:
+            Response data
+        """
+        return await self._run(self.client.put_binary, path, data, content_type=content_type)
+
+    async def gather(self, *aws: Awaitable[Any], return_exceptions: bool = False) -> List[Any]:
+        """Await requests with at most ``concurrency`` of them in flight.
+
+        Args:
+            *aws: Awaitables, usually calls to this client's request methods
+            return_exceptions: Return exceptions in place of results instead of raising
+
+        Returns:
+            Results in the order of the given awaitables
+        """
+        return await gather(aws, limit=self.concurrency, return_exceptions=return_exceptions)
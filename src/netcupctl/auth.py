@@ -1,5 +1,6 @@
 """OAuth2 authentication management for netcupctl."""
 
+import threading
 import time
 import webbrowser
 from datetime import datetime, timedelta
@@ -33,6 +34,8 @@ class AuthManager:
         """
         self.config = config or ConfigManager()
         self._token_data: Optional[Dict] = None
+        # Serializes token load/refresh when one client is shared between worker threads.
+        self._lock = threading.RLock()
 
     def login(self) -> Dict[str, str]:
         """Perform OAuth2 Device Flow login.
@@ -258,6 +261,15 @@ class AuthManager:
         self._token_data = None
         return True
 
+    def reload(self) -> None:
+        """Discard the tokens held in memory so they are read from disk on next use.
+
+        Long-running processes call this when another netcupctl process may
+        have logged in, logged out or refreshed the tokens.
+        """
+        with self._lock:
+            self._token_data = None
+
     def get_access_token(self) -> Optional[str]:
         """Get current access token, refreshing if necessary.
 
@@ -267,6 +279,15 @@ class AuthManager:
         Raises:
             AuthError: If refresh fails
         """
+        with self._lock:
+            return self._get_access_token()
+
+    def _get_access_token(self) -> Optional[str]:
+        """Get current access token, refreshing if necessary (caller holds the lock).
+
+        Returns:
+            Access token or None if not authenticated
+        """
         if self._token_data is None:
             self._token_data = self.config.load_tokens()
 
@@ -0,0 +1,241 @@
+"""On-disk response cache for netcup SCP API GET requests."""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_ENTRIES = 512
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+
+
+def resource_path(path: str) -> str:
+    """Normalize an API path for cache invalidation.
+
+    Strips the query string, a trailing slash and a custom method suffix such
+    as ``:reapply``, so a write to ``/servers/1/interfaces/m/firewall:reapply``
+    is related to the ``/servers/1/interfaces/m/firewall`` resource.
+
+    Args:
+        path: API path
+
+    Returns:
+        Normalized resource path
+    """
+    path = path.split("?", 1)[0].rstrip("/")
+    head, _, last = path.rpartition("/")
+    if ":" in last:
+        path = f"{head}/{last.split(':', 1)[0]}"
+    return path
+
+
+def paths_related(cached_path: str, written_path: str) -> bool:
+    """Check whether a write to one path can change the response of another.
+
+    A write affects the resource itself, everything below it and the
+    collections above it (for example the list a created item appears in).
+
+    Args:
+        cached_path: Path of a cached GET response
+        written_path: Path of a POST/PUT/PATCH/DELETE request
+
+    Returns:
+        True if the cached response may be stale after the write
+    """
+    cached_path = resource_path(cached_path)
+    written_path = resource_path(written_path)
+    return (
+        cached_path == written_path
+        or cached_path.startswith(written_path + "/")
+        or written_path.startswith(cached_path + "/")
+    )
+
+
+class ResponseCache:
+    """Size-bounded LRU store of GET response bodies and their HTTP validators.
+
+    Each entry lives in its own file named after a hash of the request
+    (method, path, query parameters and Accept header). The first line holds
+    the entry metadata, the second line the JSON body, so invalidation only
+    has to read the metadata. Files are written atomically with owner-only
+    permissions because they contain account data. The file modification
+    time records the last use and drives eviction.
+    """
+
+    def __init__(self, cache_dir: Path, max_entries: int = DEFAULT_MAX_ENTRIES,
+                 max_bytes: int = DEFAULT_MAX_BYTES):
+        """Initialize response cache.
+
+        Args:
+            cache_dir: Directory holding the cache entries
+            max_entries: Maximum number of entries kept
+            max_bytes: Maximum total size of all entries in bytes
+        """
+        self.cache_dir = cache_dir
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+    @staticmethod
+    def make_key(method: str, path: str, params: Optional[Dict[str, Any]] = None,
+                 accept: str = "application/json") -> str:
+        """Build the cache key of a request.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            accept: Accept header value
+
+        Returns:
+            Hex digest identifying the request
+        """
+        material = json.dumps([method.upper(), path, params or {}, accept], sort_keys=True, default=str)
+        return hashlib.sha256(material.encode("utf-8")).hexdigest()
+
+    def _entry_file(self, key: str) -> Path:
+        """Return the file path of a cache entry."""
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str, max_age: Optional[float] = None) -> Optional[Dict[str, Any]]:
+        """Load a cache entry and mark it as recently used.
+
+        Args:
+            key: Cache key from make_key()
+            max_age: Only return the entry if it was stored at most this many seconds ago
+
+        Returns:
+            Entry with path, body, etag, last_modified and stored_at, or None
+            if missing, unreadable or older than max_age
+        """
+        entry_file = self._entry_file(key)
+        try:
+            with open(entry_file, "r", encoding="utf-8") as f:
+                entry = json.loads(f.readline())
+                entry["body"] = json.loads(f.readline())
+        except (OSError, ValueError, TypeError):
+            return None
+
+        if max_age is not None and time.time() - entry.get("stored_at", 0) > max_age:
+            return None
+
+        try:
+            os.utime(entry_file)
+        except OSError:
+            pass
+        return entry
+
+    def put(self, key: str, path: str, body: Any, etag: Optional[str] = None,
+            last_modified: Optional[str] = None) -> None:
+        """Store a cache entry and evict the least recently used entries beyond the limits.
+
+        Args:
+            key: Cache key from make_key()
+            path: API path of the request
+            body: Parsed response body
+            etag: ETag response header
+            last_modified: Last-Modified response header
+        """
+        meta = {"path": path, "etag": etag, "last_modified": last_modified, "stored_at": time.time()}
+        try:
+            data = json.dumps(meta) + "\n" + json.dumps(body, ensure_ascii=False) + "\n"
+            self._write_entry(key, data)
+        except (OSError, TypeError, ValueError):
+            return
+        self._evict()
+
+    def _write_entry(self, key: str, data: str) -> None:
+        """Write an entry file atomically with owner-only permissions."""
+        self.cache_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd, temp_name = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                f.write(data)
+            os.replace(temp_name, self._entry_file(key))
+        except BaseException:
+            try:
+                os.unlink(temp_name)
+            except OSError:
+                pass
+            raise
+
+    def _entries(self) -> List[Tuple[float, int, Path]]:
+        """List entries as (last use, size, file) tuples, oldest first."""
+        entries = []
+        if not self.cache_dir.exists():
+            return entries
+        for entry_file in self.cache_dir.glob("*.json"):
+            try:
+                stat = entry_file.stat()
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry_file))
+        entries.sort()
+        return entries
+
+    def _evict(self) -> None:
+        """Remove least recently used entries until the size limits are met."""
+        entries = self._entries()
+        total = sum(size for _, size, _ in entries)
+        count = len(entries)
+        for _, size, entry_file in entries:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            try:
+                entry_file.unlink()
+            except OSError:
+                continue
+            count -= 1
+            total -= size
+
+    def delete(self, key: str) -> None:
+        """Remove a cache entry if it exists.
+
+        Args:
+            key: Cache key from make_key()
+        """
+        try:
+            self._entry_file(key).unlink()
+        except OSError:
+            pass
+
+    def invalidate(self, path: str) -> int:
+        """Remove all entries whose response may have changed by a write to path.
+
+        Args:
+            path: API path of a POST/PUT/PATCH/DELETE request
+
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        for _, _, entry_file in self._entries():
+            try:
+                with open(entry_file, "r", encoding="utf-8") as f:
+                    cached_path = json.loads(f.readline()).get("path", "")
+            except (OSError, ValueError, AttributeError):
+                cached_path = path
+            if paths_related(cached_path, path):
+                try:
+                    entry_file.unlink()
+                    removed += 1
+                except OSError:
+                    pass
+        return removed
+
+    def clear(self) -> int:
+        """Remove all cache entries.
+
+        Returns:
+            Number of removed entries
+        """
+        removed = 0
+        for _, _, entry_file in self._entries():
+            try:
+                entry_file.unlink()
+                removed += 1
+            except OSError:
+                pass
+        return removed
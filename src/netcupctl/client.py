@@ -1,11 +1,24 @@
 """HTTP API client for netcup SCP REST API."""
 
 import sys
-from typing import Any, Dict, Optional
+import time
+from contextlib import contextmanager
+from typing import Any, BinaryIO, Callable, Dict, Iterator, Optional, Tuple, Union
 
 import requests
+from requests.adapters import DEFAULT_POOLSIZE
 
+from netcupctl import tracing
 from netcupctl.auth import AuthManager
+from netcupctl.cache import ResponseCache
+from netcupctl.connection import ConnectionSettings
+from netcupctl.latency import LatencyRecorder
+from netcupctl.pagination import DEFAULT_PAGE_SIZE, paginate
+from netcupctl.ratelimit import TokenBucket
+from netcupctl.retry import RetryPolicy
+from netcupctl.singleflight import SingleFlight
+from netcupctl.timings import Timings, collect_http_phases
+from netcupctl.transport import TimedHTTPAdapter
 
 
 class APIError(Exception):
@@ -22,26 +35,89 @@ class APIError(Exception):
         self.status_code = status_code
 
 
-class NetcupClient:
+class NetcupClient:  # pylint: disable=too-many-instance-attributes
     """Client for netcup SCP REST API."""
 
     BASE_URL = "https://www.servercontrolpanel.de/scp-core"
 
-    def __init__(self, auth: AuthManager, verbose: bool = False):
+    def __init__(  # pylint: disable=too-many-locals
+        self,
+        auth: AuthManager,
+        verbose: bool = False,
+        pool_maxsize: int = DEFAULT_POOLSIZE,
+        retry: Optional[RetryPolicy] = None,
+        rate_limiter: Optional[TokenBucket] = None,
+        cache: Optional[ResponseCache] = None,
+        cache_ttl: float = 0,
+        session: Optional[requests.Session] = None,
+        timings: Optional[Timings] = None,
+        latency: Optional[LatencyRecorder] = None,
+        base_url: Optional[str] = None,
+        settings: Optional[ConnectionSettings] = None,
+    ):
         """Initialize API client.
 
         Args:
             auth: Authentication manager
             verbose: Enable verbose logging
+            pool_maxsize: Number of threads sharing this client; the connection pool keeps
+                a connection for each unless settings limit it
+            retry: Retry policy for transient failures (default: RetryPolicy())
+            rate_limiter: Token bucket every request attempt has to pass (default: unlimited)
+            cache: Response cache used for conditional GET requests (default: no caching)
+            cache_ttl: Seconds a cached GET response is served without contacting the API;
+                0 only revalidates responses carrying an ETag or Last-Modified header
+            session: HTTP session to send requests with, e.g. one kept open by a
+                long-running process (default: a new session from create_session())
+            timings: Collector for token, HTTP phase and JSON decode durations (default: none)
+            latency: Recorder of per-endpoint request latencies and slow requests (default: none)
+            base_url: API base URL replacing BASE_URL, e.g. of a local mock server
+                (default: settings.api_url or BASE_URL)
+            settings: Timeouts, connection pool sizing and keep-alive (default: ConnectionSettings())
         """
         self.auth = auth
         self.verbose = verbose
-        self.session = requests.Session()
-        self.session.headers.update(
+        self.retry = retry if retry is not None else RetryPolicy()
+        self.rate_limiter = rate_limiter
+        self.cache = cache
+        self.cache_ttl = cache_ttl
+        self.timings = timings
+        self.latency = latency
+        self.settings = settings if settings is not None else ConnectionSettings()
+        if base_url or self.settings.api_url:
+            self.BASE_URL = (base_url or self.settings.api_url).rstrip("/")
+        self._in_flight = SingleFlight()
+        self.session = session if session is not None else self.create_session(pool_maxsize, self.settings)
+
+    @staticmethod
+    def create_session(pool_maxsize: int = DEFAULT_POOLSIZE,
+                       settings: Optional[ConnectionSettings] = None) -> requests.Session:
+        """Create an HTTP session with a connection pool for the API host.
+
+        The connections report their DNS, connect, TLS, send and wait times
+        to clients created with ``timings``.
+
+        Args:
+            pool_maxsize: Number of threads sending requests through the session
+            settings: Connection pool sizing and keep-alive (default: ConnectionSettings())
+
+        Returns:
+            Configured session
+        """
+        settings = settings if settings is not None else ConnectionSettings()
+        session = requests.Session()
+        session.headers.update(
             {
                 "User-Agent": "netcupctl/0.1.0",
             }
         )
+        if not settings.keep_alive:
+            session.headers["Connection"] = "close"
+        maxsize, block = settings.pool_size(pool_maxsize)
+        adapter = TimedHTTPAdapter(pool_connections=settings.pool_connections, pool_maxsize=maxsize, pool_block=block)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
 
     def request(
         self,
@@ -53,6 +129,9 @@ class NetcupClient:
     ) -> Dict[str, Any]:
         """Make HTTP request to API.
 
+        Identical GET requests issued concurrently from several threads share
+        one HTTP round-trip; every caller gets its own copy of the result.
+
         Args:
             method: HTTP method (GET, POST, PUT, DELETE, PATCH)
             path: API path (e.g., /api/v1/servers)
@@ -67,7 +146,35 @@ class NetcupClient:
             APIError: If request fails
             AuthError: If authentication fails
         """
-        headers = self._build_headers(method, json is not None, accept=accept)
+        with tracing.span(f"{method.upper()} {path}", "http", params=params):
+            if method.upper() == "GET":
+                key = ResponseCache.make_key(method, path, params, accept)
+                return self._in_flight.do(key, lambda: self._request(method, path, params, json, accept))
+            return self._request(method, path, params, json, accept)
+
+    def _request(
+        self,
+        method: str,
+        path: str,
+        params: Optional[Dict[str, Any]],
+        json: Optional[Dict[str, Any]],
+        accept: str,
+    ) -> Dict[str, Any]:
+        """Make HTTP request to API without coalescing.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            json: JSON request body
+            accept: Accept header value
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            APIError: If request fails
+        """
         url = f"{self.BASE_URL}{path}"
 
         if self.verbose:
@@ -77,33 +184,155 @@ class NetcupClient:
             if json:
                 print(f"[VERBOSE] Request body: {json}", file=sys.stderr)
 
-        try:
-            response = self.session.request(
+        cache_key, cached = self._lookup_cache(method, path, params, accept)
+        if self._is_fresh(cached):
+            if self.verbose:
+                print("[VERBOSE] Using cached response", file=sys.stderr)
+            return cached["body"]
+
+        def send() -> requests.Response:
+            headers = self._build_headers(method, json is not None, accept=accept)
+            headers.update(self._conditional_headers(cached))
+            return self._timed_attempt(method, path, lambda: self.session.request(
                 method=method.upper(),
                 url=url,
                 headers=headers,
                 params=params,
                 json=json,
-                timeout=30,
+                timeout=self.settings.timeout,
                 verify=True,
-            )
+            ))
+
+        try:
+            response = self._send_with_retry(method, url, send)
+            self._invalidate_cache(method, path)
 
             if self.verbose:
                 print(f"[VERBOSE] Response status: {response.status_code}", file=sys.stderr)
 
+            if cache_key is not None:
+                return self._handle_cacheable_response(response, cache_key, path, cached)
             return self._handle_response(response)
 
         except requests.ConnectionError as exc:
+            self._invalidate_cache(method, path)
             raise APIError(
                 "Network error: Could not connect to API. Please check your internet connection."
             ) from exc
 
         except requests.Timeout as exc:
+            self._invalidate_cache(method, path)
             raise APIError("Request timeout. The API did not respond in time.") from exc
 
         except requests.RequestException as exc:
             raise APIError(f"Request failed: {type(exc).__name__}") from exc
 
+    def _send_with_retry(self, method: str, url: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send a request, retrying transient failures according to the retry policy.
+
+        Args:
+            method: HTTP method
+            url: Request URL (used for verbose logging)
+            send: Callable performing one attempt
+
+        Returns:
+            The final HTTP response (successful or not retryable)
+
+        Raises:
+            requests.RequestException: If the last attempt failed with a network error
+        """
+        started = time.monotonic()
+        attempt = 0
+        while True:
+            self._wait_for_rate_limit(method, url)
+            try:
+                response = send()
+            except (requests.ConnectionError, requests.Timeout) as exc:
+                delay = self.retry.next_delay(method, attempt, started)
+                if delay is None:
+                    raise
+                reason = type(exc).__name__
+            else:
+                if response.status_code not in self.retry.status_codes:
+                    return response
+                delay = self.retry.next_delay(method, attempt, started, response)
+                if delay is None:
+                    return response
+                reason = f"HTTP {response.status_code}"
+
+            attempt += 1
+            if self.verbose:
+                print(
+                    f"[VERBOSE] Retrying {method.upper()} {url} in {delay:.1f}s "
+                    f"({reason}, retry {attempt}/{self.retry.max_retries})",
+                    file=sys.stderr,
+                )
+            with tracing.span("retry", "retry", reason=reason, delay=delay, retry=attempt):
+                time.sleep(delay)
+
+    @contextmanager
+    def _measure(self, name: str) -> Iterator[None]:
+        """Record the duration of the with-block as a timings phase and trace span (if enabled)."""
+        with tracing.span(name, "client"):
+            if self.timings is None:
+                yield
+            else:
+                with self.timings.measure(name):
+                    yield
+
+    def _timed_attempt(self, method: str, path: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send one HTTP attempt as a trace span, recording its connection phases if timings are collected.
+
+        Args:
+            method: HTTP method
+            path: API path
+            send: Callable sending the request
+
+        Returns:
+            HTTP response
+        """
+        with tracing.span("attempt", "http.attempt") as attempt:
+            response = self._measure_attempt(method, path, send)
+            if attempt is not None:
+                attempt.set(status=response.status_code)
+            return response
+
+    def _measure_attempt(self, method: str, path: str, send: Callable[[], requests.Response]) -> requests.Response:
+        """Send one HTTP attempt and add its duration to the timings and latency statistics (if enabled)."""
+        if self.timings is None and self.latency is None:
+            return send()
+        status = None
+        start = time.perf_counter()
+        with collect_http_phases() as phases:
+            try:
+                response = send()
+                status = response.status_code
+                return response
+            finally:
+                seconds = time.perf_counter() - start
+                if self.timings is not None:
+                    self.timings.add_request(method, path, status, seconds, phases)
+                if self.latency is not None:
+                    self.latency.record(method, path, status, seconds)
+
+    def _get_access_token(self) -> Optional[str]:
+        """Return the access token, loading or refreshing it as needed."""
+        with self._measure("auth.token"):
+            return self.auth.get_access_token()
+
+    def _wait_for_rate_limit(self, method: str, url: str) -> None:
+        """Block until the rate limiter admits the next request attempt.
+
+        Args:
+            method: HTTP method (used for verbose logging)
+            url: Request URL (used for verbose logging)
+        """
+        if self.rate_limiter is None:
+            return
+        waited = self.rate_limiter.acquire()
+        if waited > 0 and self.verbose:
+            print(f"[VERBOSE] Rate limit: delayed {method.upper()} {url} by {waited:.2f}s", file=sys.stderr)
+
     def _build_headers(self, method: str, has_json: bool, accept: str = "application/json") -> Dict[str, str]:
         """Build request headers with authentication.
 
@@ -115,7 +344,7 @@ class NetcupClient:
         Returns:
             Headers dictionary
         """
-        access_token = self.auth.get_access_token()
+        access_token = self._get_access_token()
         if not access_token:
             print("Error: Not authenticated. Please run 'netcupctl auth login' first.", file=sys.stderr)
             sys.exit(1)
@@ -133,6 +362,102 @@ class NetcupClient:
 
         return headers
 
+    def _lookup_cache(
+        self, method: str, path: str, params: Optional[Dict[str, Any]], accept: str
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """Look up the cache entry of a GET request.
+
+        Args:
+            method: HTTP method
+            path: API path
+            params: Query parameters
+            accept: Accept header value
+
+        Returns:
+            Tuple of (cache key, cache entry); the key is None if the request is not cacheable
+        """
+        if self.cache is None or method.upper() != "GET":
+            return None, None
+        cache_key = ResponseCache.make_key(method, path, params, accept)
+        return cache_key, self.cache.get(cache_key)
+
+    def _is_fresh(self, cached: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a cache entry may be served without contacting the API.
+
+        Args:
+            cached: Cache entry or None
+
+        Returns:
+            True if the entry is younger than the cache TTL
+        """
+        if cached is None or self.cache_ttl <= 0:
+            return False
+        return time.time() - cached.get("stored_at", 0) <= self.cache_ttl
+
+    def _invalidate_cache(self, method: str, path: str) -> None:
+        """Drop cached GET responses a write request may have made stale.
+
+        Args:
+            method: HTTP method of the request
+            path: API path of the request
+        """
+        if self.cache is None or method.upper() == "GET":
+            return
+        removed = self.cache.invalidate(path)
+        if removed and self.verbose:
+            print(f"[VERBOSE] Invalidated {removed} cached response(s) under {path}", file=sys.stderr)
+
+    @staticmethod
+    def _conditional_headers(cached: Optional[Dict[str, Any]]) -> Dict[str, str]:
+        """Build If-None-Match/If-Modified-Since headers from a cache entry.
+
+        Args:
+            cached: Cache entry or None
+
+        Returns:
+            Conditional request headers (empty without a usable entry)
+        """
+        headers = {}
+        if cached:
+            if cached.get("etag"):
+                headers["If-None-Match"] = cached["etag"]
+            if cached.get("last_modified"):
+                headers["If-Modified-Since"] = cached["last_modified"]
+        return headers
+
+    def _handle_cacheable_response(
+        self,
+        response: requests.Response,
+        cache_key: str,
+        path: str,
+        cached: Optional[Dict[str, Any]],
+    ) -> Dict[str, Any]:
+        """Handle a GET response, serving 304 from the cache and storing validated bodies.
+
+        Args:
+            response: HTTP response object
+            cache_key: Cache key of the request
+            path: API path of the request
+            cached: Cache entry whose validators were sent, if any
+
+        Returns:
+            Response data as dictionary
+
+        Raises:
+            APIError: If response indicates an error
+        """
+        if response.status_code == 304 and cached is not None:
+            if self.verbose:
+                print("[VERBOSE] Not modified, using cached response", file=sys.stderr)
+            return cached["body"]
+
+        result = self._handle_response(response)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if response.status_code == 200 and (etag or last_modified or self.cache_ttl > 0):
+            self.cache.put(cache_key, path, result, etag=etag, last_modified=last_modified)
+        return result
+
     def _handle_response(self, response: requests.Response) -> Dict[str, Any]:
         """Handle HTTP response and extract data.
 
@@ -183,7 +508,8 @@ class NetcupClient:
         """
         if response.content:
             try:
-                return response.json()
+                with self._measure("json.decode"):
+                    return response.json()
             except requests.JSONDecodeError:
                 return {"data": response.text}
         return {}
@@ -258,6 +584,28 @@ class NetcupClient:
         """
         return self.request("GET", path, params=params, accept=accept)
 
+    def paginate(
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        page_size: int = DEFAULT_PAGE_SIZE,
+        prefetch: int = 0,
+        total: Optional[int] = None,
+    ) -> Iterator[Any]:
+        """Iterate lazily over all items of an offset/limit paginated list endpoint.
+
+        Args:
+            path: API path
+            params: Query parameters; an ``offset`` sets the first item
+            page_size: Number of items requested per page
+            prefetch: Number of pages requested concurrently ahead of the one being consumed
+            total: Total number of items, if known (avoids requests past the last page)
+
+        Returns:
+            Iterator over the items of all pages, in order
+        """
+        return paginate(self, path, params=params, page_size=page_size, prefetch=prefetch, total=total)
+
     def post(self, path: str, json: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make POST request.
 
@@ -311,14 +659,18 @@ class NetcupClient:
     def put_binary(
         self,
         path: str,
-        data: bytes,
+        data: Union[bytes, BinaryIO],
         content_type: str = "application/octet-stream",
     ) -> Dict[str, Any]:
         """Make PUT request with binary data.
 
+        A file-like ``data`` is streamed from its start without being loaded
+        into memory; it must support len(), seek() and tell(), and is rewound
+        before every retry.
+
         Args:
             path: API path
-            data: Binary data to upload
+            data: Binary data to upload, or a file-like object to stream
             content_type: Content type header
 
         Returns:
@@ -327,27 +679,34 @@ class NetcupClient:
         Raises:
             APIError: If request fails
         """
-        headers = self._build_binary_headers(content_type)
         url = f"{self.BASE_URL}{path}"
 
-        try:
-            response = self.session.put(
+        def send() -> requests.Response:
+            headers = self._build_binary_headers(content_type)
+            if hasattr(data, "seek"):
+                data.seek(0)
+            return self._timed_attempt("PUT", path, lambda: self.session.put(
                 url=url,
                 headers=headers,
                 data=data,
-                timeout=300,
+                timeout=self.settings.upload_timeouts,
                 verify=True,
-            )
-            return self._handle_binary_response(response)
+            ))
 
-        except requests.ConnectionError as exc:
-            raise APIError("Network error: Could not connect to API.") from exc
+        with tracing.span(f"PUT {path}", "http", bytes=len(data)):
+            try:
+                response = self._send_with_retry("PUT", url, send)
+                self._invalidate_cache("PUT", path)
+                return self._handle_binary_response(response)
 
-        except requests.Timeout as exc:
-            raise APIError("Request timeout during upload.") from exc
+            except requests.ConnectionError as exc:
+                raise APIError("Network error: Could not connect to API.") from exc
 
-        except requests.RequestException as exc:
-            raise APIError(f"Upload failed: {type(exc).__name__}") from exc
+            except requests.Timeout as exc:
+                raise APIError("Request timeout during upload.") from exc
+
+            except requests.RequestException as exc:
+                raise APIError(f"Upload failed: {type(exc).__name__}") from exc
 
     def _build_binary_headers(self, content_type: str) -> Dict[str, str]:
         """Build headers for binary upload request.
@@ -358,7 +717,7 @@ class NetcupClient:
         Returns:
             Headers dictionary
         """
-        access_token = self.auth.get_access_token()
+        access_token = self._get_access_token()
         if not access_token:
             print("Error: Not authenticated. Please run 'netcupctl auth login' first.", file=sys.stderr)
             sys.exit(1)
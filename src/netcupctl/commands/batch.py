@@ -0,0 +1,132 @@
+"""Batch execution of many commands in one process."""
+
+import copy
+import json
+import shlex
+import sys
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, Iterator, List, Tuple
+
+import click
+
+from netcupctl import tracing
+from netcupctl.client import NetcupClient
+from netcupctl.invocation import command_name, global_args, run_command
+
+# Commands that manage processes or need a terminal cannot run inside a batch.
+_NOT_IN_BATCH = ("batch", "daemon", "shell")
+
+
+def _commands(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    """Yield (line number, command) for every non-empty, non-comment line."""
+    for number, line in enumerate(lines, start=1):
+        text = line.strip()
+        if text and not text.startswith("#"):
+            yield number, text
+
+
+def _run_line(root: click.Command, base, number: int, text: str, default_args: List[str]) -> Dict[str, Any]:
+    """Run one batch line and return its result record.
+
+    Args:
+        root: Root command (the cli group)
+        base: Context shared by all lines
+        number: Line number in the input
+        text: Command line (optionally starting with 'netcupctl')
+        default_args: Global options inherited from the batch invocation
+
+    Returns:
+        Result record with line, command, exit_code, stdout and stderr
+    """
+    record = {"line": number, "command": text}
+    try:
+        argv = shlex.split(text)
+    except ValueError as e:
+        return {**record, "exit_code": 2, "stdout": "", "stderr": f"Error: {e}\n"}
+
+    if argv[:1] == ["netcupctl"]:
+        argv = argv[1:]
+    name = command_name(root, argv)
+    if name in _NOT_IN_BATCH:
+        return {**record, "exit_code": 2, "stdout": "", "stderr": f"Error: '{name}' cannot run inside a batch.\n"}
+
+    exit_code, out, err = run_command(root, base, default_args + argv)
+    return {**record, "exit_code": exit_code, "stdout": out, "stderr": err}
+
+
+def _run_all(run, commands: Iterator[Tuple[int, str]], parallel: int) -> Iterator[Dict[str, Any]]:
+    """Run commands with up to ``parallel`` in flight and yield their results in input order.
+
+    Input is read only as far as needed to keep ``parallel`` commands running,
+    so commands arriving on stdin start before the input ends.
+    """
+    if parallel <= 1:
+        for number, text in commands:
+            yield run(number, text)
+        return
+
+    with ThreadPoolExecutor(max_workers=parallel, thread_name_prefix="netcupctl-batch") as executor:
+        pending = deque()
+        for number, text in commands:
+            pending.append(executor.submit(tracing.bind(run), number, text))
+            if len(pending) >= parallel:
+                yield pending.popleft().result()
+        while pending:
+            yield pending.popleft().result()
+
+
+@click.command()
+@click.argument("file", type=click.File("r"))
+@click.option(
+    "--parallel",
+    "-p",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of commands run at the same time.",
+)
+@click.pass_obj
+def batch(ctx, file, parallel: int):
+    """Run many netcupctl commands in one process.
+
+    Reads one command line per line of FILE ('-' for stdin), without the
+    leading 'netcupctl' (it is ignored if present). Empty lines and lines
+    starting with '#' are skipped. All commands share one HTTP session and
+    one login, so there is no per-command start-up or TLS handshake.
+
+    For every command one JSON object is written per line (NDJSON) with the
+    fields line, command, exit_code, stdout and stderr, in input order. The
+    global options of the batch invocation (--format, --api-url, --retries,
+    ...) are the defaults for every command. The exit status is 1 if any
+    command failed.
+
+    \b
+    Arguments:
+        FILE: File with one command per line, or '-' for stdin.
+
+    \b
+    Examples:
+      netcupctl batch commands.txt
+      netcupctl --format json batch --parallel 8 commands.txt
+      generate-commands | netcupctl batch -
+    """
+    base = copy.copy(ctx)
+    base.client = None
+    base.session = NetcupClient.create_session(max(parallel, ctx.parallel), ctx.connection)
+    root_ctx = click.get_current_context().find_root()
+    root = root_ctx.command
+    default_args = global_args(root_ctx)
+
+    failed = False
+    results = _run_all(
+        lambda number, text: _run_line(root, base, number, text, default_args),
+        _commands(file),
+        parallel,
+    )
+    for record in results:
+        failed = failed or record["exit_code"] != 0
+        click.echo(json.dumps(record, ensure_ascii=False))
+
+    if failed:
+        sys.exit(1)
@@ -6,7 +6,8 @@ import sys
 import click
 
 from netcupctl.client import APIError
-from netcupctl.commands.helpers import get_authenticated_user_id
+from netcupctl.commands.helpers import get_authenticated_user_id, upload_file
+from netcupctl.upload import DEFAULT_PARALLEL_PARTS
 
 
 @click.group(name="custom-isos")
@@ -83,12 +84,30 @@ def delete_iso(ctx, key: str, confirm: bool, yes: bool):
 @custom_isos.command("upload")
 @click.argument("file", type=click.Path(exists=True))
 @click.option("--name", help="ISO name (defaults to filename)")
+@click.option(
+    "--parallel-parts",
+    type=click.IntRange(min=1),
+    default=DEFAULT_PARALLEL_PARTS,
+    show_default=True,
+    help="Maximum number of parts uploaded at the same time",
+)
+@click.option("--resume", is_flag=True, help="Continue an interrupted upload of the same file")
+@click.option(
+    "--skip-unchanged",
+    is_flag=True,
+    help="Skip the upload if the same content was uploaded under this name before",
+)
 @click.pass_obj
-def upload_iso(ctx, file: str, name: str):
+def upload_iso(ctx, file: str, name: str, parallel_parts: int, resume: bool, skip_unchanged: bool):
     """Upload a custom ISO (multipart upload).
 
     Uploads a custom ISO file to your account.
-    Supports large files via multipart upload.
+    Supports large files via multipart upload; part size and the number of
+    parts sent at the same time (up to --parallel-parts) grow while the
+    measured throughput rises. Sent parts are journaled; after a failure or
+    interruption, --resume sends only the missing parts. With
+    --skip-unchanged, a file whose SHA-256 matches the last upload under
+    the same name, still present on the server, is not uploaded again.
 
     \b
     Arguments:
@@ -96,70 +115,8 @@ def upload_iso(ctx, file: str, name: str):
     """
     try:
         user_id = get_authenticated_user_id(ctx)
-        key = name or os.path.basename(file)
-        file_size = os.path.getsize(file)
-
-        click.echo(f"Uploading {key} ({file_size / (1024*1024):.1f} MB)...")
-
-        init_result = ctx.client.post(f"/api/v1/users/{user_id}/isos/{key}")
-        upload_id = init_result.get("uploadId")
-
-        if not upload_id:
-            click.echo("Error: Failed to initiate upload", err=True)
-            sys.exit(1)
-
-        _perform_multipart_upload(ctx, file, file_size, user_id, key, upload_id)
-
+        upload_file(ctx, user_id, "isos", file, name or os.path.basename(file), parallel_parts,
+                    "Custom ISO", resume, skip_unchanged)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
-
-
-def _perform_multipart_upload(ctx, file: str, file_size: int, user_id: str, key: str, upload_id: str):
-    """Perform multipart upload of ISO file."""
-    try:
-        parts = _upload_file_parts(ctx, file, file_size, user_id, key, upload_id)
-
-        complete_result = ctx.client.post(
-            f"/api/v1/users/{user_id}/isos/{key}/{upload_id}",
-            json={"parts": parts}
-        )
-
-        ctx.formatter.output(complete_result)
-        click.echo("\n[OK] Custom ISO uploaded successfully.", err=False)
-
-    except (APIError, OSError, IOError) as e:
-        click.echo(f"\nUpload failed: {e}", err=True)
-        click.echo("Aborting upload...", err=True)
-        try:
-            ctx.client.delete(f"/api/v1/users/{user_id}/isos/{key}/{upload_id}")
-        except APIError:
-            pass
-        sys.exit(1)
-
-
-def _upload_file_parts(ctx, file: str, file_size: int, user_id: str, key: str, upload_id: str):  # pylint: disable=too-many-locals
-    """Upload file in parts and return list of uploaded parts."""
-    chunk_size = 100 * 1024 * 1024
-    parts = []
-    part_number = 1
-
-    with open(file, "rb") as f:
-        with click.progressbar(length=file_size, label="Uploading") as progress:
-            while True:
-                chunk = f.read(chunk_size)
-                if not chunk:
-                    break
-
-                part_result = ctx.client.put_binary(
-                    f"/api/v1/users/{user_id}/isos/{key}/{upload_id}/parts/{part_number}",
-                    data=chunk,
-                )
-
-                etag = part_result.get("etag") or part_result.get("ETag")
-                parts.append({"partNumber": part_number, "etag": etag})
-
-                progress.update(len(chunk))
-                part_number += 1
-
-    return parts
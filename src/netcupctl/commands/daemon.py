@@ -0,0 +1,178 @@
+"""Background daemon management commands."""
+
+import copy
+import os
+import signal
+import subprocess
+import sys
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Optional
+
+import click
+
+from netcupctl.client import NetcupClient
+from netcupctl.commands.validators import validate_duration
+from netcupctl.daemon import LOG_FILENAME, DaemonServer, is_supported, send, socket_path
+from netcupctl.invocation import run_command
+
+_START_TIMEOUT = 10.0
+
+
+@click.group()
+def daemon():
+    """Background daemon that keeps sessions and tokens warm.
+
+    While the daemon runs, netcupctl commands started from scripts (stdin or
+    stdout not a terminal) are executed by the daemon, which keeps the HTTP
+    connections, the tokens and the loaded modules of the previous commands.
+    Interactive commands keep running in the calling process. Set
+    NETCUPCTL_NO_DAEMON=1 to bypass a running daemon.
+
+    \b
+    Examples:
+      netcupctl daemon start
+      netcupctl daemon status
+      netcupctl daemon stop
+    """
+    pass
+
+
+def _require_support() -> None:
+    if not is_supported():
+        click.echo("Error: The daemon requires Unix domain sockets, which this platform does not support.", err=True)
+        sys.exit(1)
+
+
+def _mtime(path: Path) -> Optional[int]:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return None
+
+
+def _make_runner(ctx):
+    """Build the daemon's command runner around a shared context.
+
+    The shared context keeps one HTTP session and one AuthManager for all
+    commands. Tokens are reloaded from disk whenever another process (for
+    example 'auth login' or 'auth logout') has changed the token file.
+    """
+    base = copy.copy(ctx)
+    base.client = None
+    base.session = NetcupClient.create_session(ctx.parallel, ctx.connection)
+    root = click.get_current_context().find_root().command
+    tokens_mtime = [None]
+
+    def runner(argv, stdin):
+        mtime = _mtime(base.config.tokens_file)
+        if mtime != tokens_mtime[0]:
+            base.auth.reload()
+            tokens_mtime[0] = mtime
+        return run_command(root, base, argv, stdin)
+
+    return runner
+
+
+def _serve(ctx, path: Path, idle_timeout: float) -> None:
+    server = DaemonServer(path, _make_runner(ctx), idle_timeout=idle_timeout)
+    signal.signal(signal.SIGTERM, lambda *_: server.stopping.set())
+    click.echo(f"netcupctl daemon listening on {path} (pid {os.getpid()})", err=True)
+    server.serve()
+
+
+def _spawn(ctx, idle_timeout: float) -> None:
+    command = [
+        sys.executable, "-m", "netcupctl", "--parallel", str(ctx.parallel),
+        "daemon", "start", "--foreground", "--idle-timeout", f"{idle_timeout:g}",
+    ]
+    with open(ctx.config.config_dir / LOG_FILENAME, "a", encoding="utf-8") as log:
+        subprocess.Popen(  # pylint: disable=consider-using-with
+            command,
+            stdin=subprocess.DEVNULL,
+            stdout=log,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+            close_fds=True,
+        )
+
+
+def _wait_for_daemon(path: Path) -> Optional[dict]:
+    deadline = time.monotonic() + _START_TIMEOUT
+    while time.monotonic() < deadline:
+        response = send(path, {"op": "ping"})
+        if response:
+            return response
+        time.sleep(0.1)
+    return None
+
+
+@daemon.command("start")
+@click.option("--foreground", is_flag=True, help="Run in the foreground instead of detaching.")
+@click.option(
+    "--idle-timeout",
+    default="1h",
+    show_default=True,
+    callback=lambda _ctx, _param, value: validate_duration(value),
+    help="Stop after this long without commands, e.g. 30m; 0 keeps the daemon running.",
+)
+@click.pass_obj
+def start(ctx, foreground: bool, idle_timeout: float):
+    """Start the daemon.
+
+    Listens on a socket in the configuration directory that only the
+    current user can access. Output of a detached daemon goes to daemon.log
+    in the configuration directory.
+    """
+    _require_support()
+    ctx.config.ensure_config_dir()
+    path = socket_path(ctx.config.config_dir)
+
+    running = send(path, {"op": "ping"})
+    if running:
+        click.echo(f"Daemon is already running (pid {running['pid']}).")
+        return
+    if path.exists():
+        path.unlink()
+
+    if foreground:
+        _serve(ctx, path, idle_timeout)
+        return
+
+    _spawn(ctx, idle_timeout)
+    response = _wait_for_daemon(path)
+    if not response:
+        click.echo(f"Error: Daemon did not start. See {ctx.config.config_dir / LOG_FILENAME}", err=True)
+        sys.exit(1)
+    click.echo(f"[OK] Daemon started (pid {response['pid']}).")
+
+
+@daemon.command("stop")
+@click.pass_obj
+def stop(ctx):
+    """Stop the daemon."""
+    _require_support()
+    response = send(socket_path(ctx.config.config_dir), {"op": "stop"})
+    if not response:
+        click.echo("Daemon is not running.")
+        return
+    click.echo(f"[OK] Daemon stopped (pid {response['pid']}).")
+
+
+@daemon.command("status")
+@click.pass_obj
+def status(ctx):
+    """Show whether the daemon is running.
+
+    Exits with status 1 if no daemon is running.
+    """
+    _require_support()
+    response = send(socket_path(ctx.config.config_dir), {"op": "ping"})
+    if not response:
+        click.echo("Daemon is not running.")
+        sys.exit(1)
+    started = datetime.fromtimestamp(response["started"]).isoformat(timespec="seconds")
+    click.echo(f"Daemon is running (pid {response['pid']}).")
+    click.echo(f"Started: {started}")
+    click.echo(f"Commands served: {response['commands']}")
@@ -6,6 +6,7 @@ import click
 
 from netcupctl.client import APIError
 from netcupctl.commands.helpers import get_authenticated_user_id
+from netcupctl.concurrency import map_requests
 
 
 @click.group(name="failover-ips")
@@ -27,36 +28,34 @@ def list_failover_ips(ctx, ip_version: str):
     """
     try:
         user_id = get_authenticated_user_id(ctx)
-        results = []
-
-        if ip_version is None or ip_version == "v4":
-            results.extend(_fetch_failover_ips(ctx, user_id, "v4"))
-
-        if ip_version is None or ip_version == "v6":
-            results.extend(_fetch_failover_ips(ctx, user_id, "v6"))
-
+        versions = [version for version in ("v4", "v6") if ip_version in (None, version)]
+        results = _fetch_failover_ips(ctx, user_id, versions)
         ctx.formatter.output(results)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
 
 
-def _fetch_failover_ips(ctx, user_id: str, version: str):
-    """Fetch failover IPs for a specific version.
+def _fetch_failover_ips(ctx, user_id: str, versions: list):
+    """Fetch failover IPs for the given versions concurrently.
+
+    Versions whose request fails are skipped.
 
     Args:
         ctx: Click context
         user_id: User ID
-        version: IP version (v4 or v6)
+        versions: IP versions (v4 and/or v6)
 
     Returns:
-        List of failover IPs with version tag
+        List of failover IPs with version tag, in the order of versions
     """
-    try:
-        result = ctx.client.get(f"/api/v1/users/{user_id}/failoverips/{version}")
-        return _normalize_failover_result(result, version)
-    except APIError:
-        return []
+    calls = [("get", f"/api/v1/users/{user_id}/failoverips/{version}") for version in versions]
+    responses = map_requests(ctx.client, calls, max_workers=ctx.parallel, return_exceptions=True)
+    results = []
+    for version, result in zip(versions, responses):
+        if not isinstance(result, APIError):
+            results.extend(_normalize_failover_result(result, version))
+    return results
 
 
 def _normalize_failover_result(result, version: str):
@@ -8,6 +8,7 @@ import click
 from netcupctl.client import APIError
 from netcupctl.commands.helpers import get_authenticated_user_id, upsert_policy
 from netcupctl.commands.validators import validate_mac_address, validate_server_id
+from netcupctl.concurrency import map_requests
 
 _CLEANUP_PAGE_SIZE = 100
 
@@ -25,21 +26,16 @@ def _extract_copied_ids(current: dict) -> list:
 
 
 def _collect_all_policies(ctx, user_id: str) -> dict:
-    """Return all user policies as a dict mapping policy ID to policy name. Paginates automatically."""
-    policies = {}
-    offset = 0
-    while True:
-        page = ctx.client.get(
-            f"/api/v1/users/{user_id}/firewall-policies",
-            params={"limit": _CLEANUP_PAGE_SIZE, "offset": offset},
-        )
-        page_list = page if isinstance(page, list) else []
-        for pol in page_list:
-            policies[pol["id"]] = pol.get("name", "")
-        if len(page_list) < _CLEANUP_PAGE_SIZE:
-            break
-        offset += _CLEANUP_PAGE_SIZE
-    return policies
+    """Return all user policies as a dict mapping policy ID to policy name. Paginates automatically.
+
+    Up to ``ctx.parallel`` pages are requested concurrently.
+    """
+    pages = ctx.client.paginate(
+        f"/api/v1/users/{user_id}/firewall-policies",
+        page_size=_CLEANUP_PAGE_SIZE,
+        prefetch=ctx.parallel,
+    )
+    return {pol["id"]: pol.get("name", "") for pol in pages}
 
 
 def _policy_ids_from_firewall(fw: dict) -> set:
@@ -47,25 +43,26 @@ def _policy_ids_from_firewall(fw: dict) -> set:
     return {p["id"] for p in combined if p.get("id") is not None}
 
 
-def _policy_ids_for_interface(ctx, server_id: str, mac: str) -> set:
-    try:
-        fw = ctx.client.get(f"/api/v1/servers/{server_id}/interfaces/{mac}/firewall")
-        return _policy_ids_from_firewall(fw)
-    except APIError:
-        return set()
+def _macs_by_server(ctx, server_ids: list) -> dict:
+    """Fetch the interfaces of all given servers concurrently; servers that fail are skipped."""
+    calls = [("get", f"/api/v1/servers/{server_id}/interfaces") for server_id in server_ids]
+    results = map_requests(ctx.client, calls, max_workers=ctx.parallel, return_exceptions=True)
+    macs = {}
+    for server_id, interfaces in zip(server_ids, results):
+        if isinstance(interfaces, APIError):
+            continue
+        iface_list = interfaces if isinstance(interfaces, list) else []
+        macs[server_id] = [iface["mac"] for iface in iface_list if iface.get("mac")]
+    return macs
 
 
-def _firewall_policy_ids_for_server(ctx, server_id: str) -> set:
-    try:
-        interfaces = ctx.client.get(f"/api/v1/servers/{server_id}/interfaces")
-    except APIError:
-        return set()
-    iface_list = interfaces if isinstance(interfaces, list) else []
+def _policy_ids_for_interfaces(ctx, server_macs: list) -> set:
+    """Collect policy IDs from the firewalls of (server_id, mac) pairs concurrently."""
+    calls = [("get", f"/api/v1/servers/{server_id}/interfaces/{mac}/firewall") for server_id, mac in server_macs]
     ids = set()
-    for iface in iface_list:
-        mac = iface.get("mac")
-        if mac:
-            ids.update(_policy_ids_for_interface(ctx, server_id, mac))
+    for fw in map_requests(ctx.client, calls, max_workers=ctx.parallel, return_exceptions=True):
+        if not isinstance(fw, APIError):
+            ids.update(_policy_ids_from_firewall(fw))
     return ids
 
 
@@ -75,12 +72,10 @@ def _collect_referenced_ids(ctx) -> set:
     except APIError:
         return set()
     servers = result if isinstance(result, list) else []
-    ids = set()
-    for server in servers:
-        server_id = server.get("id")
-        if server_id:
-            ids.update(_firewall_policy_ids_for_server(ctx, server_id))
-    return ids
+    server_ids = [server.get("id") for server in servers if server.get("id")]
+    macs = _macs_by_server(ctx, server_ids)
+    server_macs = [(server_id, mac) for server_id in server_ids for mac in macs.get(server_id, [])]
+    return _policy_ids_for_interfaces(ctx, server_macs)
 
 
 def _print_orphaned(orphaned: dict, dry_run: bool) -> None:
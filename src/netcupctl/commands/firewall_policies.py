@@ -6,7 +6,7 @@ import sys
 import click
 
 from netcupctl.client import APIError
-from netcupctl.commands.helpers import get_authenticated_user_id, upsert_policy
+from netcupctl.commands.helpers import get_authenticated_user_id, output_list, upsert_policy
 
 
 @click.group(name="firewall-policies")
@@ -30,8 +30,9 @@ def firewall_policies():
 @click.option("--search", "-q", help="Search term to filter policies by name.")
 @click.option("--limit", type=int, default=50, help="Maximum number of results (default: 50).")
 @click.option("--offset", type=int, default=0, help="Offset for pagination (default: 0).")
+@click.option("--all", "fetch_all", is_flag=True, help="Fetch all pages (--limit sets the page size).")
 @click.pass_obj
-def list_policies(ctx, search: str, limit: int, offset: int):
+def list_policies(ctx, search: str, limit: int, offset: int, fetch_all: bool):
     """List all firewall policies.
 
     \b
@@ -40,6 +41,7 @@ def list_policies(ctx, search: str, limit: int, offset: int):
       netcupctl firewall-policies list --search web
       netcupctl --format json firewall-policies list
       netcupctl firewall-policies list --limit 10 --offset 20
+      netcupctl firewall-policies list --all
     """
     try:
         user_id = get_authenticated_user_id(ctx)
@@ -47,8 +49,7 @@ def list_policies(ctx, search: str, limit: int, offset: int):
         if search:
             params["q"] = search
 
-        result = ctx.client.get(f"/api/v1/users/{user_id}/firewall-policies", params=params)
-        ctx.formatter.output(result)
+        output_list(ctx, f"/api/v1/users/{user_id}/firewall-policies", params, fetch_all)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
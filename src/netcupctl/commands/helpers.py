@@ -1,10 +1,13 @@
 """Shared helper functions for CLI commands."""
 
+import os
 import sys
+from typing import Tuple
 
 import click
 
 from netcupctl.client import APIError
+from netcupctl.upload import MultipartUpload, UploadJournal, UploadManifest
 
 
 def get_authenticated_user_id(ctx) -> str:
@@ -72,3 +75,151 @@ def upsert_policy(ctx, user_id: str, name: str, rules_data: dict) -> int:
         json={"name": name, **rules_data},
     )
     return response["id"]
+
+
+def output_list(ctx, path: str, params: dict, fetch_all: bool) -> None:
+    """Output a page of a list endpoint, or stream all pages with --all.
+
+    With fetch_all, ``params["limit"]`` is used as the page size and
+    ``params["offset"]`` as the first item; up to ``ctx.parallel`` pages are
+    requested ahead and each item is written as soon as its page has arrived.
+
+    Args:
+        ctx: CLI context with client and formatter.
+        path: API path of the list endpoint.
+        params: Query parameters including limit and offset.
+        fetch_all: Follow the pagination until the last page.
+
+    Raises:
+        APIError: On API failure.
+        click.BadParameter: If the page size is smaller than 1 with fetch_all.
+    """
+    if not fetch_all:
+        ctx.formatter.output(ctx.client.get(path, params=params))
+        return
+
+    page_size = params.get("limit", 0)
+    if page_size < 1:
+        raise click.BadParameter("must be at least 1 with --all", param_hint="'--limit'")
+    items = ctx.client.paginate(path, params=params, page_size=page_size, prefetch=ctx.parallel)
+    ctx.formatter.output_stream(items)
+
+
+def _verbose_log(message: str) -> None:
+    """Print a verbose upload statistics line to stderr."""
+    click.echo(f"[VERBOSE] {message}", err=True)
+
+
+def _start_upload(ctx, journal: UploadJournal, path: str, file: str, key: str, resume: bool) -> None:
+    """Load the journal of an interrupted upload with resume, or initiate a new upload.
+
+    A new upload replaces a journaled one of the key, which is aborted on the server.
+
+    Raises:
+        APIError: If the upload cannot be initiated.
+    """
+    try:
+        if resume and journal.load(file):
+            click.echo(f"Resuming upload of {key} ({len(journal.parts)} parts already sent)...")
+            return
+    except ValueError as e:
+        click.echo(f"Error: {e}. Run without --resume to start a new upload.", err=True)
+        sys.exit(1)
+
+    previous_id = journal.journaled_upload_id()
+    if previous_id:
+        try:
+            ctx.client.delete(f"{path}/{previous_id}")
+        except APIError:
+            pass
+
+    click.echo(f"Uploading {key} ({os.path.getsize(file) / (1024*1024):.1f} MB)...")
+    upload_id = ctx.client.post(path).get("uploadId")
+    if not upload_id:
+        click.echo("Error: Failed to initiate upload", err=True)
+        sys.exit(1)
+    journal.start(upload_id, file)
+
+
+def _unchanged_digest(ctx, manifest: UploadManifest, path: str, file: str) -> Tuple[str, bool]:
+    """Hash a file and check whether the server already holds it under its key.
+
+    Returns:
+        Tuple of (SHA-256 of the file, whether the upload can be skipped)
+
+    Raises:
+        APIError: If the remote metadata cannot be fetched.
+    """
+    sha256 = manifest.digest(file)
+    try:
+        remote = ctx.client.get(path)
+    except APIError as e:
+        if e.status_code != 404:
+            raise
+        remote = None
+    return sha256, manifest.unchanged(sha256, remote)
+
+
+def upload_file(  # pylint: disable=too-many-arguments,too-many-locals
+    ctx, user_id: str, kind: str, file: str, key: str, parallel_parts: int, label: str,
+    resume: bool = False, skip_unchanged: bool = False,
+) -> None:
+    """Upload a file as custom image or ISO via multipart upload.
+
+    Initiates the upload, sends the parts with up to ``parallel_parts`` in
+    flight and completes it. Part size and parallelism are tuned from the
+    measured throughput; with --verbose the throughput of every part is
+    logged. Every sent part is journaled in the config dir; with ``resume``
+    an interrupted upload of the same file continues with the missing parts.
+    A failed part or completion exits with status 1 and keeps the upload on
+    the server and its journal, so that a run with --resume continues it; a
+    run without --resume aborts it and starts over.
+
+    With ``skip_unchanged`` the file is hashed first, and nothing is uploaded
+    if the upload manifest holds the same SHA-256 for the key and the image
+    or ISO still exists on the server with matching metadata; otherwise the
+    SHA-256 is recorded in the manifest once the upload has completed.
+
+    Args:
+        ctx: CLI context with config, client and formatter.
+        user_id: The authenticated user's ID.
+        kind: Collection of the upload, "images" or "isos".
+        file: Path of the file to upload.
+        key: Name of the uploaded image or ISO.
+        parallel_parts: Maximum number of parts sent at the same time.
+        label: Name of the uploaded object in messages, e.g. "Custom image".
+        resume: Continue an interrupted or failed upload.
+        skip_unchanged: Skip the upload if the key already holds the same content.
+
+    Raises:
+        APIError: If the upload cannot be initiated or the remote metadata cannot be fetched.
+    """
+    path = f"/api/v1/users/{user_id}/{kind}/{key}"
+    manifest = UploadManifest(ctx.config, user_id, kind, key)
+    sha256 = None
+    if skip_unchanged:
+        sha256, unchanged = _unchanged_digest(ctx, manifest, path, file)
+        if unchanged:
+            click.echo(f"{label} {key} is unchanged (SHA-256 {sha256}); upload skipped.")
+            return
+
+    journal = UploadJournal(ctx.config, user_id, kind, key)
+    _start_upload(ctx, journal, path, file, key, resume)
+
+    log = _verbose_log if getattr(ctx, "verbose", False) else None
+    upload = MultipartUpload(ctx.client, f"{path}/{journal.upload_id}", file, parallel=parallel_parts,
+                             journal=journal, log=log)
+    try:
+        with click.progressbar(length=os.path.getsize(file), label="Uploading") as progress:
+            progress.update(upload.sent_bytes)
+            parts = upload.upload_parts(progress.update)
+        ctx.formatter.output(upload.complete(parts))
+        journal.delete()
+        if sha256:
+            manifest.record(file, sha256)
+        click.echo(f"\n[OK] {label} uploaded successfully.", err=False)
+
+    except (APIError, OSError) as e:
+        click.echo(f"\nUpload failed: {e}", err=True)
+        click.echo("Run the command again with --resume to continue the upload.", err=True)
+        sys.exit(1)
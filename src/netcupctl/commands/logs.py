@@ -5,6 +5,7 @@ import sys
 import click
 
 from netcupctl.client import APIError
+from netcupctl.commands.helpers import output_list
 from netcupctl.commands.validators import validate_server_id
 
 
@@ -22,8 +23,9 @@ from netcupctl.commands.validators import validate_server_id
     default=0,
     help="Number of entries to skip (default: 0)",
 )
+@click.option("--all", "fetch_all", is_flag=True, help="Fetch all pages (--limit sets the page size)")
 @click.pass_obj
-def logs(ctx, server_id: str, limit: int, offset: int):
+def logs(ctx, server_id: str, limit: int, offset: int, fetch_all: bool):
     """View server logs.
 
     Displays log entries for a server with pagination support.
@@ -35,8 +37,7 @@ def logs(ctx, server_id: str, limit: int, offset: int):
     try:
         server_id = validate_server_id(server_id)
         params = {"limit": limit, "offset": offset}
-        result = ctx.client.get(f"/api/v1/servers/{server_id}/logs", params=params)
-        ctx.formatter.output(result)
+        output_list(ctx, f"/api/v1/servers/{server_id}/logs", params, fetch_all)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
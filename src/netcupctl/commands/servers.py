@@ -5,6 +5,7 @@ import sys
 import click
 
 from netcupctl.client import APIError
+from netcupctl.commands.helpers import output_list
 from netcupctl.commands.validators import validate_server_id
 
 
@@ -27,16 +28,16 @@ def servers():
     default=100,
     help="Maximum number of servers to return (default: 100)",
 )
+@click.option("--all", "fetch_all", is_flag=True, help="Fetch all pages (--limit sets the page size)")
 @click.pass_obj
-def list(ctx, limit: int):
+def list(ctx, limit: int, fetch_all: bool):
     """List all servers.
 
     Displays a list of all servers associated with your account.
     """
     try:
         params = {"limit": limit}
-        result = ctx.client.get("/api/v1/servers", params=params)
-        ctx.formatter.output(result)
+        output_list(ctx, "/api/v1/servers", params, fetch_all)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
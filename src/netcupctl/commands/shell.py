@@ -0,0 +1,199 @@
+"""Interactive shell command."""
+
+import copy
+import shlex
+import threading
+from typing import List, Sequence
+
+import click
+
+from netcupctl.auth import AuthError
+from netcupctl.client import APIError
+from netcupctl.completion import complete
+from netcupctl.inventory import Inventory
+from netcupctl.invocation import command_name, global_args, invoke
+
+try:
+    import readline
+except ImportError:  # Windows without a readline module
+    readline = None
+
+HISTORY_FILENAME = "shell_history"
+HISTORY_LENGTH = 1000
+
+_PROMPT = "netcupctl> "
+_EXIT_WORDS = ("exit", "quit")
+_NOT_IN_SHELL = ("daemon", "shell")
+
+
+class _Shell:
+    """Read-eval-print loop around one shared CLI context."""
+
+    def __init__(self, ctx, root: click.Command, default_args: Sequence[str] = ()):
+        """Initialize shell.
+
+        Args:
+            ctx: CLI context of the shell invocation (with client)
+            root: Root command (the cli group)
+            default_args: Global options of the shell invocation put in front of every command
+        """
+        self.root = root
+        self.default_args = list(default_args)
+        self.client = ctx.client
+        self.config = ctx.config
+        self.base = copy.copy(ctx)
+        self.base.client = None
+        self.base.session = ctx.client.session
+        self.inventory = Inventory.load(ctx.config)
+        self._matches: List[str] = []
+
+    def refresh(self) -> Inventory:
+        """Fetch the inventory from the API and save it.
+
+        Raises:
+            APIError: If the API request fails
+            AuthError: If the tokens cannot be refreshed
+        """
+        info = self.base.auth.get_token_info()
+        inventory = Inventory.fetch(self.client, info.get("user_id") if info else None, self.base.parallel)
+        inventory.save(self.config)
+        self.inventory = inventory
+        return inventory
+
+    def refresh_in_background(self) -> threading.Thread:
+        """Refresh the inventory in a background thread; failures keep the old inventory."""
+
+        def _refresh():
+            try:
+                self.refresh()
+            except (APIError, AuthError, OSError):
+                pass
+
+        thread = threading.Thread(target=_refresh, name="netcupctl-inventory", daemon=True)
+        thread.start()
+        return thread
+
+    def complete(self, _text: str, state: int):
+        """Readline completer; completes the word under the cursor."""
+        if state == 0:
+            line = readline.get_line_buffer()[: readline.get_endidx()]
+            self._matches = [candidate + " " for candidate in complete(self.root, self.inventory, line)]
+        return self._matches[state] if state < len(self._matches) else None
+
+    def setup_readline(self) -> None:
+        """Enable tab completion and load the command history."""
+        if readline is None:
+            return
+        readline.set_completer(self.complete)
+        readline.set_completer_delims(" \t\n")
+        if "libedit" in (readline.__doc__ or ""):
+            readline.parse_and_bind("bind ^I rl_complete")
+        else:
+            readline.parse_and_bind("tab: complete")
+        readline.set_history_length(HISTORY_LENGTH)
+        try:
+            readline.read_history_file(str(self.config.config_dir / HISTORY_FILENAME))
+        except OSError:
+            pass
+
+    def save_history(self) -> None:
+        """Write the command history to the configuration directory."""
+        if readline is None:
+            return
+        try:
+            self.config.ensure_config_dir()
+            readline.write_history_file(str(self.config.config_dir / HISTORY_FILENAME))
+        except OSError:
+            pass
+
+    def _refresh_command(self) -> None:
+        try:
+            inventory = self.refresh()
+        except (APIError, AuthError) as e:
+            click.echo(f"Error: {e}", err=True)
+            return
+        click.echo(f"[OK] Inventory refreshed: {len(inventory.servers)} servers, "
+                   f"{len(inventory.policies)} firewall policies.")
+
+    def execute(self, line: str) -> bool:
+        """Run one input line.
+
+        Args:
+            line: Line typed at the prompt
+
+        Returns:
+            False if the shell should exit, True otherwise
+        """
+        try:
+            argv = shlex.split(line)
+        except ValueError as e:
+            click.echo(f"Error: {e}", err=True)
+            return True
+        if argv[:1] == ["netcupctl"]:
+            argv = argv[1:]
+
+        if not argv:
+            return True
+        if argv[0] in _EXIT_WORDS:
+            return False
+        if argv == ["refresh"]:
+            self._refresh_command()
+            return True
+        if argv[0] == "help":
+            argv = argv[1:] + ["--help"]
+
+        name = command_name(self.root, argv)
+        if name in _NOT_IN_SHELL:
+            click.echo(f"Error: '{name}' cannot run inside the shell.", err=True)
+            return True
+        invoke(self.root, self.base, self.default_args + argv)
+        return True
+
+    def loop(self) -> None:
+        """Prompt for commands until exit, quit or end of input."""
+        while True:
+            try:
+                line = input(_PROMPT)
+            except EOFError:
+                click.echo()
+                return
+            except KeyboardInterrupt:
+                click.echo()
+                continue
+            if not self.execute(line):
+                return
+
+
+@click.command()
+@click.option("--refresh", is_flag=True, help="Refresh the completion inventory before the first prompt.")
+@click.pass_obj
+def shell(ctx, refresh: bool):
+    """Interactive shell that keeps the session between commands.
+
+    Commands are entered without the leading 'netcupctl' and run in this
+    process, reusing the login, the HTTP connections and the loaded modules.
+    Global options given before 'shell' apply to every command.
+    Tab completes commands, options, server IDs, MAC addresses, snapshot
+    names and firewall policies from an inventory cached in the
+    configuration directory, so completion never waits for the API. The
+    inventory is refreshed in the background when it is older than an hour.
+
+    \b
+    Shell commands:
+      refresh       Refresh the completion inventory now
+      help [CMD]    Show help for a command
+      exit, quit    Leave the shell (or press Ctrl-D)
+    """
+    root_ctx = click.get_current_context().find_root()
+    repl = _Shell(ctx, root_ctx.command, global_args(root_ctx))
+    if refresh:
+        repl.execute("refresh")
+    elif repl.inventory.is_stale():
+        repl.refresh_in_background()
+
+    repl.setup_readline()
+    click.echo("netcupctl shell. Type 'help' for commands, 'exit' to leave.")
+    try:
+        repl.loop()
+    finally:
+        repl.save_history()
@@ -1,12 +1,10 @@
 """OpenAPI specification management commands."""
 
 import sys
-from pathlib import Path
 
 import click
 
-import netcupctl
-from netcupctl.spec_manager import SpecError, SpecManager
+from netcupctl.spec_manager import SpecError, SpecManager, default_data_dir
 
 
 @click.group()
@@ -30,11 +28,7 @@ def update():
     The spec file is stored in the data/ directory of the project.
     """
     try:
-        package_dir = Path(netcupctl.__file__).parent
-        project_root = package_dir.parent.parent
-        data_dir = project_root / "data"
-
-        manager = SpecManager(data_dir)
+        manager = SpecManager(default_data_dir())
         result = manager.update_spec()
 
         if result["status"] == "first_download":
@@ -64,11 +58,7 @@ def show():
     Displays the version of the locally stored OpenAPI specification.
     """
     try:
-        package_dir = Path(netcupctl.__file__).parent
-        project_root = package_dir.parent.parent
-        data_dir = project_root / "data"
-
-        manager = SpecManager(data_dir)
+        manager = SpecManager(default_data_dir())
         version = manager.get_local_version()
 
         if version:
@@ -0,0 +1,66 @@
+"""Request latency statistics commands."""
+
+import click
+
+from netcupctl.latency import load_stats, read_slow_log, reset
+
+
+@click.group(invoke_without_command=True)
+@click.pass_context
+def stats(click_ctx):
+    """Request latency statistics.
+
+    Shows the latencies of API requests per endpoint, collected over all
+    runs with --latency-stats (or NETCUPCTL_LATENCY_STATS=1). Without a
+    subcommand, the per-endpoint summary is shown.
+
+    \b
+    Examples:
+      netcupctl --latency-stats servers list
+      netcupctl stats
+      netcupctl stats slow --limit 50
+    """
+    if click_ctx.invoked_subcommand is None:
+        click_ctx.invoke(show)
+
+
+@stats.command()
+@click.pass_obj
+def show(ctx):
+    """Show request count and latency percentiles per endpoint.
+
+    Latencies are in milliseconds per HTTP attempt, slowest p99 first.
+    Endpoints are identified by method and OpenAPI path template.
+    """
+    rows = load_stats(ctx.config.config_dir).rows()
+    if not rows:
+        click.echo("No latency statistics recorded. Run commands with --latency-stats to collect them.")
+        return
+    ctx.formatter.output(rows)
+
+
+@stats.command()
+@click.option("--limit", type=click.IntRange(min=1), default=20, help="Number of requests to show (default: 20)")
+@click.pass_obj
+def slow(ctx, limit: int):
+    """Show the most recent slow requests.
+
+    Requests taking at least --slow-threshold seconds (default: 1) while
+    --latency-stats was enabled are logged, oldest first.
+    """
+    entries = read_slow_log(ctx.config.config_dir, limit)
+    if not entries:
+        click.echo("No slow requests logged.")
+        return
+    ctx.formatter.output(entries)
+
+
+@stats.command("reset")
+@click.option("--yes", "-y", is_flag=True, help="Skip confirmation prompt")
+@click.pass_obj
+def reset_stats(ctx, yes: bool):
+    """Delete the latency statistics and the slow-request log."""
+    if not yes and not click.confirm("Delete all latency statistics and the slow-request log?"):
+        raise click.Abort()
+    reset(ctx.config.config_dir)
+    click.echo("[OK] Latency statistics deleted.")
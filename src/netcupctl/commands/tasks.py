@@ -5,6 +5,7 @@ import sys
 import click
 
 from netcupctl.client import APIError
+from netcupctl.commands.helpers import output_list
 from netcupctl.commands.validators import validate_uuid
 
 
@@ -23,8 +24,9 @@ def tasks():
 @click.option("--search", "-q", help="Search query")
 @click.option("--limit", type=int, default=50, help="Maximum number of tasks (default: 50)")
 @click.option("--offset", type=int, default=0, help="Number of tasks to skip (default: 0)")
+@click.option("--all", "fetch_all", is_flag=True, help="Fetch all pages (--limit sets the page size)")
 @click.pass_obj
-def list_tasks(ctx, state: str, server: str, search: str, limit: int, offset: int):
+def list_tasks(ctx, state: str, server: str, search: str, limit: int, offset: int, fetch_all: bool):
     """List background tasks.
 
     Displays tasks with optional filtering by state, server, or search query.
@@ -38,8 +40,7 @@ def list_tasks(ctx, state: str, server: str, search: str, limit: int, offset: in
         if search:
             params["q"] = search
 
-        result = ctx.client.get("/api/v1/tasks", params=params)
-        ctx.formatter.output(result)
+        output_list(ctx, "/api/v1/tasks", params, fetch_all)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
@@ -5,14 +5,15 @@ import sys
 import click
 
 from netcupctl.client import APIError
-from netcupctl.commands.helpers import get_authenticated_user_id
+from netcupctl.commands.helpers import get_authenticated_user_id, output_list
 
 
 @click.command(name="user-logs")
 @click.option("--limit", type=int, default=50, help="Maximum number of entries (default: 50)")
 @click.option("--offset", type=int, default=0, help="Number of entries to skip (default: 0)")
+@click.option("--all", "fetch_all", is_flag=True, help="Fetch all pages (--limit sets the page size)")
 @click.pass_obj
-def user_logs(ctx, limit: int, offset: int):
+def user_logs(ctx, limit: int, offset: int, fetch_all: bool):
     """View user activity logs.
 
     Shows activity logs for the authenticated user account.
@@ -20,8 +21,7 @@ def user_logs(ctx, limit: int, offset: int):
     try:
         user_id = get_authenticated_user_id(ctx)
         params = {"limit": limit, "offset": offset}
-        result = ctx.client.get(f"/api/v1/users/{user_id}/logs", params=params)
-        ctx.formatter.output(result)
+        output_list(ctx, f"/api/v1/users/{user_id}/logs", params, fetch_all)
     except APIError as e:
         click.echo(f"Error: {e}", err=True)
         sys.exit(e.status_code or 1)
@@ -7,6 +7,8 @@ from typing import Tuple
 
 import click
 
+from netcupctl.connection import check_api_url
+
 
 def validate_server_id(server_id: str) -> str:
     """Validate server ID to prevent injection attacks.
@@ -162,3 +164,42 @@ def validate_uuid(value: str) -> str:
         return value
     except ValueError as exc:
         raise click.BadParameter("Invalid UUID format") from exc
+
+
+DURATION_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 86400}
+
+
+def validate_duration(value: str) -> float:
+    """Validate a duration such as 30s, 5m, 1h, 1d or plain seconds.
+
+    Args:
+        value: Duration string to validate
+
+    Returns:
+        Duration in seconds
+
+    Raises:
+        click.BadParameter: If duration format is invalid
+    """
+    match = re.fullmatch(r"\s*(\d+(?:\.\d+)?)\s*([smhd]?)\s*", value.lower())
+    if not match:
+        raise click.BadParameter("Invalid duration (expected e.g. 30s, 5m, 1h or seconds)")
+    return float(match.group(1)) * DURATION_UNITS.get(match.group(2) or "s")
+
+
+def validate_api_url(value: str) -> str:
+    """Validate the base URL of the SCP REST API, e.g. http://127.0.0.1:8080/scp-core.
+
+    Args:
+        value: URL to validate
+
+    Returns:
+        URL without trailing slash
+
+    Raises:
+        click.BadParameter: If the URL is not an absolute http(s) URL
+    """
+    try:
+        return check_api_url(value)
+    except ValueError as e:
+        raise click.BadParameter(f"API URL {e}") from e
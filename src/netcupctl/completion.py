@@ -0,0 +1,142 @@
+"""Command line completion for the interactive shell."""
+
+from typing import Callable, Dict, List, Optional, Tuple
+
+import click
+
+from netcupctl.inventory import Inventory
+
+
+# Inventory lookups by argument name; called with (inventory, SERVER_ID argument).
+_ARGUMENT_SOURCES: Dict[str, Callable[[Inventory, Optional[str]], List[str]]] = {
+    "server_id": lambda inventory, _server_id: inventory.server_ids(),
+    "mac": lambda inventory, server_id: inventory.macs(server_id),
+    "name": lambda inventory, server_id: inventory.snapshots(server_id),
+    "policy_id": lambda inventory, _server_id: inventory.policy_ids(),
+}
+
+
+class _Position:
+    """Where the word being completed sits in the command tree."""
+
+    def __init__(self, command: click.Command):
+        self.command = command
+        self.path: List[str] = []
+        self.args: List[str] = []
+        self.option: Optional[click.Option] = None
+
+
+def _find_option(command: click.Command, word: str) -> Optional[click.Option]:
+    """Return the option of command named by word (``--name`` or ``--name=value``)."""
+    name = word.split("=", 1)[0]
+    for param in command.params:
+        if isinstance(param, click.Option) and name in param.opts + param.secondary_opts:
+            return param
+    return None
+
+
+def _takes_value(option: Optional[click.Option], word: str) -> bool:
+    """Return True if the option consumes the next word as its value."""
+    return option is not None and not option.is_flag and not option.count and "=" not in word
+
+
+def _resolve(root: click.Command, words: List[str]) -> _Position:
+    """Walk the command tree along the completed words."""
+    position = _Position(root)
+    for word in words:
+        if position.option is not None:
+            position.option = None
+        elif word.startswith("-"):
+            option = _find_option(position.command, word)
+            position.option = option if _takes_value(option, word) else None
+        elif isinstance(position.command, click.Group) and not position.args:
+            sub = position.command.get_command(click.Context(position.command), word)
+            if sub is None:
+                position.args.append(word)
+            else:
+                position.command = sub
+                position.path.append(word)
+        else:
+            position.args.append(word)
+    return position
+
+
+def _argument_values(position: _Position, inventory: Inventory) -> List[str]:
+    """Return candidate values for the next positional argument."""
+    arguments = [param for param in position.command.params if isinstance(param, click.Argument)]
+    if len(position.args) >= len(arguments):
+        return []
+    given: Dict[str, str] = {param.name: value for param, value in zip(arguments, position.args)}
+    param = arguments[len(position.args)]
+
+    if isinstance(param.type, click.Choice):
+        return list(param.type.choices)
+    # NAME arguments are snapshot names only in the snapshots group
+    if param.name == "name" and position.path[:1] != ["snapshots"]:
+        return []
+    source = _ARGUMENT_SOURCES.get(param.name)
+    return source(inventory, given.get("server_id")) if source else []
+
+
+def _option_values(position: _Position, inventory: Inventory) -> List[str]:
+    """Return candidate values for the option waiting for its value."""
+    option = position.option
+    if isinstance(option.type, click.Choice):
+        return list(option.type.choices)
+    if option.name == "name" and position.path[:1] in (["firewall"], ["firewall-policies"]):
+        return inventory.policy_names()
+    return []
+
+
+def _option_names(command: click.Command) -> List[str]:
+    """Return all option names of command."""
+    names = ["--help"]
+    for param in command.params:
+        if isinstance(param, click.Option):
+            names.extend(param.opts + param.secondary_opts)
+    return names
+
+
+def split_line(line: str) -> Tuple[List[str], str]:
+    """Split a partial command line into completed words and the word being typed.
+
+    Args:
+        line: Command line up to the cursor
+
+    Returns:
+        Tuple of (completed words, prefix of the current word)
+    """
+    words = line.split()
+    prefix = words.pop() if words and not line[-1].isspace() else ""
+    if words[:1] == ["netcupctl"]:
+        words = words[1:]
+    return words, prefix
+
+
+def complete(root: click.Command, inventory: Inventory, line: str) -> List[str]:
+    """Return the completions of the word under the cursor.
+
+    Subcommands and options come from the command tree; server IDs, MAC
+    addresses, snapshot names and firewall policies come from the inventory.
+
+    Args:
+        root: Root command (the cli group)
+        inventory: Locally cached inventory
+        line: Command line up to the cursor
+
+    Returns:
+        Sorted candidates starting with the current word
+    """
+    words, prefix = split_line(line)
+    position = _resolve(root, words)
+
+    if position.option is not None:
+        candidates = _option_values(position, inventory)
+    elif prefix.startswith("-"):
+        candidates = _option_names(position.command)
+    elif isinstance(position.command, click.Group) and not position.args:
+        candidates = position.command.list_commands(click.Context(position.command))
+    else:
+        candidates = _argument_values(position, inventory)
+
+    return sorted({candidate for candidate in candidates if candidate.startswith(prefix)})
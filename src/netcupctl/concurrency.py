@@ -0,0 +1,80 @@
+"""Thread-pool fan-out for independent API requests."""
+
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Iterable, List, Sequence, Tuple, Union
+
+from netcupctl import tracing
+from netcupctl.client import APIError
+
+DEFAULT_MAX_WORKERS = 8
+
+Call = Union[Tuple[str, str], Tuple[str, str, Dict[str, Any]]]
+
+
+def _invoke(client, call: Sequence[Any]) -> Any:
+    """Execute a single call tuple against the client.
+
+    Args:
+        client: API client
+        call: (method, path) or (method, path, kwargs)
+
+    Returns:
+        Response data
+    """
+    method, path = call[0], call[1]
+    kwargs = call[2] if len(call) > 2 else {}
+    return getattr(client, method.lower())(path, **kwargs)
+
+
+def _invoke_safe(client, call: Sequence[Any]) -> Any:
+    """Execute a call tuple and return an APIError instead of raising it.
+
+    Args:
+        client: API client
+        call: (method, path) or (method, path, kwargs)
+
+    Returns:
+        Response data or the raised APIError
+    """
+    try:
+        return _invoke(client, call)
+    except APIError as exc:
+        return exc
+
+
+def map_requests(
+    client,
+    calls: Iterable[Call],
+    max_workers: int = DEFAULT_MAX_WORKERS,
+    return_exceptions: bool = False,
+) -> List[Any]:
+    """Run independent API calls concurrently and return results in call order.
+
+    All calls share the client's requests.Session, so connections are reused
+    across worker threads. With a single worker (or a single call) the calls
+    run sequentially in the current thread. Trace spans of the calls nest
+    under the caller's span.
+
+    Args:
+        client: NetcupClient used for every call
+        calls: Iterable of (method, path) or (method, path, kwargs) tuples,
+            e.g. ("get", "/api/v1/servers/1/interfaces", {"params": {...}})
+        max_workers: Maximum number of requests in flight
+        return_exceptions: Return APIError instances in place of results instead of raising
+
+    Returns:
+        List of response data (or APIError instances) in the order of the calls
+
+    Raises:
+        APIError: If a call fails and return_exceptions is False
+    """
+    calls = list(calls)
+    func = _invoke_safe if return_exceptions else _invoke
+    workers = min(max(1, max_workers), len(calls))
+
+    if workers <= 1:
+        return [func(client, call) for call in calls]
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="netcupctl") as executor:
+        futures = [executor.submit(tracing.bind(func), client, call) for call in calls]
+        return [future.result() for future in futures]
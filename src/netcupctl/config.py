@@ -16,6 +16,26 @@ class ConfigManager:
         self.tokens_file = self.config_dir / "tokens.json"
         self.config_file = self.config_dir / "config.json"
 
+    @property
+    def cache_dir(self) -> Path:
+        """Directory holding cached API responses."""
+        return self.config_dir / "cache"
+
+    @property
+    def inventory_file(self) -> Path:
+        """File holding the resource inventory used for shell completion."""
+        return self.config_dir / "inventory.json"
+
+    @property
+    def uploads_dir(self) -> Path:
+        """Directory holding the journals of unfinished multipart uploads."""
+        return self.config_dir / "uploads"
+
+    @property
+    def upload_manifest_file(self) -> Path:
+        """File holding the SHA-256 of every uploaded custom image and ISO."""
+        return self.config_dir / "upload-manifest.json"
+
     def _get_config_dir(self) -> Path:
         """Determine configuration directory based on platform.
 
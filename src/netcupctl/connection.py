@@ -0,0 +1,145 @@
+"""HTTP connection settings: API base URL, timeouts, pool sizing and keep-alive."""
+
+import re
+from typing import Any, Dict, Optional, Tuple
+
+from requests.adapters import DEFAULT_POOLSIZE
+
+DEFAULT_CONNECT_TIMEOUT = 10.0
+DEFAULT_READ_TIMEOUT = 30.0
+DEFAULT_UPLOAD_TIMEOUT = 300.0
+
+
+def _positive_number(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (int, float)) or value <= 0:
+        raise ValueError("must be a positive number")
+    return float(value)
+
+
+def _positive_integer(value: Any) -> int:
+    if isinstance(value, bool) or not isinstance(value, int) or value < 1:
+        raise ValueError("must be a positive integer")
+    return value
+
+
+def _boolean(value: Any) -> bool:
+    if not isinstance(value, bool):
+        raise ValueError("must be true or false")
+    return value
+
+
+def check_api_url(value: Any) -> str:
+    """Check the base URL of the SCP REST API, e.g. http://127.0.0.1:8080/scp-core.
+
+    Args:
+        value: URL to check
+
+    Returns:
+        URL without trailing slash
+
+    Raises:
+        ValueError: If the value is not an absolute http(s) URL without query
+    """
+    if not isinstance(value, str) or not re.fullmatch(r"https?://[^\s/?#]+(/[^\s?#]*)?", value):
+        raise ValueError("must be an absolute http:// or https:// URL without query")
+    return value.rstrip("/")
+
+
+class ConnectionSettings:
+    """Settings of the HTTP connections to the SCP API.
+
+    Every setting can come from config.json (keys as in CONFIG_KEYS), an
+    environment variable or a global option; from_config() applies the
+    options and environment variables (resolved by click) over the file.
+    """
+
+    CONFIG_KEYS = {
+        "api_url": check_api_url,
+        "connect_timeout": _positive_number,
+        "read_timeout": _positive_number,
+        "upload_timeout": _positive_number,
+        "pool_connections": _positive_integer,
+        "pool_maxsize": _positive_integer,
+        "keep_alive": _boolean,
+    }
+
+    def __init__(
+        self,
+        api_url: Optional[str] = None,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        upload_timeout: float = DEFAULT_UPLOAD_TIMEOUT,
+        pool_connections: int = DEFAULT_POOLSIZE,
+        pool_maxsize: Optional[int] = None,
+        keep_alive: bool = True,
+    ):
+        """Initialize settings.
+
+        Args:
+            api_url: API base URL (default: NetcupClient.BASE_URL)
+            connect_timeout: Seconds to wait for a TCP connection (and TLS handshake)
+            read_timeout: Seconds to wait for response data of API requests
+            upload_timeout: Seconds to wait for the response to an uploaded part
+            pool_connections: Number of hosts whose connections are kept
+            pool_maxsize: Connections kept per host (default: enough for every concurrent request)
+            keep_alive: Reuse connections between requests
+        """
+        self.api_url = api_url
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.upload_timeout = upload_timeout
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any], **overrides: Any) -> "ConnectionSettings":
+        """Create settings from config.json values and overrides.
+
+        Args:
+            config: Contents of config.json; unknown keys are ignored
+            **overrides: Setting values taking precedence over the file; None is ignored
+
+        Returns:
+            Connection settings
+
+        Raises:
+            ValueError: If a config.json value is invalid
+        """
+        values = {}
+        for key, check in cls.CONFIG_KEYS.items():
+            if config.get(key) is not None:
+                try:
+                    values[key] = check(config[key])
+                except ValueError as e:
+                    raise ValueError(f"{key} {e}") from e
+        values.update({key: value for key, value in overrides.items() if value is not None})
+        return cls(**values)
+
+    @property
+    def timeout(self) -> Tuple[float, float]:
+        """(connect, read) timeout of API requests."""
+        return self.connect_timeout, self.read_timeout
+
+    @property
+    def upload_timeouts(self) -> Tuple[float, float]:
+        """(connect, read) timeout of binary uploads."""
+        return self.connect_timeout, self.upload_timeout
+
+    def pool_size(self, concurrency: int) -> Tuple[int, bool]:
+        """Return the connections kept per host and whether requests wait for a free one.
+
+        Without a configured pool_maxsize the pool holds a connection for every
+        concurrent request. A smaller configured pool blocks requests until a
+        connection is returned instead of opening connections that are closed
+        right after their request.
+
+        Args:
+            concurrency: Number of threads sending requests at the same time
+
+        Returns:
+            Tuple of (pool_maxsize, pool_block)
+        """
+        if self.pool_maxsize is None:
+            return max(concurrency, DEFAULT_POOLSIZE), False
+        return self.pool_maxsize, self.pool_maxsize < concurrency
@@ -0,0 +1,344 @@
+"""Background daemon that runs netcupctl commands in a warm process.
+
+The daemon listens on a Unix socket in the configuration directory. Each
+connection carries one JSON request line and receives one JSON response
+line. While a command runs, the daemon may ask the forwarding process for
+standard input in between, one read at a time. Client-side forwarding only needs the standard library, so a
+forwarded invocation does not pay for importing the command modules.
+"""
+
+import io
+import json
+import os
+import socket
+import socketserver
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, TextIO, Tuple
+
+SOCKET_FILENAME = "daemon.sock"
+LOG_FILENAME = "daemon.log"
+CONNECT_TIMEOUT = 2.0
+
+# Commands that need the user's terminal or manage processes always run locally.
+LOCAL_COMMANDS = frozenset({"auth", "batch", "daemon", "shell"})
+ENV_PREFIX = "NETCUPCTL_"
+# Settings of the daemon's shared HTTP session; commands with other values run locally.
+SESSION_ENV = ("NETCUPCTL_POOL_CONNECTIONS", "NETCUPCTL_POOL_MAXSIZE", "NETCUPCTL_KEEP_ALIVE")
+
+Runner = Callable[[List[str], TextIO], Tuple[int, str, str]]
+
+
+def is_supported() -> bool:
+    """Return True if the platform supports Unix domain sockets."""
+    return hasattr(socket, "AF_UNIX")
+
+
+def socket_path(config_dir: Path) -> Path:
+    """Return the path of the daemon socket.
+
+    Args:
+        config_dir: netcupctl configuration directory
+
+    Returns:
+        Socket path
+    """
+    return config_dir / SOCKET_FILENAME
+
+
+def netcupctl_env() -> Dict[str, str]:
+    """Return the NETCUPCTL_* variables of the process environment."""
+    return {key: value for key, value in os.environ.items() if key.startswith(ENV_PREFIX)}
+
+
+def _replace_env(env: Dict[str, str]) -> None:
+    """Replace the NETCUPCTL_* variables of the process environment with env."""
+    for key in netcupctl_env():
+        if key not in env:
+            del os.environ[key]
+    os.environ.update(env)
+
+
+def should_forward(argv: Sequence[str]) -> bool:
+    """Decide whether a command line is sent to the daemon.
+
+    Commands are forwarded unless forwarding is disabled with
+    NETCUPCTL_NO_DAEMON, the command needs the terminal (both stdin and
+    stdout are a TTY, so prompts and colors work as usual), or it is one of
+    LOCAL_COMMANDS. Without loading the CLI, option values cannot be told
+    apart from the subcommand, so a command line containing any word of
+    LOCAL_COMMANDS runs locally.
+
+    Args:
+        argv: Arguments without the program name
+
+    Returns:
+        True if the command should be forwarded
+    """
+    if os.environ.get("NETCUPCTL_NO_DAEMON") or not is_supported():
+        return False
+    if sys.stdin.isatty() and sys.stdout.isatty():
+        return False
+    words = [arg for arg in argv if not arg.startswith("-")]
+    return bool(words) and not LOCAL_COMMANDS.intersection(words)
+
+
+def _connect(path: Path) -> Optional[socket.socket]:
+    """Connect to the daemon socket.
+
+    Returns:
+        Connected socket, or None if no daemon is listening
+    """
+    if not is_supported() or not path.exists():
+        return None
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    sock.settimeout(CONNECT_TIMEOUT)
+    try:
+        sock.connect(str(path))
+    except OSError:
+        sock.close()
+        return None
+    return sock
+
+
+def _encode(message: Dict[str, Any]) -> bytes:
+    """Encode a message as one JSON line."""
+    return json.dumps(message).encode("utf-8") + b"\n"
+
+
+def _read_stdin(size: int, line: bool) -> str:
+    """Read from the standard input of this process for the daemon."""
+    if sys.stdin is None:
+        return ""
+    return sys.stdin.readline(size) if line else sys.stdin.read(size)
+
+
+def _exchange(sock: socket.socket, message: Dict[str, Any], timeout: Optional[float]) -> Optional[Dict[str, Any]]:
+    """Send a request over a connected socket and read the response.
+
+    Reads of standard input requested by the daemon in the meantime are
+    answered from the standard input of this process.
+
+    Returns:
+        Response message, or None if the connection broke
+    """
+    try:
+        sock.settimeout(timeout)
+        sock.sendall(_encode(message))
+        with sock.makefile("rb") as rfile:
+            response = json.loads(rfile.readline())
+            while "read" in response:
+                sock.sendall(_encode({"stdin": _read_stdin(int(response["read"]), bool(response.get("line")))}))
+                response = json.loads(rfile.readline())
+            return response
+    except (OSError, ValueError):
+        return None
+
+
+def send(path: Path, message: Dict[str, Any], timeout: Optional[float] = CONNECT_TIMEOUT) -> Optional[Dict[str, Any]]:
+    """Send a request to the daemon.
+
+    Args:
+        path: Socket path
+        message: Request message
+        timeout: Seconds to wait for the response (None waits indefinitely)
+
+    Returns:
+        Response message, or None if no daemon answered
+    """
+    sock = _connect(path)
+    if sock is None:
+        return None
+    with sock:
+        return _exchange(sock, message, timeout)
+
+
+def forward(path: Path, argv: Sequence[str]) -> Optional[int]:
+    """Run a command line in the daemon and replay its output.
+
+    Args:
+        path: Socket path
+        argv: Arguments without the program name
+
+    Returns:
+        Exit code of the command, or None if no daemon is listening or the
+        daemon cannot run it (the caller then runs the command itself)
+    """
+    sock = _connect(path)
+    if sock is None:
+        return None
+
+    message = {"op": "run", "argv": list(argv), "cwd": os.getcwd(), "env": netcupctl_env()}
+    with sock:
+        response = _exchange(sock, message, timeout=None)
+
+    if response is not None and response.get("run_locally"):
+        return None
+
+    # The command may already have run, so it must not be repeated locally.
+    if response is None or "exit_code" not in response:
+        print("Error: Lost connection to the netcupctl daemon.", file=sys.stderr)
+        return 1
+    sys.stdout.write(response.get("stdout", ""))
+    sys.stdout.flush()
+    sys.stderr.write(response.get("stderr", ""))
+    return int(response["exit_code"])
+
+
+class _RemoteStdin(io.TextIOBase):
+    """Standard input of a forwarded command, read from the forwarding process.
+
+    Every read asks the forwarding process for the data over the connection,
+    so a command consumes only as much of the caller's input as it reads and
+    the rest stays available to the caller (e.g. a shell loop reading lines).
+    """
+
+    def __init__(self, rfile, wfile):
+        """Initialize remote stdin.
+
+        Args:
+            rfile: Readable side of the connection
+            wfile: Writable side of the connection
+        """
+        super().__init__()
+        self._rfile = rfile
+        self._wfile = wfile
+
+    def readable(self) -> bool:
+        """Report that the stream can be read."""
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        """Read up to size characters (all remaining input if negative)."""
+        return self._request(-1 if size is None else size, line=False)
+
+    def readline(self, size: Optional[int] = -1) -> str:
+        """Read one line of at most size characters (unlimited if negative)."""
+        return self._request(-1 if size is None else size, line=True)
+
+    def _request(self, size: int, line: bool) -> str:
+        """Ask the forwarding process for input and return it."""
+        if size == 0:
+            return ""
+        self._wfile.write(_encode({"read": size, "line": line}))
+        try:
+            return str(json.loads(self._rfile.readline()).get("stdin", ""))
+        except ValueError as e:
+            raise OSError("Lost connection to the forwarding process") from e
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Handles one JSON request per connection."""
+
+    def handle(self) -> None:
+        """Read a request, dispatch it and write the response."""
+        try:
+            request = json.loads(self.rfile.readline())
+        except ValueError:
+            return
+        response = self.server.dispatch(request, _RemoteStdin(self.rfile, self.wfile))
+        try:
+            self.wfile.write(_encode(response))
+        except OSError:
+            pass
+
+
+class DaemonServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Unix socket server executing forwarded command lines.
+
+    Commands run one at a time because each runs in the caller's working
+    directory and with the caller's NETCUPCTL_* environment variables; status
+    and stop requests are answered while a command runs.
+    """
+
+    daemon_threads = True
+
+    def __init__(self, path: Path, runner: Runner, idle_timeout: float = 0):
+        """Initialize daemon server and bind the socket (owner access only).
+
+        Args:
+            path: Socket path
+            runner: Callable executing (argv, stdin stream) and returning (exit code, stdout, stderr)
+            idle_timeout: Stop after this many seconds without requests (0: never)
+        """
+        self.path = path
+        self.runner = runner
+        self.idle_timeout = idle_timeout
+        self.last_activity = time.monotonic()
+        self.started = time.time()
+        self.env = netcupctl_env()
+        self.commands = 0
+        self.stopping = threading.Event()
+        self._run_lock = threading.Lock()
+        old_umask = os.umask(0o177)
+        try:
+            super().__init__(str(path), _RequestHandler)
+        finally:
+            os.umask(old_umask)
+
+    def dispatch(self, request: Dict[str, Any], stdin: Optional[TextIO] = None) -> Dict[str, Any]:
+        """Answer a request message.
+
+        Args:
+            request: Request message with an "op" field
+            stdin: Standard input of a forwarded command (default: empty)
+
+        Returns:
+            Response message
+        """
+        self.last_activity = time.monotonic()
+        op = request.get("op")
+        if op == "ping":
+            return {"ok": True, "pid": os.getpid(), "started": self.started, "commands": self.commands}
+        if op == "stop":
+            self.stopping.set()
+            return {"ok": True, "pid": os.getpid()}
+        if op == "run":
+            return self._run(request, stdin if stdin is not None else io.StringIO())
+        return {"ok": False, "error": f"Unknown request: {op}"}
+
+    def _run(self, request: Dict[str, Any], stdin: TextIO) -> Dict[str, Any]:
+        """Execute a forwarded command line."""
+        env = request.get("env", self.env)
+        if any(env.get(key) != self.env.get(key) for key in SESSION_ENV):
+            return {"ok": False, "run_locally": True, "error": "Connection pool settings differ from the daemon's"}
+        with self._run_lock:
+            self.commands += 1
+            _replace_env(env)
+            try:
+                if request.get("cwd"):
+                    os.chdir(request["cwd"])
+                exit_code, out, err = self.runner(list(request.get("argv", [])), stdin)
+            except Exception as e:  # pylint: disable=broad-exception-caught
+                exit_code, out, err = 1, "", f"Error: netcupctl daemon failed: {type(e).__name__}: {e}\n"
+            finally:
+                _replace_env(self.env)
+                self.last_activity = time.monotonic()
+        return {"ok": True, "exit_code": exit_code, "stdout": out, "stderr": err}
+
+    def _is_idle(self) -> bool:
+        """Return True if no command runs and the idle timeout has passed."""
+        if not self.idle_timeout or self._run_lock.locked():
+            return False
+        return time.monotonic() - self.last_activity > self.idle_timeout
+
+    def serve(self, poll_interval: float = 0.5) -> None:
+        """Serve requests until stopped or idle for longer than the idle timeout.
+
+        Args:
+            poll_interval: Seconds between checks for stop and idle conditions
+        """
+        self.timeout = poll_interval
+        try:
+            while not self.stopping.is_set():
+                self.handle_request()
+                if self._is_idle():
+                    break
+        finally:
+            self.server_close()
+            try:
+                self.path.unlink()
+            except OSError:
+                pass
@@ -0,0 +1,36 @@
+"""Advisory file locks shared by the state files of concurrent netcupctl processes."""
+
+import os
+
+try:
+    import fcntl
+    msvcrt = None
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+    import msvcrt
+
+
+def lock_fd(fd: int) -> None:
+    """Acquire an exclusive lock on an open file descriptor (blocking).
+
+    Args:
+        fd: File descriptor of the lock file, opened for reading and writing
+    """
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def unlock_fd(fd: int) -> None:
+    """Release a lock acquired with lock_fd.
+
+    Args:
+        fd: File descriptor passed to lock_fd
+    """
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:  # pragma: no cover - Windows
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
@@ -0,0 +1,124 @@
+"""Local inventory of resource identifiers used for shell completion."""
+
+import time
+from typing import Any, Dict, List, Optional
+
+from netcupctl.client import APIError
+from netcupctl.concurrency import map_requests
+
+DEFAULT_MAX_AGE = 3600.0
+
+_SERVER_RESOURCES = (("macs", "interfaces", "mac"), ("snapshots", "snapshots", "name"))
+
+
+def _values(items: Any, key: str) -> List[str]:
+    """Return the string values of key in a list response (errors count as empty)."""
+    if isinstance(items, APIError) or not isinstance(items, list):
+        return []
+    return [str(item[key]) for item in items if isinstance(item, dict) and item.get(key) is not None]
+
+
+class Inventory:
+    """Server IDs, MAC addresses, snapshot names and firewall policies cached on disk.
+
+    Completion only reads this local copy, so typing never waits for the API.
+    The inventory is refreshed explicitly (``Inventory.fetch``) and saved to
+    the configuration directory for the next session.
+    """
+
+    def __init__(self, data: Optional[Dict[str, Any]] = None):
+        """Initialize inventory.
+
+        Args:
+            data: Dictionary as returned by to_dict() (empty inventory if not provided)
+        """
+        data = data or {}
+        self.updated: float = data.get("updated", 0)
+        self.servers: Dict[str, Dict[str, List[str]]] = data.get("servers", {})
+        self.policies: List[Dict[str, str]] = data.get("policies", [])
+
+    @classmethod
+    def load(cls, config) -> "Inventory":
+        """Load the inventory saved in the configuration directory.
+
+        Args:
+            config: Configuration manager
+
+        Returns:
+            Saved inventory, or an empty one if none was saved
+        """
+        data = config.load_json(config.inventory_file)
+        return cls(data if isinstance(data, dict) else None)
+
+    def save(self, config) -> None:
+        """Save the inventory to the configuration directory.
+
+        Args:
+            config: Configuration manager
+        """
+        config.save_json(config.inventory_file, self.to_dict())
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the inventory as a JSON-serializable dictionary."""
+        return {"updated": self.updated, "servers": self.servers, "policies": self.policies}
+
+    def is_stale(self, max_age: float = DEFAULT_MAX_AGE) -> bool:
+        """Return True if the inventory is older than max_age seconds."""
+        return time.time() - self.updated > max_age
+
+    def server_ids(self) -> List[str]:
+        """Return all server IDs."""
+        return sorted(self.servers)
+
+    def macs(self, server_id: Optional[str]) -> List[str]:
+        """Return the interface MAC addresses of a server."""
+        return self.servers.get(server_id or "", {}).get("macs", [])
+
+    def snapshots(self, server_id: Optional[str]) -> List[str]:
+        """Return the snapshot names of a server."""
+        return self.servers.get(server_id or "", {}).get("snapshots", [])
+
+    def policy_ids(self) -> List[str]:
+        """Return all firewall policy IDs."""
+        return [policy["id"] for policy in self.policies]
+
+    def policy_names(self) -> List[str]:
+        """Return all firewall policy names."""
+        return sorted({policy["name"] for policy in self.policies if policy.get("name")})
+
+    @classmethod
+    def fetch(cls, client, user_id: Optional[str], max_workers: int) -> "Inventory":
+        """Build a fresh inventory from the API.
+
+        Interfaces and snapshots of all servers are requested concurrently;
+        servers whose requests fail are listed without them.
+
+        Args:
+            client: NetcupClient
+            user_id: Authenticated user's ID (firewall policies are skipped if None)
+            max_workers: Maximum number of requests in flight
+
+        Returns:
+            New inventory
+
+        Raises:
+            APIError: If the server or policy list cannot be fetched
+        """
+        server_ids = _values(list(client.paginate("/api/v1/servers", prefetch=max_workers)), "id")
+        calls = [
+            ("get", f"/api/v1/servers/{server_id}/{resource}")
+            for server_id in server_ids
+            for _, resource, _ in _SERVER_RESOURCES
+        ]
+        results = iter(map_requests(client, calls, max_workers=max_workers, return_exceptions=True))
+        servers = {
+            server_id: {field: _values(next(results), key) for field, _, key in _SERVER_RESOURCES}
+            for server_id in server_ids
+        }
+
+        policies = []
+        if user_id:
+            pages = client.paginate(f"/api/v1/users/{user_id}/firewall-policies", prefetch=max_workers)
+            policies = [{"id": str(p["id"]), "name": p.get("name", "")} for p in pages if p.get("id") is not None]
+
+        return cls({"updated": time.time(), "servers": servers, "policies": policies})
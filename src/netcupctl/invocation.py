@@ -0,0 +1,198 @@
+"""In-process execution of netcupctl command lines with captured output."""
+
+import io
+import sys
+import threading
+from typing import List, Optional, Sequence, TextIO, Tuple, Union
+
+import click
+from click.core import ParameterSource
+
+from netcupctl.auth import AuthError
+from netcupctl.client import APIError
+
+
+class _StreamRouter:
+    """Stand-in for sys.stdout/sys.stderr/sys.stdin that routes to a per-thread stream.
+
+    Commands write with print(), click.echo() and rich, which all look up
+    sys.stdout at call time. Installing a router once lets several commands
+    run concurrently in worker threads, each writing into its own buffer,
+    while other threads keep using the original stream.
+    """
+
+    def __init__(self, default):
+        """Initialize stream router.
+
+        Args:
+            default: Stream used by threads without a redirection
+        """
+        self._default = default
+        self._local = threading.local()
+
+    @property
+    def target(self):
+        """Stream of the current thread."""
+        return getattr(self._local, "stream", None) or self._default
+
+    def redirect(self, stream) -> None:
+        """Route the current thread to stream (None restores the default)."""
+        self._local.stream = stream
+
+    def write(self, text: str) -> int:
+        """Write to the stream of the current thread."""
+        return self.target.write(text)
+
+    def flush(self) -> None:
+        """Flush the stream of the current thread."""
+        self.target.flush()
+
+    def isatty(self) -> bool:
+        """Report whether the stream of the current thread is a terminal."""
+        return self.target.isatty()
+
+    def __getattr__(self, name):
+        return getattr(self.target, name)
+
+
+_install_lock = threading.Lock()
+
+# Report options of the root command; an in-process runner writes them once for all its commands.
+_RUNNER_OPTIONS = ("show_timings", "timings_file", "trace_file")
+
+
+def _routers() -> Tuple[_StreamRouter, _StreamRouter, _StreamRouter]:
+    """Install stream routers on sys.stdout, sys.stderr and sys.stdin (once)."""
+    routers = []
+    with _install_lock:
+        for name in ("stdout", "stderr", "stdin"):
+            router = getattr(sys, name)
+            if not isinstance(router, _StreamRouter):
+                router = _StreamRouter(router)
+                setattr(sys, name, router)
+            routers.append(router)
+    return routers[0], routers[1], routers[2]
+
+
+def run_command(command: click.Command, context, argv: List[str], stdin: Union[str, TextIO] = "",
+                prog_name: str = "netcupctl") -> Tuple[int, str, str]:
+    """Run one command line in this process and capture its output.
+
+    The command receives ``context`` as its object. The ``cli`` group copies
+    it for every invocation, so the authentication manager and HTTP session of
+    a long-running process are reused while per-invocation options (output
+    format, retries, ...) still apply. Safe to call from several threads.
+
+    Args:
+        command: Root command (the ``cli`` group)
+        context: Shared CLI Context
+        argv: Arguments without the program name, e.g. ["servers", "list"]
+        stdin: Text or text stream the command reads as standard input
+        prog_name: Program name shown in usage messages
+
+    Returns:
+        Tuple of (exit code, stdout text, stderr text)
+    """
+    stdout_router, stderr_router, stdin_router = _routers()
+    out, err = io.StringIO(), io.StringIO()
+    stdout_router.redirect(out)
+    stderr_router.redirect(err)
+    stdin_router.redirect(io.StringIO(stdin) if isinstance(stdin, str) else stdin)
+    try:
+        exit_code = invoke(command, context, argv, prog_name)
+    finally:
+        stdout_router.redirect(None)
+        stderr_router.redirect(None)
+        stdin_router.redirect(None)
+    return exit_code, out.getvalue(), err.getvalue()
+
+
+def invoke(command: click.Command, context, argv: List[str], prog_name: str = "netcupctl") -> int:
+    """Invoke a command line without letting it exit the process.
+
+    Output goes to the current streams; use run_command() to capture it.
+
+    Args:
+        command: Root command
+        context: Shared CLI Context
+        argv: Command line arguments
+        prog_name: Program name shown in usage messages
+
+    Returns:
+        Exit code of the command
+    """
+    try:
+        result = command.main(args=list(argv), prog_name=prog_name, obj=context, standalone_mode=False)
+        return result if isinstance(result, int) else 0
+    except click.ClickException as e:
+        e.show()
+        return e.exit_code
+    except click.Abort:
+        click.echo("Aborted!", err=True)
+        return 1
+    except SystemExit as e:
+        return _system_exit_code(e.code)
+    except (AuthError, APIError) as e:
+        click.echo(f"Error: {e}", err=True)
+        return 1
+
+
+def command_name(root: click.Command, argv: Sequence[str]) -> Optional[str]:
+    """Return the subcommand of a command line, skipping the options of the root command.
+
+    Args:
+        root: Root command (the ``cli`` group)
+        argv: Arguments without the program name
+
+    Returns:
+        Name of the first subcommand, or None if there is none
+    """
+    with_value = {opt for param in root.params if isinstance(param, click.Option) and not param.is_flag
+                  for opt in param.opts}
+    args = iter(argv)
+    for arg in args:
+        if arg in with_value:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
+
+
+def global_args(ctx: click.Context) -> List[str]:
+    """Rebuild the global options given on the command line of a runner invocation.
+
+    Batch and shell pass them in front of every command line they run, so
+    options such as --api-url or --retries given to the runner apply to its
+    commands; options on a command line still override them. --timings,
+    --timings-file and --trace-file are left out, they report on the runner
+    invocation as a whole.
+
+    Args:
+        ctx: Click context of the root command
+
+    Returns:
+        Arguments reproducing the options given on the command line
+    """
+    args: List[str] = []
+    for param in ctx.command.params:
+        if not isinstance(param, click.Option) or not param.expose_value or param.name in _RUNNER_OPTIONS:
+            continue
+        if ctx.get_parameter_source(param.name) != ParameterSource.COMMANDLINE:
+            continue
+        value = ctx.params[param.name]
+        if param.is_flag:
+            opts = param.opts if value else param.secondary_opts
+            args.extend(opts[:1])
+        elif value is not None:
+            args.extend([param.opts[0], str(value)])
+    return args
+
+
+def _system_exit_code(code: Optional[object]) -> int:
+    """Translate a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    click.echo(str(code), err=True)
+    return 1
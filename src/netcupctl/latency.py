@@ -0,0 +1,416 @@
+"""Per-endpoint latency histograms and slow-request log.
+
+Latencies of HTTP attempts are kept in log-linear histograms (in the style
+of HdrHistogram) per method and path template, e.g.
+"GET /api/v1/servers/{serverId}". The histograms of all runs are merged into
+a file in the configuration directory; attempts slower than a threshold are
+appended to a slow-request log next to it.
+"""
+
+import json
+import os
+import re
+import threading
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from netcupctl.filelock import lock_fd, unlock_fd
+
+DEFAULT_SLOW_THRESHOLD = 1.0
+
+# Path segments replaced by "{id}" when no OpenAPI path template matches
+_ID_SEGMENT = re.compile(
+    r"^(\d+|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}|([0-9a-f]{2}[:-]){5}[0-9a-f]{2})$",
+    re.IGNORECASE,
+)
+
+
+class LatencyHistogram:
+    """Latency histogram with bounded relative error.
+
+    Values are counted in microseconds. Values below 64 µs have a bucket of
+    their own; above, every power of two is split into 32 buckets, so the
+    reported percentiles are at most about 3% above the recorded value while
+    the histogram stays small and can be merged exactly.
+    """
+
+    SUB_BUCKET_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        """Initialize an empty histogram."""
+        self.counts: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @classmethod
+    def _index(cls, micros: int) -> int:
+        """Return the bucket index of a value in microseconds."""
+        if micros < 2 * cls.SUB_BUCKETS:
+            return micros
+        shift = micros.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return (shift + 1) * cls.SUB_BUCKETS + (micros >> shift) - cls.SUB_BUCKETS
+
+    @classmethod
+    def _highest_value(cls, index: int) -> int:
+        """Return the largest value in microseconds counted in a bucket."""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index
+        shift = index // cls.SUB_BUCKETS - 1
+        lowest = (index % cls.SUB_BUCKETS + cls.SUB_BUCKETS) << shift
+        return lowest + (1 << shift) - 1
+
+    def record(self, seconds: float) -> None:
+        """Count one latency.
+
+        Args:
+            seconds: Latency in seconds
+        """
+        seconds = max(0.0, seconds)
+        index = self._index(int(seconds * 1_000_000))
+        self.counts[index] = self.counts.get(index, 0) + 1
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add the counts of another histogram to this one."""
+        for index, count in other.counts.items():
+            self.counts[index] = self.counts.get(index, 0) + count
+        self.count += other.count
+        self.total += other.total
+        self.max = max(self.max, other.max)
+
+    def percentile(self, percent: float) -> float:
+        """Return the latency below which the given percentage of values fall.
+
+        Args:
+            percent: Percentile between 0 and 100
+
+        Returns:
+            Latency in seconds (0.0 for an empty histogram)
+        """
+        if self.count == 0:
+            return 0.0
+        rank = max(1, int(round(percent / 100 * self.count)))
+        seen = 0
+        for index in sorted(self.counts):
+            seen += self.counts[index]
+            if seen >= rank:
+                return min(self._highest_value(index) / 1_000_000, self.max)
+        return self.max
+
+    @property
+    def mean(self) -> float:
+        """Mean latency in seconds."""
+        return self.total / self.count if self.count else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the histogram as a JSON-serializable dictionary."""
+        return {
+            "count": self.count,
+            "total": self.total,
+            "max": self.max,
+            "buckets": {str(index): count for index, count in sorted(self.counts.items())},
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyHistogram":
+        """Create a histogram from to_dict() output.
+
+        Raises:
+            KeyError, TypeError, ValueError: If the data is malformed
+        """
+        histogram = cls()
+        histogram.counts = {int(index): int(count) for index, count in data["buckets"].items()}
+        histogram.count = int(data["count"])
+        histogram.total = float(data["total"])
+        histogram.max = float(data["max"])
+        return histogram
+
+
+class PathTemplates:
+    """Maps request paths to the path templates of the OpenAPI spec.
+
+    "/api/v1/servers/12345/snapshots" becomes
+    "/api/v1/servers/{serverId}/snapshots". When no template matches, numeric,
+    UUID and MAC address segments are replaced by "{id}".
+    """
+
+    def __init__(self, templates: Iterable[str] = ()):
+        """Initialize path templates.
+
+        Args:
+            templates: OpenAPI paths, e.g. "/api/v1/servers/{serverId}"
+        """
+        self._templates: Dict[int, List[Tuple[Tuple[str, ...], str]]] = {}
+        for template in templates:
+            segments = tuple(template.strip("/").split("/"))
+            self._templates.setdefault(len(segments), []).append((segments, template))
+        self._cache: Dict[str, str] = {}
+
+    @staticmethod
+    def _is_parameter(segment: str) -> bool:
+        return segment.startswith("{") and segment.endswith("}")
+
+    def _score(self, template: Tuple[str, ...], segments: List[str]) -> int:
+        """Return the number of literal segments matched, or -1 if the template does not match."""
+        score = 0
+        for expected, actual in zip(template, segments):
+            if self._is_parameter(expected):
+                continue
+            if expected != actual:
+                # Custom methods ("/api/v1/tasks/{uuid}:cancel") keep their literal suffix
+                prefix, colon, suffix = expected.partition(":")
+                if not (colon and self._is_parameter(prefix) and actual.endswith(colon + suffix)):
+                    return -1
+            score += 1
+        return score
+
+    def normalize(self, path: str) -> str:
+        """Return the path template of a request path.
+
+        Args:
+            path: Request path without query string
+
+        Returns:
+            Matching OpenAPI path, or the path with identifier segments replaced
+        """
+        if path in self._cache:
+            return self._cache[path]
+        segments = path.strip("/").split("/")
+        best, best_score = None, -1
+        for template_segments, template in self._templates.get(len(segments), []):
+            score = self._score(template_segments, segments)
+            if score > best_score:
+                best, best_score = template, score
+        if best is None:
+            best = "/" + "/".join("{id}" if _ID_SEGMENT.match(s) else s for s in segments)
+        if len(self._cache) < 4096:
+            self._cache[path] = best
+        return best
+
+
+class LatencyStats:
+    """Latency histograms per (method, path template)."""
+
+    def __init__(self):
+        """Initialize empty statistics."""
+        self.histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def record(self, method: str, template: str, seconds: float) -> None:
+        """Count one latency of an endpoint."""
+        self.histograms.setdefault((method.upper(), template), LatencyHistogram()).record(seconds)
+
+    def merge(self, other: "LatencyStats") -> None:
+        """Add the histograms of other to this one."""
+        for key, histogram in other.histograms.items():
+            self.histograms.setdefault(key, LatencyHistogram()).merge(histogram)
+
+    def rows(self) -> List[Dict[str, Any]]:
+        """Return one summary row per endpoint with latencies in milliseconds, slowest p99 first."""
+        rows = [
+            {
+                "method": method,
+                "path": template,
+                "count": histogram.count,
+                "mean_ms": round(histogram.mean * 1000, 1),
+                "p50_ms": round(histogram.percentile(50) * 1000, 1),
+                "p90_ms": round(histogram.percentile(90) * 1000, 1),
+                "p99_ms": round(histogram.percentile(99) * 1000, 1),
+                "max_ms": round(histogram.max * 1000, 1),
+            }
+            for (method, template), histogram in self.histograms.items()
+        ]
+        return sorted(rows, key=lambda row: (-row["p99_ms"], row["path"], row["method"]))
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the statistics as a JSON-serializable dictionary."""
+        return {
+            "endpoints": [
+                {"method": method, "path": template, "histogram": histogram.to_dict()}
+                for (method, template), histogram in sorted(self.histograms.items())
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "LatencyStats":
+        """Create statistics from to_dict() output, skipping malformed entries."""
+        stats = cls()
+        for entry in data.get("endpoints", []) if isinstance(data, dict) else []:
+            try:
+                histogram = LatencyHistogram.from_dict(entry["histogram"])
+                stats.histograms[(str(entry["method"]), str(entry["path"]))] = histogram
+            except (KeyError, TypeError, ValueError, AttributeError):
+                continue
+        return stats
+
+
+class LatencyRecorder:
+    """Collects the request latencies of one run and adds them to the statistics on disk.
+
+    Thread-safe. Nothing is written before flush().
+    """
+
+    STATS_FILENAME = "latency.json"
+    SLOW_LOG_FILENAME = "slow_requests.log"
+    LOCK_FILENAME = "latency.lock"
+    MAX_SLOW_LOG_BYTES = 1024 * 1024
+
+    def __init__(self, state_dir: Path, templates: Callable[[], PathTemplates],
+                 slow_threshold: float = DEFAULT_SLOW_THRESHOLD):
+        """Initialize latency recorder.
+
+        Args:
+            state_dir: Directory holding the statistics and the slow-request log (usually the config directory)
+            templates: Factory of the path templates, called on the first recorded request
+            slow_threshold: Attempts taking at least this many seconds are logged as slow
+        """
+        self.state_dir = state_dir
+        self.slow_threshold = slow_threshold
+        self._templates_factory = templates
+        self._templates: Optional[PathTemplates] = None
+        self._lock = threading.Lock()
+        self.stats = LatencyStats()
+        self.slow: List[Dict[str, Any]] = []
+
+    @property
+    def stats_file(self) -> Path:
+        """File holding the merged histograms."""
+        return self.state_dir / self.STATS_FILENAME
+
+    @property
+    def slow_log_file(self) -> Path:
+        """File the slow requests are appended to (one JSON object per line)."""
+        return self.state_dir / self.SLOW_LOG_FILENAME
+
+    def record(self, method: str, path: str, status: Optional[int], seconds: float) -> None:
+        """Record one HTTP attempt.
+
+        Only attempts that received a response count towards the histograms;
+        slow attempts are logged either way.
+
+        Args:
+            method: HTTP method
+            path: Request path
+            status: HTTP status code, or None if no response was received
+            seconds: Duration of the attempt
+        """
+        with self._lock:
+            if self._templates is None:
+                self._templates = self._templates_factory()
+            template = self._templates.normalize(path)
+            if status is not None:
+                self.stats.record(method, template, seconds)
+            if seconds >= self.slow_threshold:
+                self.slow.append({
+                    "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+                    "method": method.upper(),
+                    "path": path,
+                    "template": template,
+                    "status": status,
+                    "ms": round(seconds * 1000, 1),
+                })
+
+    def flush(self) -> None:
+        """Merge the recorded latencies into the statistics file and append slow requests to the log.
+
+        Raises:
+            OSError: If the files cannot be written
+        """
+        with self._lock:
+            stats, slow = self.stats, self.slow
+            self.stats, self.slow = LatencyStats(), []
+        if not stats.histograms and not slow:
+            return
+
+        self.state_dir.mkdir(parents=True, exist_ok=True, mode=0o700)
+        fd = os.open(self.state_dir / self.LOCK_FILENAME, os.O_RDWR | os.O_CREAT, 0o600)
+        try:
+            lock_fd(fd)
+            try:
+                if stats.histograms:
+                    merged = load_stats(self.state_dir)
+                    merged.merge(stats)
+                    _write_atomic(self.stats_file, json.dumps(merged.to_dict()))
+                if slow:
+                    self._append_slow(slow)
+            finally:
+                unlock_fd(fd)
+        finally:
+            os.close(fd)
+
+    def _append_slow(self, entries: List[Dict[str, Any]]) -> None:
+        """Append entries to the slow-request log, starting a new log when it grew too large."""
+        log_file = self.slow_log_file
+        if log_file.exists() and log_file.stat().st_size > self.MAX_SLOW_LOG_BYTES:
+            log_file.replace(log_file.with_name(log_file.name + ".1"))
+        fd = os.open(log_file, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+        with os.fdopen(fd, "a", encoding="utf-8") as f:
+            for entry in entries:
+                f.write(json.dumps(entry) + "\n")
+
+
+def _write_atomic(path: Path, text: str) -> None:
+    """Write a file through a temporary file and rename."""
+    temp_file = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        fd = os.open(temp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+        temp_file.replace(path)
+    finally:
+        if temp_file.exists():
+            temp_file.unlink()
+
+
+def load_stats(state_dir: Path) -> LatencyStats:
+    """Load the statistics stored in a directory.
+
+    Args:
+        state_dir: Directory holding the statistics file
+
+    Returns:
+        Statistics (empty if the file is missing or malformed)
+    """
+    try:
+        with open(state_dir / LatencyRecorder.STATS_FILENAME, "r", encoding="utf-8") as f:
+            return LatencyStats.from_dict(json.load(f))
+    except (OSError, ValueError):
+        return LatencyStats()
+
+
+def read_slow_log(state_dir: Path, limit: int) -> List[Dict[str, Any]]:
+    """Return the most recent entries of the slow-request log.
+
+    Args:
+        state_dir: Directory holding the log
+        limit: Maximum number of entries
+
+    Returns:
+        Log entries, oldest first
+    """
+    try:
+        with open(state_dir / LatencyRecorder.SLOW_LOG_FILENAME, "r", encoding="utf-8") as f:
+            lines = f.readlines()
+    except OSError:
+        return []
+    entries = []
+    for line in lines[-limit:] if limit > 0 else []:
+        try:
+            entries.append(json.loads(line))
+        except ValueError:
+            continue
+    return entries
+
+
+def reset(state_dir: Path) -> None:
+    """Delete the statistics and the slow-request log of a directory."""
+    for name in (LatencyRecorder.STATS_FILENAME, LatencyRecorder.SLOW_LOG_FILENAME,
+                 LatencyRecorder.SLOW_LOG_FILENAME + ".1"):
+        try:
+            (state_dir / name).unlink()
+        except FileNotFoundError:
+            pass
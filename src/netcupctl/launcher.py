@@ -0,0 +1,20 @@
+"""Console script entry point for netcupctl."""
+
+import sys
+
+from netcupctl.config import ConfigManager
+from netcupctl.daemon import forward, should_forward, socket_path
+
+
+def main():
+    """Forward the command line to a running daemon, or run the CLI in this process."""
+    argv = sys.argv[1:]
+    if should_forward(argv):
+        exit_code = forward(socket_path(ConfigManager().config_dir), argv)
+        if exit_code is not None:
+            sys.exit(exit_code)
+
+    # Imported here so forwarded invocations skip loading the command modules.
+    from netcupctl.cli import main as cli_main  # pylint: disable=import-outside-toplevel
+
+    cli_main()
@@ -0,0 +1,54 @@
+"""Click group that imports subcommands on first use."""
+
+import importlib
+import time
+from typing import Dict, List, Optional
+
+import click
+
+
+class LazyGroup(click.Group):
+    """Group whose subcommands are imported only when they are invoked.
+
+    Subcommands are given as a mapping of command name to import path
+    ("package.module.attribute"). Listing the commands does not import them;
+    resolving one (invoking it, showing its help) imports its module. When
+    each resolution started and how long it took is kept in ``import_started``
+    (time.perf_counter()) and ``import_seconds``.
+    """
+
+    def __init__(self, *args, lazy_subcommands: Optional[Dict[str, str]] = None, **kwargs):
+        """Initialize lazy group.
+
+        Args:
+            lazy_subcommands: Mapping of command name to import path of the command object
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+        self.import_started: Dict[str, float] = {}
+        self.import_seconds: Dict[str, float] = {}
+
+    def list_commands(self, ctx: click.Context) -> List[str]:
+        """Return the names of all eager and lazy subcommands."""
+        return sorted(set(super().list_commands(ctx)) | set(self.lazy_subcommands))
+
+    def get_command(self, ctx: click.Context, cmd_name: str) -> Optional[click.Command]:
+        """Return a subcommand, importing it if it is lazy."""
+        if cmd_name in self.lazy_subcommands:
+            return self._load(cmd_name)
+        return super().get_command(ctx, cmd_name)
+
+    def _load(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand.
+
+        Raises:
+            TypeError: If the import path does not refer to a click command
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].rsplit(".", 1)
+        start = time.perf_counter()
+        command = getattr(importlib.import_module(module_name), attribute)
+        self.import_started[cmd_name] = start
+        self.import_seconds[cmd_name] = time.perf_counter() - start
+        if not isinstance(command, click.Command):
+            raise TypeError(f"Lazy subcommand '{cmd_name}' is not a click command: {self.lazy_subcommands[cmd_name]}")
+        return command
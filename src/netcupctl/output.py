@@ -2,11 +2,16 @@
 
 import json
 import sys
-from typing import Any, Optional
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterable, Iterator, Optional
 
-import yaml
-from rich.console import Console
-from rich.table import Table
+from netcupctl import tracing
+from netcupctl.timings import Timings
+
+# rich and yaml are imported on first use; the json format needs neither.
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
 
 if sys.platform == "win32":
     import codecs
@@ -17,14 +22,35 @@ if sys.platform == "win32":
 class OutputFormatter:
     """Handles output formatting."""
 
-    def __init__(self, format: str = "list"):
+    def __init__(self, format: str = "list", timings: Optional[Timings] = None):
         """Initialize output formatter.
 
         Args:
             format: Output format ('json', 'yaml', 'table', or 'list')
+            timings: Collector for rendering durations (default: none)
         """
         self.format = format
-        self.console = Console(legacy_windows=False, safe_box=True)
+        self.timings = timings
+        self._console: Optional["Console"] = None
+
+    @property
+    def console(self) -> "Console":
+        """Rich console used by the list and table formats (created on first use)."""
+        if self._console is None:
+            from rich.console import Console  # pylint: disable=import-outside-toplevel
+
+            self._console = Console(legacy_windows=False, safe_box=True)
+        return self._console
+
+    @contextmanager
+    def _measure(self) -> Iterator[None]:
+        """Record the duration of the with-block as rendering time and trace span (if enabled)."""
+        with tracing.span("render", "render", format=self.format):
+            if self.timings is None:
+                yield
+            else:
+                with self.timings.measure("render"):
+                    yield
 
     def output(self, data: Any) -> None:
         """Output data in specified format.
@@ -32,6 +58,11 @@ class OutputFormatter:
         Args:
             data: Data to output (dict, list, or other)
         """
+        with self._measure():
+            self._output(data)
+
+    def _output(self, data: Any) -> None:
+        """Output data in specified format (untimed)."""
         if self.format == "json":
             self._output_json(data)
         elif self.format == "yaml":
@@ -43,6 +74,64 @@ class OutputFormatter:
         else:
             self._output_list(data)
 
+    def output_stream(self, items: Iterable[Any]) -> None:
+        """Output the items of a list as they arrive.
+
+        Produces the same output as output() for the complete list, but
+        writes every item as soon as it is available instead of holding the
+        whole list in memory. The table format needs all rows to size its
+        columns and therefore collects the items first.
+
+        Args:
+            items: Iterable of list items (e.g. from NetcupClient.paginate())
+        """
+        if self.format == "table":
+            rows = list(items)
+            with self._measure():
+                self._output_table(rows)
+            return
+
+        count = 0
+        for count, item in enumerate(items, start=1):
+            with self._measure():
+                self._output_stream_item(item, first=count == 1)
+
+        if self.format == "json":
+            print("[]" if count == 0 else "\n]", flush=True)
+        elif self.format == "yaml":
+            if count == 0:
+                print("[]", flush=True)
+        elif count == 0:
+            self.console.print("[yellow]No data[/yellow]")
+
+    def _output_stream_item(self, item: Any, first: bool) -> None:
+        """Output one item of a streamed list.
+
+        Args:
+            item: List item
+            first: Whether this is the first item
+        """
+        if self.format == "json":
+            try:
+                item_str = json.dumps(item, indent=2, ensure_ascii=False)
+            except (TypeError, ValueError):
+                item_str = "null"
+                print("Error: Could not format data as JSON", file=sys.stderr)
+            indented = "\n".join(f"  {line}" for line in item_str.splitlines())
+            print(("[\n" if first else ",\n") + indented, end="", flush=True)
+        elif self.format == "yaml":
+            self._output_yaml([item])
+            sys.stdout.flush()
+        else:
+            if not first:
+                self.console.print()
+                self.console.print("─" * 80, style="dim")
+                self.console.print()
+            if isinstance(item, dict):
+                self._output_list_item(item)
+            else:
+                self.console.print(str(item))
+
     def _output_json(self, data: Any) -> None:
         """Output data as JSON.
 
@@ -61,6 +150,8 @@ class OutputFormatter:
         Args:
             data: Data to output
         """
+        import yaml  # pylint: disable=import-outside-toplevel
+
         try:
             yaml_str = yaml.dump(data, default_flow_style=False, allow_unicode=True, sort_keys=False)
             print(yaml_str, end="")
@@ -104,6 +195,8 @@ class OutputFormatter:
         Args:
             data: Dictionary to output
         """
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+
         table = Table(show_header=False, box=None, padding=(0, 2))
         table.add_column("Key", style="bold cyan", no_wrap=True)
         table.add_column("Value", no_wrap=False)
@@ -171,7 +264,7 @@ class OutputFormatter:
                 all_keys.update(item.keys())
         return all_keys
 
-    def _build_table(self, data: list, all_keys: set) -> Table:
+    def _build_table(self, data: list, all_keys: set) -> "Table":
         """Build rich Table from data and keys.
 
         Args:
@@ -181,6 +274,8 @@ class OutputFormatter:
         Returns:
             Constructed Table object
         """
+        from rich.table import Table  # pylint: disable=import-outside-toplevel
+
         table = Table(show_header=True, header_style="bold cyan")
 
         for key in sorted(all_keys):
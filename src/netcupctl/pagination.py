@@ -0,0 +1,110 @@
+"""Offset/limit pagination for netcup SCP API list endpoints."""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from netcupctl import tracing
+
+DEFAULT_PAGE_SIZE = 50
+
+
+def _page_items(page: Any) -> List[Any]:
+    """Return the items of a list response (non-list responses count as empty)."""
+    return page if isinstance(page, list) else []
+
+
+def paginate(
+    client,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    page_size: int = DEFAULT_PAGE_SIZE,
+    prefetch: int = 0,
+    total: Optional[int] = None,
+) -> Iterator[Any]:
+    """Iterate lazily over all items of an offset/limit paginated list endpoint.
+
+    Pages are requested with ``limit=page_size`` and increasing ``offset``
+    until a page comes back shorter than ``page_size`` or ``total`` items have
+    been requested. An ``offset`` in params sets the first item to return; a
+    ``limit`` in params is replaced by ``page_size``.
+
+    With ``prefetch=N`` offset windows are requested concurrently in
+    background threads while the current page is consumed; items are still
+    yielded in order. Only the first page is requested at first, and the
+    number of pages in flight doubles with every full page up to N, so a
+    result that fits on one page costs one request. Without a known total,
+    a few requests beyond the last page may be sent and discarded.
+
+    Args:
+        client: NetcupClient (only its get() method is used)
+        path: API path of the list endpoint
+        params: Additional query parameters (filters, search query, start offset)
+        page_size: Number of items requested per page
+        prefetch: Number of pages requested ahead in the background (0: one page at a time)
+        total: Total number of items of the endpoint, if known
+
+    Yields:
+        Items of all pages in order
+
+    Raises:
+        ValueError: If page_size is smaller than 1
+        APIError: If a page request fails
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+
+    params = dict(params or {})
+    offset = int(params.pop("offset", 0) or 0)
+    params.pop("limit", None)
+
+    def fetch(page_offset: int) -> List[Any]:
+        with tracing.span("page", "pagination", path=path, offset=page_offset, limit=page_size) as page_span:
+            items = _page_items(client.get(path, params={**params, "limit": page_size, "offset": page_offset}))
+            if page_span is not None:
+                page_span.set(items=len(items))
+            return items
+
+    if prefetch < 1:
+        return _sequential_pages(fetch, offset, page_size, total)
+    return _prefetched_pages(fetch, offset, page_size, int(prefetch), total)
+
+
+def _sequential_pages(fetch: Callable[[int], List[Any]], offset: int, page_size: int,
+                      total: Optional[int]) -> Iterator[Any]:
+    """Yield the items of one page after another."""
+    while total is None or offset < total:
+        page = fetch(offset)
+        yield from page
+        if len(page) < page_size:
+            return
+        offset += page_size
+
+
+def _prefetched_pages(fetch: Callable[[int], List[Any]], offset: int, page_size: int, prefetch: int,
+                      total: Optional[int]) -> Iterator[Any]:
+    """Yield the items of all pages in order while up to prefetch pages are requested concurrently.
+
+    The window of pages in flight starts at one and doubles after every full page.
+    """
+    with ThreadPoolExecutor(max_workers=prefetch, thread_name_prefix="netcupctl-page") as executor:
+        pending = deque()
+        window = 1
+
+        def fill_window() -> None:
+            nonlocal offset
+            while len(pending) < window and (total is None or offset < total):
+                pending.append(executor.submit(tracing.bind(fetch), offset))
+                offset += page_size
+
+        fill_window()
+        while pending:
+            page = pending.popleft().result()
+            if len(page) < page_size:
+                for future in pending:
+                    future.cancel()
+                yield from page
+                return
+            window = min(window * 2, prefetch)
+            fill_window()
+            yield from page
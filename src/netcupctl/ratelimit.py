@@ -0,0 +1,133 @@
+"""Client-side rate limiting for netcup SCP API requests."""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Optional, Tuple
+
+from netcupctl.filelock import lock_fd, unlock_fd
+
+
+class TokenBucket:
+    """Thread-safe token bucket limiting requests per second with a burst allowance.
+
+    A caller reserves one token per request. When the bucket is empty the
+    reservation still succeeds but the caller sleeps until its token has been
+    refilled, so concurrent callers are served in order without busy waiting.
+    """
+
+    def __init__(self, rate: float, burst: Optional[int] = None):
+        """Initialize token bucket.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Maximum number of requests sent back-to-back (default: max(1, rate))
+        """
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1, int(rate)))
+        self._lock = threading.Lock()
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+
+    def _reserve(self, tokens: float, updated: float, now: float) -> Tuple[float, float]:
+        """Refill the bucket and take one token.
+
+        Args:
+            tokens: Token balance at ``updated``
+            updated: Time of the last update
+            now: Current time
+
+        Returns:
+            Tuple of (new token balance, seconds to wait before sending)
+        """
+        tokens = min(self.burst, tokens + max(0.0, now - updated) * self.rate) - 1
+        wait = -tokens / self.rate if tokens < 0 else 0.0
+        return tokens, wait
+
+    def reserve(self) -> float:
+        """Take one token without sleeping.
+
+        Returns:
+            Seconds the caller has to wait before sending its request
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens, wait = self._reserve(self._tokens, self._updated, now)
+            self._updated = now
+        return wait
+
+    def acquire(self) -> float:
+        """Block until a request may be sent.
+
+        Returns:
+            Seconds spent waiting
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+
+class SharedTokenBucket(TokenBucket):
+    """Token bucket whose state is shared between processes through a locked state file.
+
+    All netcupctl processes using the same configuration directory draw from
+    the same bucket, so concurrent cron jobs and CI runs together stay within
+    the configured request rate.
+    """
+
+    STATE_FILENAME = "ratelimit.json"
+    LOCK_FILENAME = "ratelimit.lock"
+
+    def __init__(self, rate: float, burst: Optional[int], state_dir: Path):
+        """Initialize shared token bucket.
+
+        Args:
+            rate: Sustained number of requests per second
+            burst: Maximum number of requests sent back-to-back (default: max(1, rate))
+            state_dir: Directory holding the state and lock files (usually the config directory)
+        """
+        super().__init__(rate, burst)
+        self.state_file = state_dir / self.STATE_FILENAME
+        self.lock_file = state_dir / self.LOCK_FILENAME
+
+    def reserve(self) -> float:
+        """Take one token from the shared bucket without sleeping.
+
+        Returns:
+            Seconds the caller has to wait before sending its request
+        """
+        with self._lock:
+            self.lock_file.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+            fd = os.open(self.lock_file, os.O_RDWR | os.O_CREAT, 0o600)
+            try:
+                lock_fd(fd)
+                return self._reserve_locked()
+            finally:
+                unlock_fd(fd)
+                os.close(fd)
+
+    def _reserve_locked(self) -> float:
+        """Update the state file while holding the file lock.
+
+        Returns:
+            Seconds the caller has to wait before sending its request
+        """
+        now = time.time()
+        tokens, updated = self.burst, now
+        try:
+            state = json.loads(self.state_file.read_text(encoding="utf-8"))
+            tokens, updated = float(state["tokens"]), float(state["updated"])
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        tokens, wait = self._reserve(tokens, min(updated, now), now)
+
+        temp_file = self.state_file.with_suffix(".tmp")
+        temp_file.write_text(json.dumps({"tokens": tokens, "updated": now}), encoding="utf-8")
+        temp_file.replace(self.state_file)
+        return wait
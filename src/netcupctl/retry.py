@@ -0,0 +1,141 @@
+"""Retry policy for transient API failures."""
+
+import random
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Iterable, Optional
+
+import requests
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE"})
+
+DEFAULT_MAX_RETRIES = 3
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Idempotent methods are retried on network errors, timeouts and the
+    status codes in ``status_codes``. HTTP 429 is retried for every method,
+    because a throttled request has not been processed by the API.
+
+    Delays use capped exponential backoff with full jitter. A ``Retry-After``
+    header on 429/503 responses takes precedence over the computed backoff.
+    No retry is scheduled if it would end after ``deadline`` seconds counted
+    from the first attempt.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 30.0,
+        deadline: float = 300.0,
+        methods: Iterable[str] = IDEMPOTENT_METHODS,
+        status_codes: Iterable[int] = RETRYABLE_STATUS_CODES,
+    ):
+        """Initialize retry policy.
+
+        Args:
+            max_retries: Maximum number of retries after the first attempt (0 disables retries)
+            backoff_factor: Base delay in seconds; attempt n waits up to factor * 2**n
+            max_backoff: Upper bound for a single computed backoff delay in seconds
+            deadline: Total time budget per request in seconds, including all retries
+            methods: HTTP methods that are safe to retry
+            status_codes: HTTP status codes that are retried
+        """
+        self.max_retries = max(0, max_retries)
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.deadline = deadline
+        self.methods = frozenset(m.upper() for m in methods)
+        self.status_codes = frozenset(status_codes)
+
+    def is_retryable(self, method: str, status_code: Optional[int] = None) -> bool:
+        """Check whether a failure is retryable at all.
+
+        Args:
+            method: HTTP method
+            status_code: HTTP status code, or None for network errors and timeouts
+
+        Returns:
+            True if the failure may be retried
+        """
+        if status_code == 429:
+            return True
+        if method.upper() not in self.methods:
+            return False
+        return status_code is None or status_code in self.status_codes
+
+    def backoff(self, attempt: int) -> float:
+        """Compute the jittered backoff delay for a retry.
+
+        Args:
+            attempt: Zero-based number of the retry
+
+        Returns:
+            Delay in seconds
+        """
+        cap = min(self.max_backoff, self.backoff_factor * (2 ** attempt))
+        return random.uniform(0, cap)
+
+    @staticmethod
+    def retry_after(response: Optional[requests.Response]) -> Optional[float]:
+        """Parse the Retry-After header of a 429 or 503 response.
+
+        Args:
+            response: HTTP response object
+
+        Returns:
+            Delay in seconds, or None if the header is absent or invalid
+        """
+        if response is None or response.status_code not in (429, 503):
+            return None
+
+        value = response.headers.get("Retry-After")
+        if not value:
+            return None
+
+        value = value.strip()
+        if value.isdigit():
+            return float(value)
+
+        try:
+            retry_at = parsedate_to_datetime(value)
+        except (TypeError, ValueError, IndexError):
+            return None
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+    def next_delay(
+        self,
+        method: str,
+        attempt: int,
+        started: float,
+        response: Optional[requests.Response] = None,
+    ) -> Optional[float]:
+        """Compute the delay before the next attempt.
+
+        Args:
+            method: HTTP method
+            attempt: Zero-based number of the retry that would follow
+            started: time.monotonic() value of the first attempt
+            response: Failed HTTP response, or None for network errors and timeouts
+
+        Returns:
+            Delay in seconds, or None if the request must not be retried
+        """
+        status_code = response.status_code if response is not None else None
+        if attempt >= self.max_retries or not self.is_retryable(method, status_code):
+            return None
+
+        delay = self.retry_after(response)
+        if delay is None:
+            delay = self.backoff(attempt)
+
+        if time.monotonic() - started + delay > self.deadline:
+            return None
+        return delay
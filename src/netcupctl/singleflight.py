@@ -0,0 +1,87 @@
+"""Coalescing of concurrent identical API requests."""
+
+import copy
+import threading
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+class _Call:
+    """A call in flight whose outcome is shared with waiting callers."""
+
+    def __init__(self):
+        """Initialize in-flight call."""
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Run a function at most once at a time per key.
+
+    Callers asking for a key that is already being computed block until the
+    running call finishes and receive a deep copy of its result (or its
+    exception), so concurrent identical GET requests share one HTTP round-trip
+    without sharing mutable response data. Results are not kept once the call
+    has finished; repeated sequential requests are the response cache's job.
+    """
+
+    def __init__(self):
+        """Initialize single-flight group."""
+        self._lock = threading.Lock()
+        self._calls: Dict[Hashable, _Call] = {}
+
+    def do(self, key: Hashable, func: Callable[[], Any]) -> Any:
+        """Call func, or wait for the identical call already in flight.
+
+        Args:
+            key: Identifier of the call (equal keys are coalesced)
+            func: Function performing the call
+
+        Returns:
+            Result of func
+
+        Raises:
+            Exception: Whatever func raised
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if leader:
+                call = self._calls[key] = _Call()
+            else:
+                call.waiters += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return copy.deepcopy(call.result)
+
+        result = None
+        try:
+            result = func()
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            if call.waiters and call.error is None:
+                # Snapshot before returning, the caller may mutate its result
+                call.result = copy.deepcopy(result)
+            call.done.set()
+        return result
+
+    def waiters(self, key: Hashable) -> int:
+        """Return the number of callers waiting for the call in flight under key.
+
+        Args:
+            key: Identifier of the call
+
+        Returns:
+            Number of waiting callers (0 if no call is in flight)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            return call.waiters if call is not None else 0
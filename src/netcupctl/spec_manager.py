@@ -2,11 +2,16 @@
 
 import json
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
 import requests
 
 
+def default_data_dir() -> Path:
+    """Return the data/ directory of the project, where the spec file is stored."""
+    return Path(__file__).resolve().parent.parent.parent / "data"
+
+
 class SpecError(Exception):
     """Specification management error."""
 
@@ -32,12 +37,12 @@ class SpecManager:
         if not str(self.spec_file).startswith(str(self.data_dir)):
             raise SpecError("Invalid spec file path: path traversal detected")
 
-    def get_local_version(self) -> Optional[str]:
-        """Get version from local OpenAPI spec file.
+    def _load_local_spec(self) -> Optional[Dict[str, Any]]:
+        """Load the local OpenAPI spec file.
 
         Returns:
-            Version string from info.version field, or None if file doesn't exist
-            or is malformed
+            Specification dictionary, or None if the file doesn't exist, is too
+            large or is malformed
         """
         if not self.spec_file.exists():
             return None
@@ -50,12 +55,39 @@ class SpecManager:
             with open(self.spec_file, "r", encoding="utf-8") as f:
                 spec = json.load(f)
 
-            version = spec.get("info", {}).get("version")
-            return version if version else None
+            return spec if isinstance(spec, dict) else None
+
+        except (json.JSONDecodeError, OSError):
+            return None
+
+    def get_local_version(self) -> Optional[str]:
+        """Get version from local OpenAPI spec file.
 
-        except (json.JSONDecodeError, OSError, KeyError):
+        Returns:
+            Version string from info.version field, or None if file doesn't exist
+            or is malformed
+        """
+        spec = self._load_local_spec()
+        if spec is None:
             return None
 
+        info = spec.get("info")
+        version = info.get("version") if isinstance(info, dict) else None
+        return version if version else None
+
+    def get_local_paths(self) -> List[str]:
+        """Get the path templates of the local OpenAPI spec file.
+
+        Returns:
+            Paths of the spec (e.g. "/api/v1/servers/{serverId}"), or an empty
+            list if the file doesn't exist or is malformed
+        """
+        spec = self._load_local_spec()
+        paths = spec.get("paths") if spec is not None else None
+        if not isinstance(paths, dict):
+            return []
+        return [path for path in paths if isinstance(path, str) and path.startswith("/")]
+
     def download_spec(self) -> Dict[str, Any]:
         """Download OpenAPI spec from public API.
 
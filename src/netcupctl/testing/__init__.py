@@ -0,0 +1 @@
+"""Helpers for exercising netcupctl without the netcup SCP API."""
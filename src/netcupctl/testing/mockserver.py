@@ -0,0 +1,783 @@
+"""Local mock of the netcup SCP REST API for offline tests and benchmarks.
+
+The server keeps an in-memory model of one account seeded from
+``netcupctl.testing.seed_data`` and scaled to any number of servers.
+Latency, jitter, random errors, queued failures, HTTP 429 throttling and a
+per-connection upload bandwidth can be configured, so fan-out, retries and
+uploads can be measured end to end without network access::
+
+    python -m netcupctl.testing.mockserver --servers 500 --latency 0.02 --seed-tokens /tmp/nc/netcupctl
+    XDG_CONFIG_HOME=/tmp/nc NETCUPCTL_API_URL=http://127.0.0.1:8080 netcupctl servers list
+
+Only the requests of the authenticated user are answered; any bearer token is
+accepted.
+"""
+
+import copy
+import hashlib
+import json
+import math
+import random
+import re
+import threading
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import parse_qs, unquote, urlsplit
+
+import click
+
+from netcupctl.config import ConfigManager
+from netcupctl.ratelimit import TokenBucket
+from netcupctl.testing import seed_data
+
+Reply = Tuple[int, Any]
+
+DEFAULT_MAX_PARTS = 10000
+_CHUNK_SIZE = 1024 * 1024
+
+
+def seed_tokens(config_dir: Path, user_id: str = "user_123") -> Path:
+    """Write tokens that netcupctl accepts without contacting the login server.
+
+    Args:
+        config_dir: netcupctl configuration directory, e.g. $XDG_CONFIG_HOME/netcupctl
+        user_id: User ID of the account served by the mock server
+
+    Returns:
+        Path of the written tokens file
+    """
+    config = ConfigManager()
+    config.config_dir = Path(config_dir)
+    config.tokens_file = config.config_dir / "tokens.json"
+    config.ensure_config_dir()
+    config.save_tokens({
+        "access_token": "mock-access-token",
+        "refresh_token": "mock-refresh-token",
+        "expires_at": (datetime.now() + timedelta(days=3650)).isoformat(),
+        "user_id": user_id,
+    })
+    return config.tokens_file
+
+
+def _mac(index: int) -> str:
+    """Return a unique, locally administered MAC address for the given index."""
+    return "02:00:" + ":".join(f"{byte:02x}" for byte in index.to_bytes(4, "big"))
+
+
+def _page(items: List[Any], query: Dict[str, str]) -> List[Any]:
+    """Apply the offset/limit query parameters of a list endpoint."""
+    offset = int(query.get("offset", 0) or 0)
+    if "limit" not in query:
+        return items[offset:]
+    return items[offset:offset + int(query["limit"])]
+
+
+class MockRequest:
+    """Request passed to the model; the body is read on demand."""
+
+    def __init__(self, method: str, path: str, query: Dict[str, str], rfile=None, length: int = 0,
+                 bandwidth: Optional[float] = None):
+        """Initialize request.
+
+        Args:
+            method: HTTP method
+            path: URL path without query string
+            query: Query parameters (first value of each)
+            rfile: Stream to read the body from
+            length: Content length of the body
+            bandwidth: Maximum bytes per second read by iter_chunks() (default: unlimited)
+        """
+        self.method = method
+        self.path = path
+        self.query = query
+        self._rfile = rfile
+        self._remaining = length if rfile is not None else 0
+        self.bandwidth = bandwidth
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes (everything if negative) of the remaining body."""
+        size = self._remaining if size < 0 else min(size, self._remaining)
+        data = self._rfile.read(size) if size else b""
+        self._remaining -= len(data)
+        if size and not data:
+            self._remaining = 0
+        return data
+
+    def json(self) -> Any:
+        """Return the decoded JSON body, or None if the body is empty or not JSON."""
+        data = self.read()
+        try:
+            return json.loads(data) if data else None
+        except ValueError:
+            return None
+
+    def iter_chunks(self) -> Iterator[bytes]:
+        """Yield the body in chunks, throttled to the configured bandwidth."""
+        started = time.monotonic()
+        received = 0
+        while self._remaining:
+            chunk = self.read(_CHUNK_SIZE)
+            if not chunk:
+                return
+            received += len(chunk)
+            if self.bandwidth:
+                delay = started + received / self.bandwidth - time.monotonic()
+                if delay > 0:
+                    time.sleep(delay)
+            yield chunk
+
+    def drain(self) -> None:
+        """Discard the unread body so the connection can be reused."""
+        while self._remaining:
+            if not self.read(_CHUNK_SIZE):
+                return
+
+
+def _route(method: str, template: str, locked: bool = True) -> Callable:
+    """Mark a MockScpModel method as handler of a path template with {param} segments.
+
+    Args:
+        method: HTTP method
+        template: Path template; a parameter matches one path segment
+        locked: Call the handler holding the model lock (otherwise it locks itself)
+    """
+    def decorate(handler: Callable) -> Callable:
+        handler.mock_routes = getattr(handler, "mock_routes", []) + [(method, template, locked)]
+        return handler
+    return decorate
+
+
+def _route_key(route: Tuple[str, str, bool]) -> Tuple[int, int]:
+    """Order templates with fewer parameters and more literal text first."""
+    return route[1].count("{"), -len(route[1])
+
+
+class MockScpModel:  # pylint: disable=too-many-instance-attributes,too-many-public-methods
+    """Thread-safe in-memory state of one SCP account.
+
+    Servers beyond the fixture list are cloned from the fixtures with unique
+    IDs, names and MAC addresses. Every interface firewall references policy
+    42; ``policies`` additional policies are not referenced anywhere and are
+    found by ``firewall cleanup``.
+    """
+
+    def __init__(self, servers: Optional[int] = None, policies: int = 0, logs: int = 100,
+                 max_parts: int = DEFAULT_MAX_PARTS, fixtures: Optional[ModuleType] = None):
+        """Initialize model.
+
+        Args:
+            servers: Number of servers (default: the servers of the fixtures)
+            policies: Number of unreferenced firewall policies added to the fixture policies
+            logs: Number of log entries per server and of the user log
+            max_parts: Highest part number accepted by multipart uploads
+            fixtures: Module with the seed responses (default: netcupctl.testing.seed_data)
+        """
+        self.fixtures = fixtures if fixtures is not None else seed_data
+        self.user_id = self.fixtures.USERINFO_RESPONSE["id"]
+        self.logs = logs
+        self.max_parts = max_parts
+        self.lock = threading.RLock()
+        self.servers: Dict[str, Dict[str, Any]] = {}
+        self.interfaces: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.firewalls: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self.snapshots: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.tasks: Dict[str, Dict[str, Any]] = {}
+        self.uploads: Dict[str, Dict[str, Any]] = {}
+        self.custom = {
+            "images": {item["key"]: copy.deepcopy(item) for item in self.fixtures.CUSTOM_IMAGE_LIST_RESPONSE},
+            "isos": {item["key"]: copy.deepcopy(item) for item in self.fixtures.CUSTOM_ISO_LIST_RESPONSE},
+        }
+        self.ssh_keys = copy.deepcopy(self.fixtures.SSH_KEY_LIST_RESPONSE)
+        self.policies = {p["id"]: copy.deepcopy(p) for p in self.fixtures.FIREWALL_POLICY_LIST_ONE_RESPONSE}
+        for index in range(policies):
+            self.policies[1000 + index] = {"id": 1000 + index, "name": f"orphan-{index}", "rules": []}
+        self._seed_servers(len(self.fixtures.SERVER_LIST_RESPONSE) if servers is None else servers)
+        routes = sorted(((route, name) for name in dir(type(self)) if not name.startswith("__")
+                         for route in getattr(getattr(type(self), name), "mock_routes", [])),
+                        key=lambda item: _route_key(item[0]))
+        self.routes = [
+            (method, re.compile(re.sub(r"\\\{(\w+)\\\}", r"(?P<\1>[^/]+)", re.escape(template)) + "$"),
+             locked, getattr(self, name))
+            for (method, template, locked), name in routes
+        ]
+
+    def _seed_servers(self, count: int) -> None:
+        templates = self.fixtures.SERVER_LIST_RESPONSE
+        for index in range(count):
+            template = templates[index % len(templates)]
+            server = copy.deepcopy(template)
+            if index >= len(templates):
+                server.update(id=f"srv-{100000 + index}", name=f"{template['name']}-{index}")
+            server_id = server["id"]
+            mac = _mac(index)
+            self.servers[server_id] = server
+            self.interfaces[server_id] = {mac: dict(self.fixtures.INTERFACE_LIST_RESPONSE[0], mac=mac)}
+            self.firewalls[(server_id, mac)] = copy.deepcopy(self.fixtures.FIREWALL_GET_RESPONSE)
+            self.snapshots[server_id] = {
+                snap["name"]: dict(snap, server_id=server_id) for snap in self.fixtures.SNAPSHOT_LIST_RESPONSE
+            }
+
+    def handle(self, request: MockRequest) -> Reply:
+        """Answer a request.
+
+        Args:
+            request: Request to answer
+
+        Returns:
+            Tuple of (HTTP status, body): a JSON-serializable body is sent as JSON,
+            a string as plain text and None as an empty body
+        """
+        for method, pattern, locked, handler in self.routes:
+            match = pattern.match(request.path)
+            if match and method == request.method:
+                params = {name: unquote(value) for name, value in match.groupdict().items()}
+                if params.pop("user_id", self.user_id) != self.user_id:
+                    return 403, {"message": "Access denied"}
+                if not locked:
+                    return handler(request, **params)
+                with self.lock:
+                    return handler(request, **params)
+        return 404, {"message": f"No route for {request.method} {request.path}"}
+
+    def _task(self, name: str) -> Dict[str, Any]:
+        task = dict(self.fixtures.TASK_RESPONSE, id=str(uuid.uuid4()), type=name)
+        self.tasks[task["id"]] = task
+        return task
+
+    def _server(self, server_id: str) -> Optional[Dict[str, Any]]:
+        return self.servers.get(server_id)
+
+    # General
+
+    @_route("GET", "/api/ping")
+    def ping(self, _request) -> Reply:
+        """Answer the health check."""
+        return 200, "pong"
+
+    @_route("GET", "/api/v1/maintenance")
+    def maintenance(self, _request) -> Reply:
+        """Report no maintenance."""
+        return 200, {}
+
+    # Servers
+
+    @_route("GET", "/api/v1/servers")
+    def list_servers(self, request) -> Reply:
+        """List the servers."""
+        return 200, _page(list(self.servers.values()), request.query)
+
+    @_route("GET", "/api/v1/servers/{server_id}")
+    def get_server(self, _request, server_id) -> Reply:
+        """Return a server with its live state."""
+        server = self._server(server_id)
+        if server is None:
+            return 404, {"message": "Server not found"}
+        state = "RUNNING" if server.get("status") == "running" else "SHUTOFF"
+        return 200, dict(self.fixtures.SERVER_DETAIL_RESPONSE, **server, hostname=server.get("name"),
+                         serverLiveInfo={"state": state})
+
+    @_route("PATCH", "/api/v1/servers/{server_id}")
+    def patch_server(self, request, server_id) -> Reply:
+        """Switch a server on or off."""
+        server = self._server(server_id)
+        if server is None:
+            return 404, {"message": "Server not found"}
+        state = (request.json() or {}).get("state")
+        if state in ("ON", "OFF"):
+            server["status"] = "running" if state == "ON" else "stopped"
+        return 202, self._task(f"server_{(state or 'update').lower()}")
+
+    @_route("GET", "/api/v1/servers/{server_id}/disks")
+    def list_disks(self, _request, server_id) -> Reply:
+        """List the disks of a server."""
+        if self._server(server_id) is None:
+            return 404, {"message": "Server not found"}
+        return 200, [dict(disk, server_id=server_id) for disk in self.fixtures.DISK_LIST_RESPONSE]
+
+    @_route("GET", "/api/v1/servers/{server_id}/logs")
+    def server_logs(self, request, server_id) -> Reply:
+        """Return a window of the server log."""
+        if self._server(server_id) is None:
+            return 404, {"message": "Server not found"}
+        return 200, self._logs(request, server_id)
+
+    @_route("GET", "/api/v1/servers/{server_id}/metrics/{kind}")
+    def metrics(self, _request, server_id, kind) -> Reply:  # pylint: disable=unused-argument
+        """Return the metrics of a server."""
+        if self._server(server_id) is None:
+            return 404, {"message": "Server not found"}
+        return 200, self.fixtures.METRICS_RESPONSE
+
+    # Snapshots
+
+    @_route("GET", "/api/v1/servers/{server_id}/snapshots")
+    def list_snapshots(self, _request, server_id) -> Reply:
+        """List the snapshots of a server."""
+        if server_id not in self.snapshots:
+            return 404, {"message": "Server not found"}
+        return 200, list(self.snapshots[server_id].values())
+
+    @_route("POST", "/api/v1/servers/{server_id}/snapshots")
+    def create_snapshot(self, request, server_id) -> Reply:
+        """Create a snapshot."""
+        body = request.json() or {}
+        if server_id not in self.snapshots or not body.get("name"):
+            return 422 if server_id in self.snapshots else 404, {"message": "Invalid snapshot"}
+        snapshot = dict(self.fixtures.SNAPSHOT_LIST_RESPONSE[0], id=str(uuid.uuid4()), server_id=server_id, **body)
+        self.snapshots[server_id][body["name"]] = snapshot
+        return 202, self._task("snapshot_create")
+
+    @_route("GET", "/api/v1/servers/{server_id}/snapshots/{name}")
+    def get_snapshot(self, _request, server_id, name) -> Reply:
+        """Return a snapshot."""
+        snapshot = self.snapshots.get(server_id, {}).get(name)
+        return (200, snapshot) if snapshot else (404, {"message": "Snapshot not found"})
+
+    @_route("DELETE", "/api/v1/servers/{server_id}/snapshots/{name}")
+    def delete_snapshot(self, _request, server_id, name) -> Reply:
+        """Delete a snapshot."""
+        if self.snapshots.get(server_id, {}).pop(name, None) is None:
+            return 404, {"message": "Snapshot not found"}
+        return 202, self._task("snapshot_delete")
+
+    @_route("POST", "/api/v1/servers/{server_id}/snapshots/{name}/{action}")
+    def snapshot_action(self, _request, server_id, name, action) -> Reply:
+        """Revert or export a snapshot."""
+        if name not in self.snapshots.get(server_id, {}) or action not in ("revert", "export"):
+            return 404, {"message": "Snapshot not found"}
+        return 202, self._task(f"snapshot_{action}")
+
+    # Interfaces and firewalls
+
+    @_route("GET", "/api/v1/servers/{server_id}/interfaces")
+    def list_interfaces(self, _request, server_id) -> Reply:
+        """List the interfaces of a server."""
+        if server_id not in self.interfaces:
+            return 404, {"message": "Server not found"}
+        return 200, list(self.interfaces[server_id].values())
+
+    @_route("GET", "/api/v1/servers/{server_id}/interfaces/{mac}")
+    def get_interface(self, _request, server_id, mac) -> Reply:
+        """Return an interface."""
+        interface = self.interfaces.get(server_id, {}).get(mac.lower())
+        return (200, interface) if interface else (404, {"message": "Interface not found"})
+
+    @_route("GET", "/api/v1/servers/{server_id}/interfaces/{mac}/firewall")
+    def get_firewall(self, _request, server_id, mac) -> Reply:
+        """Return the firewall of an interface."""
+        firewall = self.firewalls.get((server_id, mac.lower()))
+        return (200, firewall) if firewall else (404, {"message": "Interface not found"})
+
+    @_route("PUT", "/api/v1/servers/{server_id}/interfaces/{mac}/firewall")
+    def put_firewall(self, request, server_id, mac) -> Reply:
+        """Assign policies to the firewall of an interface."""
+        firewall = self.firewalls.get((server_id, mac.lower()))
+        if firewall is None:
+            return 404, {"message": "Interface not found"}
+        body = request.json() or {}
+        for field in ("copiedPolicies", "userPolicies"):
+            if field in body:
+                firewall[field] = [dict(self.policies.get(p.get("id"), {}), **p) for p in body[field]]
+        if "active" in body:
+            firewall["active"] = bool(body["active"])
+        return 202, self._task("firewall_update")
+
+    @_route("POST", "/api/v1/servers/{server_id}/interfaces/{mac}/firewall:reapply")
+    @_route("POST", "/api/v1/servers/{server_id}/interfaces/{mac}/firewall:restore-copied-policies")
+    def firewall_action(self, _request, server_id, mac) -> Reply:
+        """Reapply the firewall or restore its copied policies."""
+        if (server_id, mac.lower()) not in self.firewalls:
+            return 404, {"message": "Interface not found"}
+        return 202, self._task("firewall_apply")
+
+    # Tasks
+
+    @_route("GET", "/api/v1/tasks")
+    def list_tasks(self, request) -> Reply:
+        """List the tasks."""
+        return 200, _page(list(self.tasks.values()), request.query)
+
+    @_route("PUT", "/api/v1/tasks/{uuid}:cancel")
+    def cancel_task(self, _request, uuid) -> Reply:  # pylint: disable=redefined-outer-name
+        """Cancel a task."""
+        task = self.tasks.get(uuid)
+        if task is None:
+            return 404, {"message": "Task not found"}
+        task["status"] = "canceled"
+        return 200, task
+
+    @_route("GET", "/api/v1/tasks/{uuid}")
+    def get_task(self, _request, uuid) -> Reply:  # pylint: disable=redefined-outer-name
+        """Return a task."""
+        task = self.tasks.get(uuid)
+        return (200, task) if task else (404, {"message": "Task not found"})
+
+    # Users
+
+    @_route("GET", "/api/v1/users/{user_id}")
+    def get_user(self, _request) -> Reply:
+        """Return the user profile."""
+        return 200, dict(self.fixtures.USERINFO_RESPONSE)
+
+    @_route("GET", "/api/v1/users/{user_id}/logs")
+    def user_logs(self, request) -> Reply:
+        """Return a window of the user log."""
+        return 200, self._logs(request, None)
+
+    @_route("GET", "/api/v1/users/{user_id}/ssh-keys")
+    def list_ssh_keys(self, _request) -> Reply:
+        """List the SSH keys."""
+        return 200, self.ssh_keys
+
+    @_route("GET", "/api/v1/users/{user_id}/vlans")
+    def list_vlans(self, _request) -> Reply:
+        """List the VLANs."""
+        return 200, self.fixtures.VLAN_LIST_RESPONSE
+
+    @_route("GET", "/api/v1/users/{user_id}/failoverips/{version}")
+    def list_failover_ips(self, _request, version) -> Reply:  # pylint: disable=unused-argument
+        """List the failover IPs."""
+        return 200, self.fixtures.FAILOVER_IP_LIST_RESPONSE
+
+    def _logs(self, request: MockRequest, server_id: Optional[str]) -> List[Dict[str, Any]]:
+        """Generate the requested window of a log with self.logs entries."""
+        offset = int(request.query.get("offset", 0) or 0)
+        end = min(self.logs, offset + int(request.query.get("limit", self.logs) or self.logs))
+        return [{"id": index, "server_id": server_id, "message": f"Log entry {index}",
+                 "executed": (datetime(2024, 1, 1) + timedelta(minutes=index)).isoformat() + "Z"}
+                for index in range(offset, end)]
+
+    # Firewall policies
+
+    @_route("GET", "/api/v1/users/{user_id}/firewall-policies")
+    def list_policies(self, request) -> Reply:
+        """List the firewall policies."""
+        return 200, _page(list(self.policies.values()), request.query)
+
+    @_route("POST", "/api/v1/users/{user_id}/firewall-policies")
+    def create_policy(self, request) -> Reply:
+        """Create a firewall policy."""
+        policy_id = max(self.policies, default=0) + 1
+        self.policies[policy_id] = dict(request.json() or {}, id=policy_id)
+        return 201, self.policies[policy_id]
+
+    @_route("GET", "/api/v1/users/{user_id}/firewall-policies/{policy_id}")
+    def get_policy(self, _request, policy_id) -> Reply:
+        """Return a firewall policy."""
+        policy = self.policies.get(int(policy_id)) if policy_id.isdigit() else None
+        return (200, policy) if policy else (404, {"message": "Policy not found"})
+
+    @_route("PUT", "/api/v1/users/{user_id}/firewall-policies/{policy_id}")
+    def update_policy(self, request, policy_id) -> Reply:
+        """Replace a firewall policy."""
+        if not policy_id.isdigit() or int(policy_id) not in self.policies:
+            return 404, {"message": "Policy not found"}
+        self.policies[int(policy_id)] = dict(request.json() or {}, id=int(policy_id))
+        return 200, self.policies[int(policy_id)]
+
+    @_route("DELETE", "/api/v1/users/{user_id}/firewall-policies/{policy_id}")
+    def delete_policy(self, _request, policy_id) -> Reply:
+        """Delete a firewall policy."""
+        if not policy_id.isdigit() or self.policies.pop(int(policy_id), None) is None:
+            return 404, {"message": "Policy not found"}
+        return 204, None
+
+    # Custom images and ISOs (multipart uploads)
+
+    @_route("GET", "/api/v1/users/{user_id}/{kind}")
+    def list_custom(self, _request, kind) -> Reply:
+        """List the custom images or ISOs."""
+        if kind not in self.custom:
+            return 404, {"message": "Not found"}
+        return 200, list(self.custom[kind].values())
+
+    @_route("GET", "/api/v1/users/{user_id}/{kind}/{key}")
+    def get_custom(self, _request, kind, key) -> Reply:
+        """Return a custom image or ISO."""
+        item = self.custom.get(kind, {}).get(key)
+        return (200, item) if item else (404, {"message": "Not found"})
+
+    @_route("DELETE", "/api/v1/users/{user_id}/{kind}/{key}")
+    def delete_custom(self, _request, kind, key) -> Reply:
+        """Delete a custom image or ISO."""
+        if self.custom.get(kind, {}).pop(key, None) is None:
+            return 404, {"message": "Not found"}
+        return 204, None
+
+    @_route("POST", "/api/v1/users/{user_id}/{kind}/{key}")
+    def start_upload(self, _request, kind, key) -> Reply:
+        """Start a multipart upload."""
+        if kind not in self.custom:
+            return 404, {"message": "Not found"}
+        upload_id = uuid.uuid4().hex
+        self.uploads[upload_id] = {"kind": kind, "key": key, "parts": {}}
+        return 200, {"uploadId": upload_id}
+
+    @_route("PUT", "/api/v1/users/{user_id}/{kind}/{key}/{upload_id}/parts/{part_number}", locked=False)
+    def upload_part(self, request, kind, key, upload_id, part_number) -> Reply:
+        """Receive a part and answer its MD5 as ETag."""
+        with self.lock:
+            upload = self.uploads.get(upload_id)
+        if upload is None or (upload["kind"], upload["key"]) != (kind, key):
+            return 404, {"message": "Upload not found"}
+        if not part_number.isdigit() or not 1 <= int(part_number) <= self.max_parts:
+            return 400, {"message": f"Part number must be between 1 and {self.max_parts}"}
+        digest, size = hashlib.md5(), 0  # nosec - the ETag is a checksum, not a security feature
+        for chunk in request.iter_chunks():
+            digest.update(chunk)
+            size += len(chunk)
+        with self.lock:
+            upload["parts"][int(part_number)] = {"etag": digest.hexdigest(), "size": size}
+        return 200, {"etag": digest.hexdigest()}
+
+    @_route("POST", "/api/v1/users/{user_id}/{kind}/{key}/{upload_id}")
+    def complete_upload(self, request, kind, key, upload_id) -> Reply:
+        """Complete an upload whose parts are listed in order with their ETags."""
+        upload = self.uploads.get(upload_id)
+        if upload is None or (upload["kind"], upload["key"]) != (kind, key):
+            return 404, {"message": "Upload not found"}
+        parts = (request.json() or {}).get("parts") or []
+        stored = upload["parts"]
+        numbers = [part.get("partNumber") for part in parts]
+        if not parts or numbers != sorted(set(numbers)) or any(
+                stored.get(part.get("partNumber"), {}).get("etag") != part.get("etag") for part in parts):
+            return 400, {"message": "Parts missing, out of order or with wrong etag"}
+        del self.uploads[upload_id]
+        size = sum(stored[number]["size"] for number in numbers)
+        self.custom[kind][key] = {"key": key, "name": key, "size": size, "status": "available",
+                                  "created_at": datetime.now(timezone.utc).isoformat()}
+        return 200, dict(self.fixtures.UPLOAD_COMPLETE_RESPONSE, key=key, size=size)
+
+    @_route("DELETE", "/api/v1/users/{user_id}/{kind}/{key}/{upload_id}")
+    def abort_upload(self, _request, kind, key, upload_id) -> Reply:
+        """Abort an upload."""
+        upload = self.uploads.get(upload_id)
+        if upload is None or (upload["kind"], upload["key"]) != (kind, key):
+            return 404, {"message": "Upload not found"}
+        del self.uploads[upload_id]
+        return 204, None
+
+
+class _Throttle(TokenBucket):
+    """Token bucket rejecting requests instead of delaying them."""
+
+    def take(self) -> float:
+        """Take one token if available.
+
+        Returns:
+            0 if the request may be answered, otherwise seconds until a token is available
+        """
+        with self._lock:
+            now = time.monotonic()
+            tokens, wait = self._reserve(self._tokens, self._updated, now)
+            if wait > 0:
+                return wait
+            self._tokens, self._updated = tokens, now
+        return 0.0
+
+
+class MockServer:  # pylint: disable=too-many-instance-attributes
+    """HTTP server answering SCP API requests from a MockScpModel.
+
+    Faults are applied before a request reaches the model, in this order:
+    latency and jitter, throttling (429 with Retry-After), queued failures
+    from fail_next() and random errors.
+    """
+
+    def __init__(self, model: Optional[MockScpModel] = None, host: str = "127.0.0.1", port: int = 0,  # pylint: disable=too-many-arguments
+                 latency: float = 0.0, jitter: float = 0.0, error_rate: float = 0.0, error_status: int = 503,
+                 rate_limit: Optional[float] = None, burst: Optional[int] = None,
+                 upload_bandwidth: Optional[float] = None, seed: Optional[int] = None):
+        """Initialize server (call start() or use it as context manager to serve).
+
+        Args:
+            model: Account state (default: MockScpModel() seeded from the fixtures)
+            host: Address to listen on
+            port: Port to listen on (0: any free port)
+            latency: Seconds added to every response
+            jitter: Maximum random seconds added on top of latency
+            error_rate: Fraction of requests answered with error_status
+            error_status: HTTP status of random errors
+            rate_limit: Requests per second answered before responding 429 (default: unlimited)
+            burst: Requests answered back-to-back within the rate limit (default: max(1, rate_limit))
+            upload_bandwidth: Bytes per second received per connection for upload parts (default: unlimited)
+            seed: Seed of jitter and random errors, for reproducible runs
+        """
+        self.model = model if model is not None else MockScpModel()
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.throttle = _Throttle(rate_limit, burst) if rate_limit else None
+        self.upload_bandwidth = upload_bandwidth
+        self.requests: List[Tuple[str, str, int]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._failures: List[List[Any]] = []
+        self._httpd = ThreadingHTTPServer((host, port), _handler_class(self))
+        self._httpd.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """Base URL to pass as --api-url or NETCUPCTL_API_URL."""
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "MockServer":
+        """Serve requests in a background thread."""
+        self._thread = threading.Thread(target=self._httpd.serve_forever, name="mockserver", daemon=True)
+        self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve requests in the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and close the listening socket."""
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "MockServer":
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.stop()
+
+    def fail_next(self, status: int, count: int = 1, path_prefix: str = "") -> None:
+        """Answer the next requests below a path with an error.
+
+        Args:
+            status: HTTP status to respond with
+            count: Number of requests to fail
+            path_prefix: Only fail requests whose path starts with this prefix
+        """
+        with self._lock:
+            self._failures.append([status, count, path_prefix])
+
+    def _fault(self, path: str) -> Optional[Tuple[int, Dict[str, str]]]:
+        """Return the (status, headers) of an injected fault for this request, if any."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            random_error = self.error_rate and self._random.random() < self.error_rate
+        if delay:
+            time.sleep(delay)
+        wait = self.throttle.take() if self.throttle else 0.0
+        if wait:
+            return 429, {"Retry-After": str(max(1, math.ceil(wait)))}
+        with self._lock:
+            for failure in self._failures:
+                if path.startswith(failure[2]):
+                    failure[1] -= 1
+                    if not failure[1]:
+                        self._failures.remove(failure)
+                    return failure[0], {}
+        if random_error:
+            return self.error_status, {}
+        return None
+
+    def _log(self, method: str, path: str, status: int) -> None:
+        with self._lock:
+            self.requests.append((method, path, status))
+
+
+def _handler_class(server: MockServer) -> type:
+    """Create the request handler class bound to a MockServer."""
+
+    class Handler(BaseHTTPRequestHandler):
+        """Keep-alive handler dispatching every method to the model."""
+
+        protocol_version = "HTTP/1.1"
+        # Headers and body are written separately; without TCP_NODELAY every
+        # keep-alive response would wait for the client's delayed ACK
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args) -> None:
+            """Silence the default access log on stderr."""
+
+        def dispatch(self) -> None:
+            """Answer the request with an injected fault or the model's reply."""
+            url = urlsplit(self.path)
+            query = {name: values[0] for name, values in parse_qs(url.query).items()}
+            request = MockRequest(self.command, url.path, query, self.rfile,
+                                  int(self.headers.get("Content-Length") or 0), server.upload_bandwidth)
+            fault = server._fault(url.path)  # pylint: disable=protected-access
+            if fault is not None:
+                status, headers, body = fault[0], fault[1], {"message": f"Injected error (HTTP {fault[0]})"}
+            elif not self.headers.get("Authorization", "").startswith("Bearer "):
+                status, headers, body = 401, {}, {"message": "Invalid or expired token"}
+            else:
+                (status, body), headers = server.model.handle(request), {}
+            request.drain()
+            server._log(self.command, url.path, status)  # pylint: disable=protected-access
+            self.respond(status, body, headers)
+
+        def respond(self, status: int, body: Any, headers: Dict[str, str]) -> None:
+            """Send the status line, headers and the JSON (or text) body."""
+            if body is None:
+                payload, content_type = b"", None
+            elif isinstance(body, str):
+                payload, content_type = body.encode(), "text/plain"
+            else:
+                payload, content_type = json.dumps(body).encode(), "application/json"
+            self.send_response(status)
+            for name, value in headers.items():
+                self.send_header(name, value)
+            if content_type:
+                self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        do_GET = do_POST = do_PUT = do_PATCH = do_DELETE = dispatch
+
+    return Handler
+
+
+@click.command()
+@click.option("--host", default="127.0.0.1", show_default=True, help="Address to listen on")
+@click.option("--port", type=click.IntRange(0, 65535), default=8080, show_default=True, help="Port (0: any free port)")
+@click.option("--servers", type=click.IntRange(min=0), default=None, help="Number of servers (default: fixtures)")
+@click.option("--policies", type=click.IntRange(min=0), default=0, help="Unreferenced firewall policies to add")
+@click.option("--logs", type=click.IntRange(min=0), default=100, show_default=True, help="Log entries per log")
+@click.option("--latency", type=click.FloatRange(min=0), default=0.0, help="Seconds added to every response")
+@click.option("--jitter", type=click.FloatRange(min=0), default=0.0, help="Maximum random seconds added to latency")
+@click.option("--error-rate", type=click.FloatRange(0, 1), default=0.0, help="Fraction of requests failing")
+@click.option("--error-status", type=int, default=503, show_default=True, help="HTTP status of random errors")
+@click.option("--rate-limit", type=click.FloatRange(min=0, min_open=True), default=None,
+              help="Requests per second before answering 429")
+@click.option("--burst", type=click.IntRange(min=1), default=None, help="Requests allowed back-to-back")
+@click.option("--upload-bandwidth", type=click.FloatRange(min=0, min_open=True), default=None,
+              help="MB/s received per connection for upload parts")
+@click.option("--max-parts", type=click.IntRange(min=1), default=DEFAULT_MAX_PARTS, show_default=True,
+              help="Highest accepted upload part number")
+@click.option("--seed", type=int, default=None, help="Random seed for jitter and errors")
+@click.option("--seed-tokens", "tokens_dir", type=click.Path(file_okay=False, path_type=Path), default=None,
+              help="netcupctl configuration directory to write accepted tokens to")
+def main(tokens_dir, upload_bandwidth, servers, policies, logs, max_parts, **options):
+    """Serve a mock netcup SCP API until interrupted."""
+    model = MockScpModel(servers=servers, policies=policies, logs=logs, max_parts=max_parts)
+    mock = MockServer(model, upload_bandwidth=upload_bandwidth * 1024 * 1024 if upload_bandwidth else None,
+                      **options)
+    if tokens_dir is not None:
+        click.echo(f"Tokens written to {seed_tokens(tokens_dir, model.user_id)}")
+    click.echo(f"Serving {len(model.servers)} servers at {mock.url} (NETCUPCTL_API_URL={mock.url})")
+    try:
+        mock.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        mock.stop()
+
+
+if __name__ == "__main__":
+    main()  # pylint: disable=no-value-for-parameter
@@ -0,0 +1,181 @@
+"""Seed data of the mock SCP API server: one account with two servers and their resources."""
+
+SERVER_LIST_RESPONSE = [
+    {
+        "id": "srv-12345",
+        "name": "web-server-01",
+        "status": "running",
+        "ipv4": "203.0.113.10",
+        "ipv6": "2001:db8::1",
+        "cpu": 4,
+        "memory": 8192,
+        "disk": 100,
+    },
+    {
+        "id": "srv-67890",
+        "name": "db-server-01",
+        "status": "stopped",
+        "ipv4": "203.0.113.20",
+        "ipv6": "2001:db8::2",
+        "cpu": 8,
+        "memory": 16384,
+        "disk": 500,
+    },
+]
+
+SERVER_DETAIL_RESPONSE = {
+    "id": "srv-12345",
+    "name": "web-server-01",
+    "status": "running",
+    "ipv4": "203.0.113.10",
+    "ipv6": "2001:db8::1",
+    "cpu": 4,
+    "memory": 8192,
+    "disk": 100,
+    "created_at": "2024-01-15T10:30:00Z",
+    "datacenter": "NBG1",
+}
+
+DISK_LIST_RESPONSE = [
+    {
+        "id": "disk-001",
+        "name": "system-disk",
+        "size": 100,
+        "type": "ssd",
+        "server_id": "srv-12345",
+    },
+    {
+        "id": "disk-002",
+        "name": "data-disk",
+        "size": 500,
+        "type": "hdd",
+        "server_id": "srv-12345",
+    },
+]
+
+SNAPSHOT_LIST_RESPONSE = [
+    {
+        "id": "snap-001",
+        "name": "backup-2024-01-15",
+        "created_at": "2024-01-15T00:00:00Z",
+        "size": 50,
+        "server_id": "srv-12345",
+    },
+]
+
+SSH_KEY_LIST_RESPONSE = [
+    {
+        "id": "key-001",
+        "name": "my-laptop",
+        "fingerprint": "SHA256:abcdef123456",
+        "created_at": "2024-01-01T00:00:00Z",
+    },
+]
+
+VLAN_LIST_RESPONSE = [
+    {
+        "id": "vlan-001",
+        "name": "internal",
+        "vlan_id": 100,
+        "servers": ["srv-12345", "srv-67890"],
+    },
+]
+
+INTERFACE_LIST_RESPONSE = [
+    {
+        "id": "iface-001",
+        "name": "eth0",
+        "mac": "00:11:22:33:44:55",
+        "ipv4": "203.0.113.10",
+        "ipv6": "2001:db8::1",
+        "type": "public",
+    },
+]
+
+TASK_RESPONSE = {
+    "id": "task-001",
+    "type": "server_start",
+    "status": "completed",
+    "progress": 100,
+    "created_at": "2024-01-15T10:00:00Z",
+    "completed_at": "2024-01-15T10:01:00Z",
+}
+
+METRICS_RESPONSE = {
+    "cpu": {"current": 45.2, "average": 30.5, "peak": 95.0},
+    "memory": {"current": 4096, "total": 8192, "percent": 50.0},
+    "disk": {"read_iops": 150, "write_iops": 75, "latency_ms": 2.5},
+    "network": {"rx_bytes": 1073741824, "tx_bytes": 536870912},
+}
+
+USERINFO_RESPONSE = {
+    "sub": "user_123",
+    "id": "user_123",
+    "preferred_username": "testuser",
+    "email": "test@example.com",
+}
+
+CUSTOM_IMAGE_LIST_RESPONSE = [
+    {
+        "key": "my-ubuntu-2204",
+        "name": "Ubuntu 22.04 Custom",
+        "size": 2147483648,
+        "created_at": "2024-01-15T10:00:00Z",
+        "status": "available",
+    },
+    {
+        "key": "my-debian-12",
+        "name": "Debian 12 Custom",
+        "size": 1073741824,
+        "created_at": "2024-01-10T09:00:00Z",
+        "status": "available",
+    },
+]
+
+UPLOAD_COMPLETE_RESPONSE = {
+    "key": "my-new-image",
+    "status": "processing",
+    "message": "Upload completed successfully",
+}
+
+CUSTOM_ISO_LIST_RESPONSE = [
+    {
+        "key": "my-rescue-iso",
+        "name": "Custom Rescue ISO",
+        "size": 524288000,
+        "created_at": "2024-01-12T14:00:00Z",
+        "status": "available",
+    },
+]
+
+FAILOVER_IP_LIST_RESPONSE = [
+    {
+        "id": "fip-001",
+        "ip": "203.0.113.100",
+        "server_id": "srv-12345",
+        "status": "active",
+        "created_at": "2024-01-10T00:00:00Z",
+    },
+    {
+        "id": "fip-002",
+        "ip": "203.0.113.101",
+        "server_id": None,
+        "status": "unassigned",
+        "created_at": "2024-01-12T00:00:00Z",
+    },
+]
+
+# Firewall of every interface (ServerFirewall schema)
+FIREWALL_GET_RESPONSE = {
+    "copiedPolicies": [],
+    "userPolicies": [{"id": 42, "name": "ssh-policy", "rules": []}],
+    "ingressImplicitRule": "ACCEPT_ALL",
+    "egressImplicitRule": "ACCEPT_ALL",
+    "consistent": True,
+    "active": True,
+}
+
+# The policy referenced by every interface firewall
+FIREWALL_POLICY_LIST_ONE_RESPONSE = [
+    {"id": 42, "name": "my-policy", "description": "", "rules": []},
+]
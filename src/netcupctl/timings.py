@@ -0,0 +1,143 @@
+"""Timing instrumentation behind the --timings option."""
+
+import json
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+# Connection phases of one HTTP attempt, in the order they happen.
+HTTP_PHASES = ("dns", "connect", "tls", "send", "ttfb", "download")
+
+_local = threading.local()
+
+
+@contextmanager
+def collect_http_phases() -> Iterator[Dict[str, float]]:
+    """Collect the connection phases recorded by the current thread.
+
+    While the context is active, the instrumented HTTP adapter (see
+    netcupctl.transport) adds the seconds spent in DNS lookup, connect, TLS
+    handshake, sending and waiting for the first response byte to the
+    yielded dictionary. Outside of it nothing is recorded.
+
+    Yields:
+        Dictionary of phase name to seconds
+    """
+    previous = getattr(_local, "phases", None)
+    phases: Dict[str, float] = {}
+    _local.phases = phases
+    try:
+        yield phases
+    finally:
+        _local.phases = previous
+
+
+def collecting() -> bool:
+    """Return True if the current thread collects HTTP phases."""
+    return getattr(_local, "phases", None) is not None
+
+
+def record_phase(name: str, seconds: float) -> None:
+    """Add seconds to a connection phase of the current thread (no-op when not collecting)."""
+    phases = getattr(_local, "phases", None)
+    if phases is not None:
+        phases[name] = phases.get(name, 0.0) + seconds
+
+
+def recorded_total() -> float:
+    """Return the seconds recorded so far by the current thread."""
+    phases = getattr(_local, "phases", None)
+    return sum(phases.values()) if phases else 0.0
+
+
+class Timings:
+    """Durations of one CLI invocation: start-up, authentication, HTTP, decoding and rendering.
+
+    Thread-safe, so requests fanned out to worker threads report into the
+    same instance.
+    """
+
+    def __init__(self):
+        """Initialize timings."""
+        self._lock = threading.Lock()
+        self.phases: Dict[str, List[float]] = {}
+        self.requests: List[Dict[str, Any]] = []
+
+    def add(self, name: str, seconds: float) -> None:
+        """Record one duration of a phase.
+
+        Args:
+            name: Phase name, e.g. "auth.token"
+            seconds: Duration in seconds
+        """
+        with self._lock:
+            self.phases.setdefault(name, []).append(seconds)
+
+    @contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Record the duration of the with-block as a phase."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(name, time.perf_counter() - start)
+
+    def add_request(self, method: str, path: str, status: Optional[int], seconds: float,
+                    phases: Dict[str, float]) -> None:
+        """Record one HTTP attempt.
+
+        Time not spent in the collected connection phases (reading the
+        body, requests overhead) is attributed to "download".
+
+        Args:
+            method: HTTP method
+            path: API path
+            status: HTTP status code, or None if no response was received
+            seconds: Total duration of the attempt
+            phases: Connection phases collected by collect_http_phases()
+        """
+        record: Dict[str, Any] = {"method": method.upper(), "path": path, "status": status}
+        for phase in HTTP_PHASES[:-1]:
+            record[phase] = phases.get(phase, 0.0)
+        record["download"] = max(0.0, seconds - sum(phases.values()))
+        record["total"] = seconds
+        with self._lock:
+            self.requests.append(record)
+        self.add("http", seconds)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return all timings in seconds as a JSON-serializable dictionary."""
+        with self._lock:
+            phases = {
+                name: {"count": len(values), "total": sum(values), "max": max(values)}
+                for name, values in self.phases.items()
+            }
+            return {"phases": phases, "requests": [dict(r) for r in self.requests]}
+
+    def write(self, path: Path) -> None:
+        """Write the timings as JSON.
+
+        Args:
+            path: Output file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def format_summary(self) -> str:
+        """Return a plain-text summary table with durations in milliseconds."""
+        data = self.to_dict()
+        lines = [f"{'phase':<32} {'count':>6} {'total ms':>10} {'max ms':>10}"]
+        for name, phase in data["phases"].items():
+            lines.append(f"{name:<32} {phase['count']:>6} {phase['total'] * 1000:>10.1f} {phase['max'] * 1000:>10.1f}")
+
+        if data["requests"]:
+            columns = "".join(f" {phase:>8}" for phase in HTTP_PHASES + ("total",))
+            lines.extend(["", f"{'request':<40} {'status':>6}{columns}"])
+            for request in data["requests"]:
+                label = f"{request['method']} {request['path']}"
+                values = "".join(f" {request[phase] * 1000:>8.1f}" for phase in HTTP_PHASES + ("total",))
+                lines.append(f"{label[:40]:<40} {request['status'] or '-':>6}{values}")
+        return "\n".join(lines)
@@ -0,0 +1,208 @@
+"""Span tracing behind the --trace-file option.
+
+Spans are written in the Chrome trace event format, which chrome://tracing
+and https://ui.perfetto.dev open directly, so no collector is needed.
+
+The span a piece of code runs in is kept in a context variable. Work handed
+to thread pools must run in a copy of the submitting context (see bind())
+so its spans nest under the span that fanned it out; such cross-thread
+parent/child pairs are also linked with flow arrows in the trace viewer.
+When no trace is active, span() does nothing.
+"""
+
+import contextvars
+import functools
+import itertools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+_current: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar("netcupctl_span", default=None)
+
+
+def _microseconds(seconds: float) -> float:
+    return round(seconds * 1_000_000, 3)
+
+
+class Span:
+    """One timed operation of a trace."""
+
+    def __init__(self, tracer: "Tracer", span_id: int, name: str, category: str,
+                 parent: Optional["Span"], start: float, args: Dict[str, Any]):
+        """Initialize span (use Tracer.start() or span() to create one).
+
+        Args:
+            tracer: Tracer the span is reported to
+            span_id: Unique ID within the trace
+            name: Span name shown in the trace viewer
+            category: Span category, e.g. "http" or "render"
+            parent: Enclosing span, if any
+            start: Start time (time.perf_counter())
+            args: Attributes shown with the span
+        """
+        self.tracer = tracer
+        self.span_id = span_id
+        self.name = name
+        self.category = category
+        self.parent = parent
+        self.start = start
+        self.args = args
+        self.thread_id = threading.get_native_id()
+        self.thread_name = threading.current_thread().name
+
+    def set(self, **args: Any) -> None:
+        """Add attributes to the span."""
+        self.args.update(args)
+
+    def end(self, end: Optional[float] = None) -> None:
+        """Finish the span and report it to the tracer.
+
+        Args:
+            end: End time (time.perf_counter()), default now
+        """
+        self.tracer.record(self, (end if end is not None else time.perf_counter()) - self.start)
+
+
+class Tracer:
+    """Collects the spans of one CLI invocation and writes them as a Chrome trace.
+
+    Thread-safe; spans may start and end on any thread.
+    """
+
+    def __init__(self):
+        """Initialize tracer."""
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+        self._events: List[Dict[str, Any]] = []
+        self._threads: Dict[int, str] = {}
+        self.pid = os.getpid()
+
+    def start(self, name: str, category: str, parent: Optional[Span] = None, start: Optional[float] = None,
+              **args: Any) -> Span:
+        """Start a span.
+
+        Args:
+            name: Span name
+            category: Span category
+            parent: Enclosing span, if any
+            start: Start time (time.perf_counter()), default now
+            **args: Attributes shown with the span
+
+        Returns:
+            The started span; call its end() method to record it
+        """
+        return Span(self, next(self._ids), name, category, parent,
+                    start if start is not None else time.perf_counter(), args)
+
+    def record(self, finished: Span, seconds: float) -> None:
+        """Record a finished span.
+
+        Args:
+            finished: The span
+            seconds: Duration of the span
+        """
+        parent = finished.parent
+        args = dict(finished.args, span_id=finished.span_id)
+        if parent is not None:
+            args["parent_id"] = parent.span_id
+        events = [{
+            "name": finished.name, "cat": finished.category, "ph": "X", "pid": self.pid, "tid": finished.thread_id,
+            "ts": _microseconds(finished.start), "dur": _microseconds(max(0.0, seconds)), "args": args,
+        }]
+        if parent is not None and parent.thread_id != finished.thread_id:
+            # Flow arrow from the parent's thread to the worker thread the span ran on
+            flow = {"name": "fan-out", "cat": "flow", "id": finished.span_id, "pid": self.pid,
+                    "ts": _microseconds(finished.start)}
+            events.append(dict(flow, ph="s", tid=parent.thread_id))
+            events.append(dict(flow, ph="f", bp="e", tid=finished.thread_id))
+        with self._lock:
+            self._threads.setdefault(finished.thread_id, finished.thread_name)
+            self._events.extend(events)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the trace in Chrome trace event format."""
+        with self._lock:
+            metadata = [{"name": "process_name", "ph": "M", "pid": self.pid, "tid": 0, "args": {"name": "netcupctl"}}]
+            metadata.extend(
+                {"name": "thread_name", "ph": "M", "pid": self.pid, "tid": tid, "args": {"name": name}}
+                for tid, name in self._threads.items()
+            )
+            return {"traceEvents": metadata + self._events, "displayTimeUnit": "ms"}
+
+    def write(self, path: Path) -> None:
+        """Write the trace as JSON.
+
+        Args:
+            path: Output file
+        """
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f)
+            f.write("\n")
+
+
+def current() -> Optional[Span]:
+    """Return the span the calling code runs in, or None if no trace is active."""
+    return _current.get()
+
+
+def activate(active: Span) -> contextvars.Token:
+    """Make a span the current span of this context.
+
+    Args:
+        active: Span that enclosing code runs in from now on
+
+    Returns:
+        Token restoring the previous span with deactivate()
+    """
+    return _current.set(active)
+
+
+def deactivate(token: contextvars.Token) -> None:
+    """Restore the span that was current before activate()."""
+    _current.reset(token)
+
+
+@contextmanager
+def span(name: str, category: str, **args: Any) -> Iterator[Optional[Span]]:
+    """Trace the with-block as a child of the current span.
+
+    Args:
+        name: Span name
+        category: Span category
+        **args: Attributes shown with the span
+
+    Yields:
+        The span (to add attributes), or None if no trace is active
+    """
+    parent = _current.get()
+    if parent is None:
+        yield None
+        return
+    child = parent.tracer.start(name, category, parent=parent, **args)
+    token = _current.set(child)
+    try:
+        yield child
+    except BaseException as exc:
+        child.set(error=type(exc).__name__)
+        raise
+    finally:
+        _current.reset(token)
+        child.end()
+
+
+def bind(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Return func bound to a copy of the current context, for running it on another thread.
+
+    The returned callable may be called once; bind again for every submitted task.
+
+    Args:
+        func: Callable to run on a worker thread
+
+    Returns:
+        Callable running func in the copied context
+    """
+    return functools.partial(contextvars.copy_context().run, func)
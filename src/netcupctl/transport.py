@@ -0,0 +1,86 @@
+"""Instrumented HTTP transport reporting connection phases.
+
+The connection classes time DNS lookup, TCP connect, TLS handshake, sending
+the request and waiting for the response headers, and report them through
+netcupctl.timings. Nothing is measured unless the calling thread collects
+phases (see timings.collect_http_phases), so the adapter is always mounted
+and costs one attribute lookup per connection event otherwise.
+"""
+
+import socket
+import time
+from typing import Any, Callable
+
+from requests.adapters import HTTPAdapter
+from urllib3.connection import HTTPConnection, HTTPSConnection
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+
+from netcupctl.timings import collecting, record_phase, recorded_total
+
+
+def _timed(name: str, func: Callable[..., Any], *args, **kwargs) -> Any:
+    """Call func and record its duration, excluding phases recorded inside it."""
+    if not collecting():
+        return func(*args, **kwargs)
+    nested = recorded_total()
+    start = time.perf_counter()
+    try:
+        return func(*args, **kwargs)
+    finally:
+        record_phase(name, time.perf_counter() - start - (recorded_total() - nested))
+
+
+class _TimingMixin:
+    """Times the phases shared by HTTP and HTTPS connections."""
+
+    def _new_conn(self):
+        if collecting():
+            # Resolved separately so the lookup can be told apart from the TCP connect;
+            # the connect below normally hits the resolver cache.
+            start = time.perf_counter()
+            try:
+                socket.getaddrinfo(self._dns_host, self.port, 0, socket.SOCK_STREAM)
+            except OSError:
+                pass  # reported by the connection attempt
+            record_phase("dns", time.perf_counter() - start)
+        return _timed("connect", super()._new_conn)
+
+    def request(self, *args, **kwargs):
+        """Send the request line, headers and body."""
+        return _timed("send", super().request, *args, **kwargs)
+
+    def getresponse(self, *args, **kwargs):
+        """Wait for and parse the response headers (time to first byte)."""
+        return _timed("ttfb", super().getresponse, *args, **kwargs)
+
+
+class TimedHTTPConnection(_TimingMixin, HTTPConnection):
+    """HTTP connection reporting its phases."""
+
+
+class TimedHTTPSConnection(_TimingMixin, HTTPSConnection):
+    """HTTPS connection reporting its phases, including the TLS handshake."""
+
+    def connect(self):
+        """Connect and perform the TLS handshake."""
+        return _timed("tls", super().connect)  # pylint: disable=no-member
+
+
+class _TimedHTTPConnectionPool(HTTPConnectionPool):
+    ConnectionCls = TimedHTTPConnection
+
+
+class _TimedHTTPSConnectionPool(HTTPSConnectionPool):
+    ConnectionCls = TimedHTTPSConnection
+
+
+class TimedHTTPAdapter(HTTPAdapter):
+    """Requests adapter whose connections report their phases to netcupctl.timings."""
+
+    def init_poolmanager(self, *args, **kwargs):
+        """Create the pool manager with instrumented connection pools."""
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _TimedHTTPConnectionPool,
+            "https": _TimedHTTPSConnectionPool,
+        }
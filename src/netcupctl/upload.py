@@ -0,0 +1,554 @@
+"""Multipart upload of custom images and ISOs with parts sent in parallel."""
+
+import hashlib
+import os
+import re
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import quote
+
+from netcupctl import tracing
+from netcupctl.client import APIError
+
+MB = 1024 * 1024
+MIN_PART_SIZE = 8 * MB
+MAX_PART_SIZE = 256 * MB
+MAX_PARTS = 10000
+DEFAULT_PARALLEL_PARTS = 4
+THROUGHPUT_GAIN = 1.1
+HASH_BLOCK_SIZE = MB
+_MD5_ETAG = re.compile(r'^"?([0-9a-fA-F]{32})"?$')
+
+
+class Part(NamedTuple):
+    """A byte range of the uploaded file; numbers start at 1."""
+
+    number: int
+    offset: int
+    size: int
+
+
+def split_range(first_number: int, count: int, offset: int, length: int) -> List[Part]:
+    """Split a byte range into at most count parts of equal size, numbered from first_number.
+
+    Args:
+        first_number: Number of the first part
+        count: Number of part numbers available for the range
+        offset: Start of the range
+        length: Length of the range in bytes
+
+    Returns:
+        Consecutive parts covering the range; none for an empty range
+
+    Raises:
+        ValueError: If a non-empty range has no part numbers available
+    """
+    if length <= 0:
+        return []
+    if count < 1:
+        raise ValueError(f"No part number left for bytes {offset}-{offset + length - 1}")
+    size = -(-length // count)
+    return [
+        Part(number, start, min(size, offset + length - start))
+        for number, start in enumerate(range(offset, offset + length, size), start=first_number)
+    ]
+
+
+class PartTuner:
+    """Part size and number of parts in flight, tuned from the measured throughput.
+
+    Starts with small parts and two parts in flight. Whenever a round of
+    parts (one per part in flight) has finished, the throughput of the round
+    is compared with the best one so far: while it rises by at least
+    THROUGHPUT_GAIN, the part size doubles and one more part is sent in
+    parallel; once it stops rising the settings are kept. Parts always grow
+    enough for the rest of the file to fit into the remaining part numbers.
+    """
+
+    def __init__(self, file_size: int, max_parallel: int, part_size: Optional[int] = None):
+        """Initialize tuner.
+
+        Args:
+            file_size: Size of the uploaded file in bytes
+            max_parallel: Upper bound for the parts in flight
+            part_size: Fixed part size, disabling its tuning
+        """
+        self.fixed_size = part_size is not None
+        self.part_size = part_size or max(MIN_PART_SIZE, -(-file_size // MAX_PARTS))
+        self.max_parallel = max(1, max_parallel)
+        self.parallel = min(2, self.max_parallel)
+        self.tuning = True
+        self._best = 0.0
+        self._round_start = time.monotonic()
+        self._round_bytes = 0
+        self._round_parts = 0
+
+    def next_size(self, remaining: int, numbers_left: int) -> int:
+        """Return the size of the next part.
+
+        Args:
+            remaining: Bytes of the file not planned yet
+            numbers_left: Part numbers still available
+
+        Returns:
+            Part size in bytes
+
+        Raises:
+            ValueError: If no part number is left
+        """
+        if numbers_left < 1:
+            raise ValueError(f"File needs more than {MAX_PARTS} parts")
+        return min(remaining, max(self.part_size, -(-remaining // numbers_left)))
+
+    def finished(self, size: int) -> bool:
+        """Account a finished part and adjust the settings after a full round.
+
+        Args:
+            size: Size of the finished part in bytes
+
+        Returns:
+            True if the settings changed
+        """
+        self._round_bytes += size
+        self._round_parts += 1
+        if not self.tuning or self._round_parts < self.parallel:
+            return False
+
+        now = time.monotonic()
+        throughput = self._round_bytes / max(now - self._round_start, 1e-6)
+        self._round_start, self._round_bytes, self._round_parts = now, 0, 0
+        if throughput < self._best * THROUGHPUT_GAIN:
+            self.tuning = False
+            return False
+
+        self._best = throughput
+        if not self.fixed_size:
+            self.part_size = min(self.part_size * 2, MAX_PART_SIZE)
+        self.parallel = min(self.parallel + 1, self.max_parallel)
+        self.tuning = self.parallel < self.max_parallel or (not self.fixed_size and self.part_size < MAX_PART_SIZE)
+        return True
+
+
+def _fingerprint(file: str) -> Dict[str, Any]:
+    """Return the attributes identifying the uploaded version of a file."""
+    stat = os.stat(file)
+    return {"file": os.path.abspath(file), "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+
+
+def file_sha256(file: str) -> str:
+    """Return the SHA-256 hex digest of a file, reading it in blocks.
+
+    Args:
+        file: Path of the file
+
+    Returns:
+        Hex digest
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    digest = hashlib.sha256()
+    with open(file, "rb") as f:
+        for block in iter(lambda: f.read(HASH_BLOCK_SIZE), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class FileWindow:
+    """Read-only file object over a byte range of a file.
+
+    Passed as request body, requests streams the range in small blocks
+    instead of loading it, so memory use does not depend on the part size.
+    The MD5 of the range is computed while it is read from its start.
+    """
+
+    def __init__(self, file: str, offset: int, size: int):
+        """Open the window.
+
+        Args:
+            file: Path of the file
+            offset: Start of the range
+            size: Length of the range in bytes
+        """
+        self._file = open(file, "rb")  # pylint: disable=consider-using-with
+        self.offset = offset
+        self.size = size
+        self._position = 0
+        self._md5 = hashlib.md5()  # nosec - compared with MD5 ETags, not a security feature
+        self._hashed = 0
+        self._file.seek(offset)
+
+    @property
+    def md5(self) -> Optional[str]:
+        """MD5 hex digest of the range, once it has been read to its end."""
+        return self._md5.hexdigest() if self._hashed == self.size else None
+
+    def __len__(self) -> int:
+        return self.size
+
+    def __enter__(self) -> "FileWindow":
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def read(self, size: int = -1) -> bytes:
+        """Read up to size bytes (the rest of the range if negative)."""
+        remaining = self.size - self._position
+        data = self._file.read(remaining if size < 0 else min(size, remaining))
+        if self._hashed == self._position:
+            self._md5.update(data)
+            self._hashed += len(data)
+        self._position += len(data)
+        return data
+
+    def seek(self, position: int, whence: int = os.SEEK_SET) -> int:
+        """Move to a position relative to the start, current position or end of the range."""
+        base = {os.SEEK_SET: 0, os.SEEK_CUR: self._position, os.SEEK_END: self.size}[whence]
+        self._position = min(max(base + position, 0), self.size)
+        if self._position == 0:
+            self._md5 = hashlib.md5()  # nosec - compared with MD5 ETags, not a security feature
+            self._hashed = 0
+        self._file.seek(self.offset + self._position)
+        return self._position
+
+    def tell(self) -> int:
+        """Return the position within the range."""
+        return self._position
+
+    def close(self) -> None:
+        """Close the underlying file."""
+        self._file.close()
+
+
+class UploadJournal:
+    """Journal of an unfinished multipart upload, kept in the config dir.
+
+    Records the upload ID, the file the upload was started for and the byte
+    range and ETag of every sent part. It is saved after each part, so an
+    interrupted upload can be continued by sending only the missing parts.
+    """
+
+    def __init__(self, config, user_id: str, kind: str, key: str):
+        """Initialize journal.
+
+        Args:
+            config: ConfigManager of the config dir
+            user_id: Owner of the upload
+            kind: Collection of the upload, "images" or "isos"
+            key: Name of the uploaded image or ISO
+        """
+        self.config = config
+        self.user_id = user_id
+        self.path = config.uploads_dir / f"{kind}-{quote(key, safe='')}.json"
+        self.state: Dict[str, Any] = {}
+
+    @property
+    def upload_id(self) -> str:
+        """ID of the journaled upload."""
+        return self.state["uploadId"]
+
+    @property
+    def parts(self) -> Dict[int, Tuple[Part, str]]:
+        """Sent parts and their ETags by part number."""
+        return {
+            int(number): (Part(int(number), part["offset"], part["size"]), part["etag"])
+            for number, part in self.state.get("parts", {}).items()
+        }
+
+    def load(self, file: str) -> bool:
+        """Load the journal of an interrupted upload of file.
+
+        Args:
+            file: Path of the file to upload
+
+        Returns:
+            True if an interrupted upload was found
+
+        Raises:
+            ValueError: If the file changed since the interrupted upload was started
+        """
+        state = self.config.load_json(self.path)
+        if not state or state.get("user_id") != self.user_id:
+            return False
+        current = _fingerprint(file)
+        if (state.get("size"), state.get("mtime_ns")) != (current["size"], current["mtime_ns"]):
+            raise ValueError(f"{file} changed since the interrupted upload was started")
+        self.state = state
+        return True
+
+    def journaled_upload_id(self) -> Optional[str]:
+        """Return the ID of the upload of the key journaled for the user, whatever file it was of."""
+        state = self.config.load_json(self.path)
+        if isinstance(state, dict) and state.get("user_id") == self.user_id:
+            return state.get("uploadId")
+        return None
+
+    def start(self, upload_id: str, file: str) -> None:
+        """Journal a newly initiated upload, replacing any previous one of the key.
+
+        Args:
+            upload_id: ID returned by the upload initiation
+            file: Path of the uploaded file
+        """
+        self.state = {"user_id": self.user_id, "uploadId": upload_id, **_fingerprint(file), "parts": {}}
+        self.save()
+
+    def record(self, part: Part, etag: str) -> None:
+        """Journal a sent part.
+
+        Args:
+            part: The sent part
+            etag: ETag returned for the part
+        """
+        self.state["parts"][str(part.number)] = {"offset": part.offset, "size": part.size, "etag": etag}
+        self.save()
+
+    def save(self) -> None:
+        """Write the journal file."""
+        self.path.parent.mkdir(parents=True, exist_ok=True, mode=0o700)
+        self.config.save_json(self.path, self.state)
+
+    def delete(self) -> None:
+        """Remove the journal file of a completed or aborted upload."""
+        self.config.delete_file(self.path)
+
+
+class UploadManifest:
+    """Local record of the content uploaded under an image or ISO key.
+
+    Keeps the SHA-256, size and modification time of the file last uploaded
+    under every key, so an unchanged file can be detected without uploading
+    it again and, while its size and modification time are the same, without
+    hashing it again.
+    """
+
+    def __init__(self, config, user_id: str, kind: str, key: str):
+        """Initialize manifest entry.
+
+        Args:
+            config: ConfigManager of the config dir
+            user_id: Owner of the image or ISO
+            kind: Collection of the upload, "images" or "isos"
+            key: Name of the image or ISO
+        """
+        self.config = config
+        self.name = f"{user_id}/{kind}/{key}"
+
+    @property
+    def entry(self) -> Optional[Dict[str, Any]]:
+        """Recorded upload of the key, if any."""
+        manifest = self.config.load_json(self.config.upload_manifest_file)
+        return manifest.get(self.name) if isinstance(manifest, dict) else None
+
+    def digest(self, file: str) -> str:
+        """Return the SHA-256 of a file, reusing the recorded one if the file was not modified since.
+
+        Args:
+            file: Path of the file
+
+        Returns:
+            Hex digest
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        entry = self.entry
+        current = _fingerprint(file)
+        if entry and (entry.get("size"), entry.get("mtime_ns")) == (current["size"], current["mtime_ns"]):
+            return entry["sha256"]
+        return file_sha256(file)
+
+    def unchanged(self, sha256: str, remote: Optional[Dict[str, Any]]) -> bool:
+        """Return whether the content with this SHA-256 is what the key holds on the server.
+
+        Args:
+            sha256: SHA-256 of the file to upload
+            remote: Metadata of the image or ISO on the server, None if it does not exist
+
+        Returns:
+            True if the recorded upload has the same SHA-256 and the remote
+            metadata agrees with it (same size and, if provided, checksum)
+        """
+        entry = self.entry
+        if not entry or entry.get("sha256") != sha256 or not isinstance(remote, dict):
+            return False
+        if remote.get("size") is not None and remote["size"] != entry.get("size"):
+            return False
+        checksum = remote.get("sha256") or remote.get("checksum")
+        return not checksum or str(checksum).lower().rsplit(":", maxsplit=1)[-1] == sha256
+
+    def record(self, file: str, sha256: str) -> None:
+        """Record an uploaded file.
+
+        Args:
+            file: Path of the uploaded file
+            sha256: SHA-256 of the file
+        """
+        manifest = self.config.load_json(self.config.upload_manifest_file)
+        manifest = manifest if isinstance(manifest, dict) else {}
+        manifest[self.name] = {**_fingerprint(file), "sha256": sha256, "uploaded_at": int(time.time())}
+        self.config.save_json(self.config.upload_manifest_file, manifest)
+
+
+class MultipartUpload:
+    """Upload of one file into an initiated multipart upload.
+
+    Parts are planned while the upload runs, sized and sent in parallel as
+    chosen by a PartTuner, and streamed from the file through a FileWindow,
+    so memory use stays flat regardless of part size and parallelism. With a
+    journal, every sent part is journaled and parts already in the journal
+    are not sent again. MD5 ETags are checked against the sent data.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        client,
+        path: str,
+        file: str,
+        part_size: Optional[int] = None,
+        parallel: int = DEFAULT_PARALLEL_PARTS,
+        journal: Optional[UploadJournal] = None,
+        log: Optional[Callable[[str], None]] = None,
+    ):
+        """Initialize upload.
+
+        Args:
+            client: API client
+            path: API path of the upload, e.g. /api/v1/users/{user}/images/{key}/{uploadId}
+            file: Path of the file to upload
+            part_size: Fixed part size (default: tuned from the throughput)
+            parallel: Maximum number of parts sent at the same time
+            journal: Journal recording the sent parts; its parts are skipped
+            log: Called with a line of throughput statistics for every part
+        """
+        self.client = client
+        self.path = path
+        self.file = file
+        self.file_size = os.path.getsize(file)
+        self.tuner = PartTuner(self.file_size, parallel, part_size)
+        self.journal = journal
+        self.log = log
+        self.sent: Dict[int, Tuple[Part, str]] = journal.parts if journal else {}
+
+    @property
+    def sent_bytes(self) -> int:
+        """Bytes of the parts sent so far."""
+        return sum(part.size for part, _ in self.sent.values())
+
+    def plan(self) -> Iterator[Part]:
+        """Yield the parts still to send.
+
+        Ranges between parts sent earlier are split over the part numbers in
+        between them; the rest of the file follows in parts sized by the
+        tuner at the time they are planned.
+
+        Yields:
+            Parts in part number order
+        """
+        number, offset = 0, 0
+        for part, _ in sorted(self.sent.values()):
+            yield from split_range(number + 1, part.number - number - 1, offset, part.offset - offset)
+            number, offset = part.number, part.offset + part.size
+        while offset < self.file_size or number == 0:
+            size = self.tuner.next_size(self.file_size - offset, MAX_PARTS - number)
+            number += 1
+            yield Part(number, offset, size)
+            offset += size
+
+    def upload_part(self, part: Part) -> Tuple[str, float]:
+        """Stream one part from the file.
+
+        Args:
+            part: Part to send
+
+        Returns:
+            Tuple of (ETag of the part, seconds it took)
+
+        Raises:
+            APIError: If the API rejects the part or its MD5 ETag does not match the sent data
+            OSError: If the file cannot be read
+        """
+        start = time.monotonic()
+        with FileWindow(self.file, part.offset, part.size) as window:
+            result = self.client.put_binary(f"{self.path}/parts/{part.number}", data=window)
+        etag = result.get("etag") or result.get("ETag")
+        match = _MD5_ETAG.match(etag or "")
+        if match and window.md5 and match.group(1).lower() != window.md5:
+            raise APIError(f"Part {part.number} was corrupted in transit: ETag {etag} does not match MD5 {window.md5}")
+        return etag, time.monotonic() - start
+
+    def upload_parts(self, on_progress: Optional[Callable[[int], None]] = None) -> List[Dict[str, Any]]:
+        """Send all parts not sent yet, as many at a time as the tuner allows.
+
+        Parts are planned and submitted as workers become free, so a failed
+        part stops the upload without sending the rest of the file; parts
+        already being sent are waited for before the error is raised.
+
+        Args:
+            on_progress: Called with the size of every finished part, on the calling thread
+
+        Returns:
+            Completion entries ordered by part number
+
+        Raises:
+            APIError: If the API rejects a part
+            OSError: If the file cannot be read
+        """
+        pending = self.plan()
+        with ThreadPoolExecutor(self.tuner.max_parallel, thread_name_prefix="netcupctl-upload") as pool:
+            self._send(pool, pending, on_progress)
+        return [{"partNumber": number, "etag": self.sent[number][1]} for number in sorted(self.sent)]
+
+    def _send(self, pool: ThreadPoolExecutor, pending: Iterator[Part],
+              on_progress: Optional[Callable[[int], None]]) -> None:
+        """Submit the pending parts to the pool while the tuner allows more in flight."""
+        running = {}
+        while True:
+            while len(running) < self.tuner.parallel:
+                part = next(pending, None)
+                if part is None:
+                    break
+                running[pool.submit(tracing.bind(self.upload_part), part)] = part
+            if not running:
+                break
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                part = running.pop(future)
+                self._finished(part, *future.result())
+                if on_progress:
+                    on_progress(part.size)
+
+    def _finished(self, part: Part, etag: str, seconds: float) -> None:
+        """Record a sent part, log its throughput and feed it to the tuner."""
+        self.sent[part.number] = (part, etag)
+        if self.journal:
+            self.journal.record(part, etag)
+        if self.log:
+            self.log(f"Part {part.number}: {part.size / MB:.1f} MB in {seconds:.2f} s "
+                     f"({part.size / MB / max(seconds, 1e-6):.1f} MB/s)")
+        if self.tuner.finished(part.size) and self.log:
+            self.log(f"Now sending {self.tuner.part_size / MB:.0f} MB parts, {self.tuner.parallel} at a time")
+
+    def complete(self, parts: List[Dict[str, Any]]) -> Any:
+        """Complete the upload from its sent parts.
+
+        Args:
+            parts: Completion entries as returned by upload_parts()
+
+        Returns:
+            Response of the completion request
+
+        Raises:
+            APIError: If the API rejects the completion
+        """
+        return self.client.post(self.path, json={"parts": parts})
+
+    def abort(self) -> None:
+        """Abort the upload, discarding the parts sent so far.
+
+        Raises:
+            APIError: If the API rejects the request
+        """
+        self.client.delete(self.path)
@@ -8,6 +8,7 @@ from netcupctl.config import ConfigManager
 from netcupctl.auth import AuthManager
 from netcupctl.client import NetcupClient
 from netcupctl.output import OutputFormatter
+from netcupctl.retry import RetryPolicy
 from netcupctl.cli import cli, Context
 
 
@@ -63,7 +64,7 @@ def mock_auth_unauthenticated(mock_config):
 
 @pytest.fixture
 def mock_client(mock_auth, requests_mock):
-    client = NetcupClient(auth=mock_auth)
+    client = NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0))
     return client
 
 
@@ -72,6 +73,15 @@ def cli_runner():
     return CliRunner()
 
 
+@pytest.fixture
+def split_cli_runner():
+    """CliRunner whose result has stdout and stderr apart (click < 8.2 mixes them by default)."""
+    try:
+        return CliRunner(mix_stderr=False)
+    except TypeError:
+        return CliRunner()
+
+
 @pytest.fixture
 def mock_context(mock_config, mock_auth, mock_client):
     ctx = Context()
@@ -1,25 +1,21 @@
-SERVER_LIST_RESPONSE = [
-    {
-        "id": "srv-12345",
-        "name": "web-server-01",
-        "status": "running",
-        "ipv4": "203.0.113.10",
-        "ipv6": "2001:db8::1",
-        "cpu": 4,
-        "memory": 8192,
-        "disk": 100,
-    },
-    {
-        "id": "srv-67890",
-        "name": "db-server-01",
-        "status": "stopped",
-        "ipv4": "203.0.113.20",
-        "ipv6": "2001:db8::2",
-        "cpu": 8,
-        "memory": 16384,
-        "disk": 500,
-    },
-]
+from netcupctl.testing.seed_data import (  # noqa: F401 - re-exported for the tests
+    CUSTOM_IMAGE_LIST_RESPONSE,
+    CUSTOM_ISO_LIST_RESPONSE,
+    DISK_LIST_RESPONSE,
+    FAILOVER_IP_LIST_RESPONSE,
+    FIREWALL_GET_RESPONSE,
+    FIREWALL_POLICY_LIST_ONE_RESPONSE,
+    INTERFACE_LIST_RESPONSE,
+    METRICS_RESPONSE,
+    SERVER_DETAIL_RESPONSE,
+    SERVER_LIST_RESPONSE,
+    SNAPSHOT_LIST_RESPONSE,
+    SSH_KEY_LIST_RESPONSE,
+    TASK_RESPONSE,
+    UPLOAD_COMPLETE_RESPONSE,
+    USERINFO_RESPONSE,
+    VLAN_LIST_RESPONSE,
+)
 
 SERVER_STATUS_RESPONSE = {
     "id": "srv-12345",
@@ -30,55 +26,6 @@ SERVER_STATUS_RESPONSE = {
     },
 }
 
-SERVER_DETAIL_RESPONSE = {
-    "id": "srv-12345",
-    "name": "web-server-01",
-    "status": "running",
-    "ipv4": "203.0.113.10",
-    "ipv6": "2001:db8::1",
-    "cpu": 4,
-    "memory": 8192,
-    "disk": 100,
-    "created_at": "2024-01-15T10:30:00Z",
-    "datacenter": "NBG1",
-}
-
-DISK_LIST_RESPONSE = [
-    {
-        "id": "disk-001",
-        "name": "system-disk",
-        "size": 100,
-        "type": "ssd",
-        "server_id": "srv-12345",
-    },
-    {
-        "id": "disk-002",
-        "name": "data-disk",
-        "size": 500,
-        "type": "hdd",
-        "server_id": "srv-12345",
-    },
-]
-
-SNAPSHOT_LIST_RESPONSE = [
-    {
-        "id": "snap-001",
-        "name": "backup-2024-01-15",
-        "created_at": "2024-01-15T00:00:00Z",
-        "size": 50,
-        "server_id": "srv-12345",
-    },
-]
-
-SSH_KEY_LIST_RESPONSE = [
-    {
-        "id": "key-001",
-        "name": "my-laptop",
-        "fingerprint": "SHA256:abcdef123456",
-        "created_at": "2024-01-01T00:00:00Z",
-    },
-]
-
 FIREWALL_RULE_RESPONSE = {
     "id": "fw-001",
     "direction": "inbound",
@@ -88,42 +35,6 @@ FIREWALL_RULE_RESPONSE = {
     "action": "allow",
 }
 
-VLAN_LIST_RESPONSE = [
-    {
-        "id": "vlan-001",
-        "name": "internal",
-        "vlan_id": 100,
-        "servers": ["srv-12345", "srv-67890"],
-    },
-]
-
-INTERFACE_LIST_RESPONSE = [
-    {
-        "id": "iface-001",
-        "name": "eth0",
-        "mac": "00:11:22:33:44:55",
-        "ipv4": "203.0.113.10",
-        "ipv6": "2001:db8::1",
-        "type": "public",
-    },
-]
-
-TASK_RESPONSE = {
-    "id": "task-001",
-    "type": "server_start",
-    "status": "completed",
-    "progress": 100,
-    "created_at": "2024-01-15T10:00:00Z",
-    "completed_at": "2024-01-15T10:01:00Z",
-}
-
-METRICS_RESPONSE = {
-    "cpu": {"current": 45.2, "average": 30.5, "peak": 95.0},
-    "memory": {"current": 4096, "total": 8192, "percent": 50.0},
-    "disk": {"read_iops": 150, "write_iops": 75, "latency_ms": 2.5},
-    "network": {"rx_bytes": 1073741824, "tx_bytes": 536870912},
-}
-
 ERROR_RESPONSE_401 = {
     "error": "unauthorized",
     "message": "Invalid or expired token",
@@ -167,13 +78,6 @@ DEVICE_AUTH_RESPONSE = {
     "interval": 5,
 }
 
-USERINFO_RESPONSE = {
-    "sub": "user_123",
-    "id": "user_123",
-    "preferred_username": "testuser",
-    "email": "test@example.com",
-}
-
 OPENAPI_SPEC_RESPONSE = {
     "openapi": "3.0.0",
     "info": {
@@ -226,23 +130,6 @@ DEVICE_AUTH_ERROR_EXPIRED_TOKEN = {
     "error_description": "Device code has expired",
 }
 
-CUSTOM_IMAGE_LIST_RESPONSE = [
-    {
-        "key": "my-ubuntu-2204",
-        "name": "Ubuntu 22.04 Custom",
-        "size": 2147483648,
-        "created_at": "2024-01-15T10:00:00Z",
-        "status": "available",
-    },
-    {
-        "key": "my-debian-12",
-        "name": "Debian 12 Custom",
-        "size": 1073741824,
-        "created_at": "2024-01-10T09:00:00Z",
-        "status": "available",
-    },
-]
-
 CUSTOM_IMAGE_DETAIL_RESPONSE = {
     "key": "my-ubuntu-2204",
     "name": "Ubuntu 22.04 Custom",
@@ -262,22 +149,6 @@ UPLOAD_PART_RESPONSE = {
     "partNumber": 1,
 }
 
-UPLOAD_COMPLETE_RESPONSE = {
-    "key": "my-new-image",
-    "status": "processing",
-    "message": "Upload completed successfully",
-}
-
-CUSTOM_ISO_LIST_RESPONSE = [
-    {
-        "key": "my-rescue-iso",
-        "name": "Custom Rescue ISO",
-        "size": 524288000,
-        "created_at": "2024-01-12T14:00:00Z",
-        "status": "available",
-    },
-]
-
 CUSTOM_ISO_DETAIL_RESPONSE = {
     "key": "my-rescue-iso",
     "name": "Custom Rescue ISO",
@@ -397,23 +268,6 @@ SNAPSHOT_DRYRUN_RESPONSE = {
     "warnings": [],
 }
 
-FAILOVER_IP_LIST_RESPONSE = [
-    {
-        "id": "fip-001",
-        "ip": "203.0.113.100",
-        "server_id": "srv-12345",
-        "status": "active",
-        "created_at": "2024-01-10T00:00:00Z",
-    },
-    {
-        "id": "fip-002",
-        "ip": "203.0.113.101",
-        "server_id": None,
-        "status": "unassigned",
-        "created_at": "2024-01-12T00:00:00Z",
-    },
-]
-
 FAILOVER_IP_DETAIL_RESPONSE = {
     "id": "fip-001",
     "ip": "203.0.113.100",
@@ -524,15 +378,6 @@ ISO_MOUNT_RESPONSE = {
 }
 
 # API-conformant firewall GET responses (ServerFirewall schema).
-FIREWALL_GET_RESPONSE = {
-    "copiedPolicies": [],
-    "userPolicies": [{"id": 42, "name": "ssh-policy", "rules": []}],
-    "ingressImplicitRule": "ACCEPT_ALL",
-    "egressImplicitRule": "ACCEPT_ALL",
-    "consistent": True,
-    "active": True,
-}
-
 FIREWALL_GET_WITH_DROP_ALL = {
     "copiedPolicies": [],
     "userPolicies": [],
@@ -563,10 +408,6 @@ FIREWALL_GET_EMPTY = {
 # API-conformant firewall-policy list responses (integer IDs, unlike legacy string-ID fixtures).
 FIREWALL_POLICY_LIST_EMPTY_RESPONSE = []
 
-FIREWALL_POLICY_LIST_ONE_RESPONSE = [
-    {"id": 42, "name": "my-policy", "description": "", "rules": []},
-]
-
 FIREWALL_POLICY_LIST_MULTIPLE_SAME_NAME = [
     {"id": 42, "name": "my-policy", "rules": []},
     {"id": 43, "name": "my-policy", "rules": []},
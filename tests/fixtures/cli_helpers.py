@@ -1,3 +1,4 @@
+from functools import partial
 from unittest.mock import MagicMock, patch
 from click.testing import CliRunner
 
@@ -6,6 +7,7 @@ from netcupctl.config import ConfigManager
 from netcupctl.auth import AuthManager
 from netcupctl.client import NetcupClient
 from netcupctl.output import OutputFormatter
+from netcupctl.pagination import paginate
 
 
 def create_mock_context(
@@ -16,6 +18,7 @@ def create_mock_context(
     config = MagicMock(spec=ConfigManager)
     auth = MagicMock(spec=AuthManager)
     client = MagicMock(spec=NetcupClient)
+    client.paginate.side_effect = partial(paginate, client)
 
     if authenticated:
         auth.is_authenticated.return_value = True
@@ -37,6 +40,7 @@ def create_mock_context(
     ctx.auth = auth
     ctx.client = client
     ctx.formatter = OutputFormatter(format=output_format)
+    ctx.session = None
 
     return ctx
 
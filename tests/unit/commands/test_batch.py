@@ -0,0 +1,160 @@
+"""
+Tests for netcupctl.commands.batch
+"""
+import json
+import threading
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.commands.batch import _run_all
+
+
+def _records(output):
+    return [json.loads(line) for line in output.splitlines()]
+
+
+@pytest.mark.unit
+class TestBatchCommand:
+    """Test suite for the batch command"""
+
+    def test_runs_commands_from_stdin(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        requests_mock.get(f"{api_base_url}/api/v1/servers/2", json={"id": 2})
+
+        result = cli_runner.invoke(
+            cli,
+            ["--format", "json", "batch", "-"],
+            input="# servers\nservers get 1\n\nnetcupctl servers get 2\n",
+            obj=mock_context,
+        )
+
+        assert result.exit_code == 0, result.output
+        records = _records(result.output)
+        assert [r["line"] for r in records] == [2, 4]
+        assert [r["command"] for r in records] == ["servers get 1", "netcupctl servers get 2"]
+        assert [json.loads(r["stdout"]) for r in records] == [{"id": 1}, {"id": 2}]
+        assert all(r["exit_code"] == 0 and r["stderr"] == "" for r in records)
+
+    def test_runs_commands_from_file(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+        commands = tmp_path / "commands.txt"
+        commands.write_text("ping\nping\n", encoding="utf-8")
+
+        result = cli_runner.invoke(cli, ["batch", str(commands)], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert [r["stdout"] for r in _records(result.output)] == ["pong\n", "pong\n"]
+
+    def test_inherits_format(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        result = cli_runner.invoke(
+            cli,
+            ["--format", "yaml", "batch", "-"],
+            input="servers get 1\n--format json servers get 1\n",
+            obj=mock_context,
+        )
+
+        yaml_out, json_out = [r["stdout"] for r in _records(result.output)]
+        assert yaml_out == "id: 1\n"
+        assert json.loads(json_out) == {"id": 1}
+
+    def test_inherits_global_options(self, cli_runner, mock_context, requests_mock):
+        requests_mock.get("http://127.0.0.1:8080/scp-core/api/v1/servers/1",
+                          [{"status_code": 503}, {"status_code": 503}, {"json": {"id": 1}}])
+
+        result = cli_runner.invoke(
+            cli,
+            ["--api-url", "http://127.0.0.1:8080/scp-core", "--retries", "0", "batch", "-"],
+            input="servers get 1\n--retries 1 servers get 1\n",
+            obj=mock_context,
+        )
+
+        first, second = _records(result.output)
+        assert first["exit_code"] == 503
+        assert second["exit_code"] == 0
+        assert requests_mock.call_count == 3
+
+    def test_failure_does_not_stop_batch(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", status_code=404)
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        result = cli_runner.invoke(cli, ["batch", "-"], input="servers get 1\nping\n", obj=mock_context)
+
+        assert result.exit_code == 1
+        failed, passed = _records(result.output)
+        assert failed["exit_code"] == 404
+        assert "Resource not found" in failed["stderr"]
+        assert passed["exit_code"] == 0
+
+    def test_invalid_lines(self, cli_runner, mock_context):
+        result = cli_runner.invoke(
+            cli,
+            ["batch", "-"],
+            input="servers get 'unterminated\nbatch other.txt\ndaemon start\n",
+            obj=mock_context,
+        )
+
+        assert result.exit_code == 1
+        records = _records(result.output)
+        assert [r["exit_code"] for r in records] == [2, 2, 2]
+        assert "No closing quotation" in records[0]["stderr"]
+        assert "'batch' cannot run inside a batch" in records[1]["stderr"]
+        assert "'daemon' cannot run inside a batch" in records[2]["stderr"]
+
+    def test_parallel_keeps_input_order(self, cli_runner, mock_context, requests_mock, api_base_url):
+        for i in range(10):
+            requests_mock.get(f"{api_base_url}/api/v1/servers/{i}", json={"id": i})
+        commands = "".join(f"servers get {i}\n" for i in range(10))
+
+        result = cli_runner.invoke(
+            cli,
+            ["--format", "json", "batch", "--parallel", "4", "-"],
+            input=commands,
+            obj=mock_context,
+        )
+
+        assert result.exit_code == 0, result.output
+        assert [json.loads(r["stdout"])["id"] for r in _records(result.output)] == list(range(10))
+
+    def test_invalid_parallel(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["batch", "--parallel", "0", "-"], input="", obj=mock_context)
+
+        assert result.exit_code == 2
+
+
+@pytest.mark.unit
+class TestRunAll:
+    """Test suite for the ordered, bounded batch runner"""
+
+    def test_limits_commands_in_flight(self):
+        lock = threading.Lock()
+        running = [0, 0]
+
+        def run(number, text):
+            with lock:
+                running[0] += 1
+                running[1] = max(running[1], running[0])
+            threading.Event().wait(0.01)
+            with lock:
+                running[0] -= 1
+            return {"line": number, "command": text}
+
+        results = list(_run_all(run, iter((i, str(i)) for i in range(12)), parallel=3))
+
+        assert [r["line"] for r in results] == list(range(12))
+        assert 1 < running[1] <= 3
+
+    def test_reads_input_lazily(self):
+        consumed = []
+
+        def commands():
+            for i in range(5):
+                consumed.append(i)
+                yield i, str(i)
+
+        results = _run_all(lambda number, text: {"line": number}, commands(), parallel=2)
+
+        assert next(results) == {"line": 0}
+        assert len(consumed) == 2
@@ -7,6 +7,8 @@ from unittest.mock import patch, mock_open, MagicMock
 
 from netcupctl.cli import cli
 from netcupctl.client import APIError
+from netcupctl.config import ConfigManager
+from netcupctl.upload import UploadJournal
 from tests.fixtures.api_responses import (
     CUSTOM_IMAGE_LIST_RESPONSE,
     CUSTOM_IMAGE_DETAIL_RESPONSE,
@@ -256,8 +258,8 @@ class TestCustomImagesCommands:
         assert "Failed to initiate upload" in result.output
         ctx.client.put_binary.assert_not_called()
 
-    def test_upload_image_part_upload_failed_cleanup(self, cli_runner, tmp_path):
-        """Test upload image handles part upload failure with cleanup"""
+    def test_upload_image_part_upload_failed_keeps_upload(self, cli_runner, tmp_path):
+        """Test upload image keeps the upload for --resume when a part fails"""
         ctx = create_mock_context()
         ctx.client.post.return_value = UPLOAD_INIT_RESPONSE
         ctx.client.put_binary.side_effect = APIError("Upload failed", status_code=500)
@@ -279,15 +281,11 @@ class TestCustomImagesCommands:
 
         assert result.exit_code == 1
         assert "Upload failed" in result.output
-        assert "Aborting upload" in result.output
-
-        # Verify cleanup was attempted
-        ctx.client.delete.assert_called_once_with(
-            "/api/v1/users/user_123/images/test.img/upload-abc123def456"
-        )
+        assert "again with --resume" in result.output
+        ctx.client.delete.assert_not_called()
 
-    def test_upload_image_complete_failed_cleanup(self, cli_runner, tmp_path):
-        """Test upload image handles complete failure with cleanup"""
+    def test_upload_image_complete_failed_keeps_upload(self, cli_runner, tmp_path):
+        """Test upload image keeps the upload for --resume when the completion fails"""
         ctx = create_mock_context()
         ctx.client.post.side_effect = [
             UPLOAD_INIT_RESPONSE,
@@ -312,8 +310,7 @@ class TestCustomImagesCommands:
 
         assert result.exit_code == 1
         assert "Upload failed" in result.output
-        # Verify cleanup attempted
-        ctx.client.delete.assert_called_once()
+        ctx.client.delete.assert_not_called()
 
     def test_upload_image_file_not_found(self, cli_runner):
         """Test upload image with non-existent file"""
@@ -375,27 +372,185 @@ class TestCustomImagesCommands:
         mock_progress.update.assert_called()
         assert mock_progress.update.call_count >= 1
 
-    def test_upload_image_cleanup_failure_silenced(self, cli_runner, tmp_path):
-        """Test upload cleanup failure is silently handled"""
+    def test_upload_image_without_resume_aborts_failed_upload(self, cli_runner, tmp_path):
+        """Test a new upload aborts the upload kept after a failure, silencing errors"""
         ctx = create_mock_context()
-        ctx.client.post.return_value = UPLOAD_INIT_RESPONSE
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, {"uploadId": "upload-2"}, UPLOAD_COMPLETE_RESPONSE]
         ctx.client.put_binary.side_effect = APIError("Upload failed", status_code=500)
         ctx.client.delete.side_effect = APIError("Delete failed", status_code=404)
 
         test_file = tmp_path / "test.img"
         test_file.write_bytes(b"test" * 1000)
+        args = ["custom-images", "upload", str(test_file)]
 
         with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
-            with patch("netcupctl.commands.custom_images.click.progressbar") as mock_progressbar:
-                mock_progress = MagicMock()
-                mock_progressbar.return_value.__enter__.return_value = mock_progress
+            failed = invoke_with_mocks(cli_runner, args, ctx)
+            ctx.client.put_binary.side_effect = None
+            ctx.client.put_binary.return_value = UPLOAD_PART_RESPONSE
+            uploaded = invoke_with_mocks(cli_runner, args, ctx)
+
+        assert failed.exit_code == 1
+        assert uploaded.exit_code == 0
+        ctx.client.delete.assert_called_once_with("/api/v1/users/user_123/images/test.img/upload-abc123def456")
+        assert ctx.client.put_binary.call_args[0][0].startswith("/api/v1/users/user_123/images/test.img/upload-2/")
+        assert not list(ctx.config.uploads_dir.iterdir())
+
+    def test_upload_image_parallel_parts(self, cli_runner, tmp_path):
+        """Test upload image sends parts in parallel and completes them in order"""
+        ctx = create_mock_context()
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, UPLOAD_COMPLETE_RESPONSE]
+        ctx.client.put_binary.side_effect = lambda path, data: {"etag": path.rsplit("/", 1)[1]}
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 5000)
 
+        with patch.multiple("netcupctl.upload", MIN_PART_SIZE=1000, MAX_PART_SIZE=1000):
+            with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
                 result = invoke_with_mocks(
                     cli_runner,
-                    ["custom-images", "upload", str(test_file)],
+                    ["custom-images", "upload", str(test_file), "--parallel-parts", "3"],
                     ctx
                 )
 
+        assert result.exit_code == 0
+        assert ctx.client.put_binary.call_count == 5
+        complete_call = ctx.client.post.call_args_list[1]
+        assert complete_call[1]["json"]["parts"] == [{"partNumber": n, "etag": str(n)} for n in range(1, 6)]
+
+    def test_upload_image_invalid_parallel_parts(self, cli_runner, tmp_path):
+        """Test upload image rejects --parallel-parts below 1"""
+        ctx = create_mock_context()
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"test")
+
+        result = invoke_with_mocks(
+            cli_runner,
+            ["custom-images", "upload", str(test_file), "--parallel-parts", "0"],
+            ctx
+        )
+
+        assert result.exit_code == 2
+        ctx.client.post.assert_not_called()
+
+    def test_upload_image_resume_after_failure(self, cli_runner, tmp_path):
+        """Test a failed upload with --resume is kept and continued with the missing parts"""
+        ctx = create_mock_context()
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, UPLOAD_COMPLETE_RESPONSE]
+        ctx.client.put_binary.side_effect = [{"etag": "e1"}, APIError("Upload failed", status_code=500)]
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 3000)
+        args = ["custom-images", "upload", str(test_file), "--parallel-parts", "1", "--resume"]
+
+        with patch.multiple("netcupctl.upload", MIN_PART_SIZE=1000, MAX_PART_SIZE=1000):
+            with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
+                failed = invoke_with_mocks(cli_runner, args, ctx)
+                ctx.client.put_binary.side_effect = [{"etag": "e2"}, {"etag": "e3"}]
+                resumed = invoke_with_mocks(cli_runner, args, ctx)
+
+        assert failed.exit_code == 1
+        assert "again with --resume" in failed.output
+        assert resumed.exit_code == 0
+        assert "1 parts already sent" in resumed.output
+        ctx.client.delete.assert_not_called()
+        sent = [c[0][0].rsplit("/", 1)[1] for c in ctx.client.put_binary.call_args_list]
+        assert sent == ["1", "2", "2", "3"]
+        complete_call = ctx.client.post.call_args_list[1]
+        assert complete_call[1]["json"]["parts"] == [
+            {"partNumber": 1, "etag": "e1"}, {"partNumber": 2, "etag": "e2"}, {"partNumber": 3, "etag": "e3"}
+        ]
+        assert not list(ctx.config.uploads_dir.iterdir())
+
+    def test_upload_image_resume_changed_file(self, cli_runner, tmp_path):
+        """Test --resume refuses to continue an upload of a changed file"""
+        ctx = create_mock_context()
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 3000)
+        UploadJournal(ctx.config, "user_123", "images", "test.img").start("upload-1", str(test_file))
+        test_file.write_bytes(b"y" * 4000)
+
+        with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
+            result = invoke_with_mocks(cli_runner, ["custom-images", "upload", str(test_file), "--resume"], ctx)
+
         assert result.exit_code == 1
-        # Cleanup failure should be silenced (pass)
-        ctx.client.delete.assert_called_once()
+        assert "changed since the interrupted upload" in result.output
+        ctx.client.post.assert_not_called()
+
+    def test_upload_image_verbose_logs_part_throughput(self, split_cli_runner, tmp_path):
+        """Test upload image logs the throughput of every part with --verbose"""
+        ctx = create_mock_context()
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, UPLOAD_COMPLETE_RESPONSE]
+        ctx.client.put_binary.return_value = UPLOAD_PART_RESPONSE
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 4000)
+
+        with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
+            result = invoke_with_mocks(split_cli_runner, ["--verbose", "custom-images", "upload", str(test_file)], ctx)
+
+        assert result.exit_code == 0
+        assert "[VERBOSE] Part 1: 0.0 MB in" in result.stderr
+        assert "MB/s)" in result.stderr
+
+    def test_upload_image_skip_unchanged(self, cli_runner, tmp_path):
+        """Test --skip-unchanged skips a file uploaded before and still present on the server"""
+        ctx = create_mock_context()
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, UPLOAD_COMPLETE_RESPONSE]
+        ctx.client.put_binary.return_value = UPLOAD_PART_RESPONSE
+        ctx.client.get.side_effect = [APIError("Not found", status_code=404), {"key": "test.img", "size": 4000}]
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 4000)
+        args = ["custom-images", "upload", str(test_file), "--skip-unchanged"]
+
+        with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
+            uploaded = invoke_with_mocks(cli_runner, args, ctx)
+            skipped = invoke_with_mocks(cli_runner, args, ctx)
+
+        assert uploaded.exit_code == 0
+        assert "uploaded successfully" in uploaded.output
+        assert skipped.exit_code == 0
+        assert "unchanged" in skipped.output
+        assert ctx.client.post.call_count == 2
+        ctx.client.get.assert_called_with("/api/v1/users/user_123/images/test.img")
+
+    def test_upload_image_without_skip_unchanged_is_not_hashed(self, cli_runner, tmp_path):
+        """Test upload image without --skip-unchanged neither hashes the file nor records it"""
+        ctx = create_mock_context()
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, UPLOAD_COMPLETE_RESPONSE]
+        ctx.client.put_binary.return_value = UPLOAD_PART_RESPONSE
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x" * 4000)
+
+        with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"), \
+                patch("netcupctl.upload.file_sha256") as file_sha256:
+            result = invoke_with_mocks(cli_runner, ["custom-images", "upload", str(test_file)], ctx)
+
+        assert result.exit_code == 0
+        file_sha256.assert_not_called()
+        assert not ctx.config.upload_manifest_file.exists()
+
+    def test_upload_image_skip_unchanged_remote_error(self, cli_runner, tmp_path):
+        """Test --skip-unchanged reports errors fetching the remote metadata"""
+        ctx = create_mock_context()
+        ctx.client.get.side_effect = APIError("Error", status_code=500)
+
+        test_file = tmp_path / "test.img"
+        test_file.write_bytes(b"x")
+
+        with patch("netcupctl.commands.custom_images.get_authenticated_user_id", return_value="user_123"):
+            result = invoke_with_mocks(cli_runner, ["custom-images", "upload", str(test_file), "--skip-unchanged"], ctx)
+
+        assert result.exit_code == 500
+        ctx.client.post.assert_not_called()
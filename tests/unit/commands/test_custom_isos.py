@@ -7,6 +7,7 @@ from unittest.mock import patch, MagicMock
 
 from netcupctl.cli import cli
 from netcupctl.client import APIError
+from netcupctl.config import ConfigManager
 from tests.fixtures.api_responses import (
     CUSTOM_ISO_LIST_RESPONSE,
     CUSTOM_ISO_DETAIL_RESPONSE,
@@ -256,8 +257,8 @@ class TestCustomISOsCommands:
         assert "Failed to initiate upload" in result.output
         ctx.client.put_binary.assert_not_called()
 
-    def test_upload_iso_part_upload_failed_cleanup(self, cli_runner, tmp_path):
-        """Test upload ISO handles part upload failure with cleanup"""
+    def test_upload_iso_part_upload_failed_keeps_upload(self, cli_runner, tmp_path):
+        """Test upload ISO keeps the upload for --resume when a part fails"""
         ctx = create_mock_context()
         ctx.client.post.return_value = UPLOAD_INIT_RESPONSE
         ctx.client.put_binary.side_effect = APIError("Upload failed", status_code=500)
@@ -279,15 +280,11 @@ class TestCustomISOsCommands:
 
         assert result.exit_code == 1
         assert "Upload failed" in result.output
-        assert "Aborting upload" in result.output
-
-        # Verify cleanup was attempted
-        ctx.client.delete.assert_called_once_with(
-            "/api/v1/users/user_123/isos/test.iso/upload-abc123def456"
-        )
+        assert "again with --resume" in result.output
+        ctx.client.delete.assert_not_called()
 
-    def test_upload_iso_complete_failed_cleanup(self, cli_runner, tmp_path):
-        """Test upload ISO handles complete failure with cleanup"""
+    def test_upload_iso_complete_failed_keeps_upload(self, cli_runner, tmp_path):
+        """Test upload ISO keeps the upload for --resume when the completion fails"""
         ctx = create_mock_context()
         ctx.client.post.side_effect = [
             UPLOAD_INIT_RESPONSE,
@@ -312,8 +309,7 @@ class TestCustomISOsCommands:
 
         assert result.exit_code == 1
         assert "Upload failed" in result.output
-        # Verify cleanup attempted
-        ctx.client.delete.assert_called_once()
+        ctx.client.delete.assert_not_called()
 
     def test_upload_iso_file_not_found(self, cli_runner):
         """Test upload ISO with non-existent file"""
@@ -375,27 +371,27 @@ class TestCustomISOsCommands:
         mock_progress.update.assert_called()
         assert mock_progress.update.call_count >= 1
 
-    def test_upload_iso_cleanup_failure_silenced(self, cli_runner, tmp_path):
-        """Test upload cleanup failure is silently handled"""
+    def test_upload_iso_without_resume_aborts_failed_upload(self, cli_runner, tmp_path):
+        """Test a new upload aborts the upload kept after a failure, silencing errors"""
         ctx = create_mock_context()
-        ctx.client.post.return_value = UPLOAD_INIT_RESPONSE
+        ctx.config = ConfigManager()
+        ctx.config.config_dir = tmp_path / "netcupctl"
+        ctx.client.post.side_effect = [UPLOAD_INIT_RESPONSE, {"uploadId": "upload-2"}, UPLOAD_COMPLETE_RESPONSE]
         ctx.client.put_binary.side_effect = APIError("Upload failed", status_code=500)
         ctx.client.delete.side_effect = APIError("Delete failed", status_code=404)
 
         test_file = tmp_path / "test.iso"
         test_file.write_bytes(b"test" * 1000)
+        args = ["custom-isos", "upload", str(test_file)]
 
         with patch("netcupctl.commands.custom_isos.get_authenticated_user_id", return_value="user_123"):
-            with patch("netcupctl.commands.custom_isos.click.progressbar") as mock_progressbar:
-                mock_progress = MagicMock()
-                mock_progressbar.return_value.__enter__.return_value = mock_progress
-
-                result = invoke_with_mocks(
-                    cli_runner,
-                    ["custom-isos", "upload", str(test_file)],
-                    ctx
-                )
-
-        assert result.exit_code == 1
-        # Cleanup failure should be silenced (pass)
-        ctx.client.delete.assert_called_once()
+            failed = invoke_with_mocks(cli_runner, args, ctx)
+            ctx.client.put_binary.side_effect = None
+            ctx.client.put_binary.return_value = UPLOAD_PART_RESPONSE
+            uploaded = invoke_with_mocks(cli_runner, args, ctx)
+
+        assert failed.exit_code == 1
+        assert uploaded.exit_code == 0
+        ctx.client.delete.assert_called_once_with("/api/v1/users/user_123/isos/test.iso/upload-abc123def456")
+        assert ctx.client.put_binary.call_args[0][0].startswith("/api/v1/users/user_123/isos/test.iso/upload-2/")
+        assert not list(ctx.config.uploads_dir.iterdir())
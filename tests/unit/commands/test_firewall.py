@@ -535,3 +535,41 @@ class TestFirewallCommands:
 
         assert result.exit_code == 1
         ctx.client.delete.assert_not_called()
+
+    def test_cleanup_collects_references_across_servers(self, cli_runner):
+        """Cleanup fans out over all servers and interfaces and skips failing servers."""
+        ctx = self._setup_cleanup_ctx(
+            all_policies=[{"id": 1, "name": "a"}, {"id": 2, "name": "b"}, {"id": 3, "name": "c"}],
+            servers=[{"id": "srv-1"}, {"id": "srv-2"}, {"id": "srv-3"}],
+            interfaces_by_id={
+                "srv-1": [{"mac": "aa:aa:aa:aa:aa:01"}, {"mac": "aa:aa:aa:aa:aa:02"}],
+                "srv-2": [{"mac": "bb:bb:bb:bb:bb:01"}],
+            },
+            firewall_by_id_mac={
+                ("srv-1", "aa:aa:aa:aa:aa:02"): {"userPolicies": [{"id": 1}], "copiedPolicies": []},
+                ("srv-2", "bb:bb:bb:bb:bb:01"): {"userPolicies": [], "copiedPolicies": [{"id": 3}]},
+            },
+        )
+        dispatch = ctx.client.get.side_effect
+
+        def _get(path, params=None):
+            if path == "/api/v1/servers/srv-3/interfaces":
+                raise APIError("Server error", status_code=500)
+            return dispatch(path, params=params)
+
+        ctx.client.get.side_effect = _get
+
+        with patch(
+            "netcupctl.commands.firewall.get_authenticated_user_id",
+            return_value="user_123",
+        ):
+            result = invoke_with_mocks(
+                cli_runner,
+                ["--parallel", "4", "firewall", "cleanup", "--dry-run"],
+                ctx,
+            )
+
+        assert result.exit_code == 0
+        assert "policy 2 (b)" in result.output
+        assert "policy 1 (a)" not in result.output
+        assert "policy 3 (c)" not in result.output
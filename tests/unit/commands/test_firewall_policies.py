@@ -1,6 +1,8 @@
 """
 Tests for netcupctl.commands.firewall_policies
 """
+import json
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch
@@ -93,6 +95,33 @@ class TestFirewallPoliciesCommands:
         assert result.exit_code == status_code
         assert "Error:" in result.output
 
+    def test_list_policies_all_pages(self, cli_runner):
+        """Test list policies with --all follows the pagination"""
+        ctx = create_mock_context()
+        pages = {0: [{"id": 1}, {"id": 2}], 2: [{"id": 3}]}
+        ctx.client.get.side_effect = lambda path, params=None: pages.get(params["offset"], [])
+
+        with patch("netcupctl.commands.firewall_policies.get_authenticated_user_id", return_value="user_123"):
+            result = invoke_with_mocks(
+                cli_runner,
+                ["--format", "json", "firewall-policies", "list", "--all", "--limit", "2", "--search", "web"],
+                ctx
+            )
+
+        assert result.exit_code == 0
+        assert [p["id"] for p in json.loads(result.output)] == [1, 2, 3]
+        assert {"q": "web", "limit": 2, "offset": 2} in [c[1]["params"] for c in ctx.client.get.call_args_list]
+
+    def test_list_policies_all_rejects_zero_limit(self, cli_runner):
+        """Test --all needs a positive page size"""
+        ctx = create_mock_context()
+
+        with patch("netcupctl.commands.firewall_policies.get_authenticated_user_id", return_value="user_123"):
+            result = invoke_with_mocks(cli_runner, ["firewall-policies", "list", "--all", "--limit", "0"], ctx)
+
+        assert result.exit_code == 2
+        ctx.client.get.assert_not_called()
+
     # get_policy tests
     def test_get_policy_success(self, cli_runner):
         """Test get firewall policy successfully"""
@@ -30,6 +30,20 @@ class TestServersCommands:
         call_args = ctx.client.get.call_args
         assert call_args[1]["params"]["limit"] == 50
 
+    def test_list_servers_all_pages(self, cli_runner):
+        ctx = create_mock_context()
+        pages = {0: [{"id": "1"}, {"id": "2"}], 2: [{"id": "3"}]}
+        ctx.client.get.side_effect = lambda path, params=None: pages.get(params["offset"], [])
+
+        result = invoke_with_mocks(
+            cli_runner, ["--format", "json", "--parallel", "1", "servers", "list", "--all", "--limit", "2"], ctx
+        )
+
+        assert result.exit_code == 0
+        assert ctx.client.get.call_count == 2
+        assert '"id": "3"' in result.output
+        assert ctx.client.get.call_args[1]["params"] == {"limit": 2, "offset": 2}
+
     def test_list_servers_api_error(self, cli_runner):
         ctx = create_mock_context()
         ctx.client.get.side_effect = APIError("Server error", status_code=500)
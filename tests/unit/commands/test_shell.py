@@ -0,0 +1,120 @@
+"""
+Tests for netcupctl.commands.shell
+"""
+import time
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.inventory import Inventory
+
+
+@pytest.fixture
+def fresh_inventory(mock_config):
+    inventory = Inventory({"updated": time.time(), "servers": {"1": {"macs": [], "snapshots": []}}})
+    inventory.save(mock_config)
+    return inventory
+
+
+@pytest.mark.unit
+@pytest.mark.usefixtures("fresh_inventory")
+class TestShellCommand:
+    """Test suite for the interactive shell"""
+
+    def test_runs_commands_until_exit(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        result = cli_runner.invoke(cli, ["shell"], input="ping\n\nnetcupctl ping\nexit\nping\n", obj=mock_context)
+
+        assert result.exit_code == 0
+        assert result.output.count("pong") == 2
+        assert requests_mock.call_count == 2
+
+    def test_end_of_input_exits(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["shell"], input="", obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "netcupctl>" in result.output
+
+    def test_errors_do_not_exit(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", status_code=404)
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        result = cli_runner.invoke(
+            cli,
+            ["shell"],
+            input="servers get 1\nservers frobnicate\nservers get 'x\nshell\nping\n",
+            obj=mock_context,
+        )
+
+        assert result.exit_code == 0
+        assert "Resource not found" in result.output
+        assert "No such command" in result.output
+        assert "No closing quotation" in result.output
+        assert "'shell' cannot run inside the shell" in result.output
+        assert "pong" in result.output
+
+    def test_options_per_command(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        result = cli_runner.invoke(
+            cli, ["shell"], input="--format yaml servers get 1\nquit\n", obj=mock_context
+        )
+
+        assert "id: 1" in result.output
+
+    def test_inherits_global_options(self, cli_runner, mock_context, requests_mock):
+        requests_mock.get("http://127.0.0.1:8080/scp-core/api/v1/servers/1", json={"id": 1})
+
+        result = cli_runner.invoke(
+            cli,
+            ["--format", "yaml", "--api-url", "http://127.0.0.1:8080/scp-core", "shell"],
+            input="servers get 1\n",
+            obj=mock_context,
+        )
+
+        assert "id: 1" in result.output
+        assert requests_mock.call_count == 1
+
+    def test_help(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["shell"], input="help servers\n", obj=mock_context)
+
+        assert "Usage: netcupctl servers" in result.output
+
+    def test_refresh(self, cli_runner, mock_context, mock_config, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[{"id": 5}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/5/interfaces", json=[{"mac": "00:11:22:33:44:55"}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/5/snapshots", json=[])
+        requests_mock.get(f"{api_base_url}/api/v1/users/test_user_123/firewall-policies", json=[{"id": 7}])
+
+        result = cli_runner.invoke(cli, ["shell"], input="refresh\n", obj=mock_context)
+
+        assert "[OK] Inventory refreshed: 1 servers, 1 firewall policies." in result.output
+        assert Inventory.load(mock_config).macs("5") == ["00:11:22:33:44:55"]
+
+    def test_refresh_failure(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", status_code=500)
+
+        result = cli_runner.invoke(cli, ["--retries", "0", "shell", "--refresh"], input="", obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "Error:" in result.output
+
+
+@pytest.mark.unit
+class TestShellInventory:
+    """Test suite for the background inventory refresh"""
+
+    def test_stale_inventory_is_refreshed(self, cli_runner, mock_context, mock_config, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[{"id": 3}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/3/interfaces", json=[])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/3/snapshots", json=[])
+        requests_mock.get(f"{api_base_url}/api/v1/users/test_user_123/firewall-policies", json=[])
+
+        result = cli_runner.invoke(cli, ["shell"], input="", obj=mock_context)
+
+        assert result.exit_code == 0
+        deadline = time.monotonic() + 5
+        while not Inventory.load(mock_config).servers and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert Inventory.load(mock_config).server_ids() == ["3"]
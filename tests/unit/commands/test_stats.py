@@ -0,0 +1,101 @@
+"""
+Tests for netcupctl.commands.stats
+"""
+import json
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.latency import LatencyRecorder, PathTemplates, load_stats
+
+
+def _seed(config_dir):
+    recorder = LatencyRecorder(config_dir, PathTemplates, slow_threshold=0.5)
+    recorder.record("GET", "/api/v1/servers/1", 200, 0.1)
+    recorder.record("GET", "/api/v1/servers/2", 200, 0.9)
+    recorder.record("DELETE", "/api/v1/servers/1/snapshots/daily", 202, 0.05)
+    recorder.flush()
+
+
+@pytest.mark.unit
+class TestStatsCommand:
+    """Test suite for the stats command"""
+
+    def test_show_is_default(self, cli_runner, mock_context):
+        _seed(mock_context.config.config_dir)
+
+        result = cli_runner.invoke(cli, ["--format", "json", "stats"], obj=mock_context)
+
+        assert result.exit_code == 0, result.output
+        rows = json.loads(result.output)
+        assert [(r["method"], r["path"], r["count"]) for r in rows] == [
+            ("GET", "/api/v1/servers/{id}", 2), ("DELETE", "/api/v1/servers/{id}/snapshots/daily", 1)
+        ]
+        assert rows[0]["max_ms"] == 900.0
+
+    def test_show_empty(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["stats", "show"], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert "No latency statistics recorded" in result.output
+
+    def test_slow(self, cli_runner, mock_context):
+        _seed(mock_context.config.config_dir)
+
+        result = cli_runner.invoke(cli, ["--format", "json", "stats", "slow"], obj=mock_context)
+
+        assert result.exit_code == 0
+        entries = json.loads(result.output)
+        assert [(e["path"], e["ms"]) for e in entries] == [("/api/v1/servers/2", 900.0)]
+
+    def test_slow_empty(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["stats", "slow"], obj=mock_context)
+
+        assert "No slow requests logged." in result.output
+
+    def test_reset(self, cli_runner, mock_context):
+        _seed(mock_context.config.config_dir)
+
+        aborted = cli_runner.invoke(cli, ["stats", "reset"], input="n\n", obj=mock_context)
+        assert aborted.exit_code == 1
+        assert load_stats(mock_context.config.config_dir).rows()
+
+        result = cli_runner.invoke(cli, ["stats", "reset", "--yes"], obj=mock_context)
+        assert result.exit_code == 0
+        assert load_stats(mock_context.config.config_dir).rows() == []
+
+
+@pytest.mark.unit
+class TestLatencyStatsOption:
+    """Test suite for the --latency-stats option"""
+
+    def test_records_requests(self, cli_runner, mock_context, requests_mock, api_base_url, monkeypatch):
+        monkeypatch.setattr("netcupctl.cli._spec_path_templates",
+                            lambda: PathTemplates(["/api/v1/servers/{serverId}"]))
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        result = cli_runner.invoke(
+            cli, ["--latency-stats", "--slow-threshold", "0", "servers", "get", "1"], obj=mock_context
+        )
+
+        assert result.exit_code == 0, result.output
+        config_dir = mock_context.config.config_dir
+        assert load_stats(config_dir).rows()[0]["path"] == "/api/v1/servers/{serverId}"
+        assert (config_dir / "slow_requests.log").exists()
+
+    def test_enabled_by_environment(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        result = cli_runner.invoke(
+            cli, ["servers", "get", "1"], obj=mock_context, env={"NETCUPCTL_LATENCY_STATS": "1"}
+        )
+
+        assert result.exit_code == 0
+        assert load_stats(mock_context.config.config_dir).rows()[0]["count"] == 1
+
+    def test_disabled_by_default(self, cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        cli_runner.invoke(cli, ["servers", "get", "1"], obj=mock_context)
+
+        assert not (mock_context.config.config_dir / "latency.json").exists()
@@ -10,6 +10,8 @@ from netcupctl.commands.validators import (
     validate_ipv6,
     validate_ip,
     validate_uuid,
+    validate_duration,
+    validate_api_url,
 )
 
 
@@ -221,3 +223,38 @@ class TestValidateUuid:
     def test_invalid_uuids(self, uuid):
         with pytest.raises(click.BadParameter):
             validate_uuid(uuid)
+
+
+@pytest.mark.unit
+class TestValidateDuration:
+
+    @pytest.mark.parametrize("value, expected", [
+        ("30", 30.0),
+        ("30s", 30.0),
+        ("1.5m", 90.0),
+        ("2h", 7200.0),
+        ("1D", 86400.0),
+    ])
+    def test_valid_durations(self, value, expected):
+        assert validate_duration(value) == expected
+
+    @pytest.mark.parametrize("value", ["", "soon", "-5s", "5w"])
+    def test_invalid_durations(self, value):
+        with pytest.raises(click.BadParameter):
+            validate_duration(value)
+
+
+@pytest.mark.unit
+class TestValidateApiUrl:
+
+    @pytest.mark.parametrize("value,expected", [
+        ("http://127.0.0.1:8080", "http://127.0.0.1:8080"),
+        ("https://www.servercontrolpanel.de/scp-core/", "https://www.servercontrolpanel.de/scp-core"),
+    ])
+    def test_valid_urls(self, value, expected):
+        assert validate_api_url(value) == expected
+
+    @pytest.mark.parametrize("value", ["localhost:8080", "ftp://example.com", "http://", "http://host/a?b=1"])
+    def test_invalid_urls(self, value):
+        with pytest.raises(click.BadParameter):
+            validate_api_url(value)
@@ -0,0 +1,129 @@
+import asyncio
+import threading
+import time
+
+import pytest
+
+from netcupctl.async_client import AsyncNetcupClient, gather
+from netcupctl.client import APIError
+from tests.fixtures.api_responses import SERVER_LIST_RESPONSE
+
+
+@pytest.mark.unit
+class TestAsyncNetcupClient:
+
+    def test_requires_auth_or_client(self):
+        with pytest.raises(ValueError):
+            AsyncNetcupClient()
+
+    @pytest.mark.parametrize("concurrency, pool_maxsize", [(32, 32), (1, 10)])
+    def test_connection_pool_follows_concurrency(self, mock_auth, concurrency, pool_maxsize):
+        client = AsyncNetcupClient(auth=mock_auth, concurrency=concurrency)
+        adapter = client.client.session.get_adapter(client.client.BASE_URL)
+        client.close()
+
+        assert (adapter._pool_maxsize, adapter._pool_block) == (pool_maxsize, False)
+
+    def test_get_success(self, mock_auth, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=SERVER_LIST_RESPONSE)
+
+        async def _run():
+            async with AsyncNetcupClient(auth=mock_auth) as client:
+                return await client.get("/api/v1/servers", params={"limit": 10})
+
+        result = asyncio.run(_run())
+
+        assert result == SERVER_LIST_RESPONSE
+        assert requests_mock.last_request.qs == {"limit": ["10"]}
+
+    def test_write_methods(self, mock_client, requests_mock, api_base_url):
+        requests_mock.post(f"{api_base_url}/api/v1/items", json={"op": "post"}, status_code=201)
+        requests_mock.put(f"{api_base_url}/api/v1/items/1", json={"op": "put"})
+        requests_mock.patch(f"{api_base_url}/api/v1/items/1", json={"op": "patch"})
+        requests_mock.delete(f"{api_base_url}/api/v1/items/1", status_code=204)
+        requests_mock.put(f"{api_base_url}/api/v1/upload", status_code=200, headers={"ETag": '"e1"'}, text="")
+
+        async def _run():
+            async with AsyncNetcupClient(client=mock_client) as client:
+                return await client.gather(
+                    client.post("/api/v1/items", json={"a": 1}),
+                    client.put("/api/v1/items/1", json={"a": 2}),
+                    client.patch("/api/v1/items/1", params={"x": "y"}, json={"a": 3}),
+                    client.delete("/api/v1/items/1"),
+                    client.put_binary("/api/v1/upload", b"data"),
+                )
+
+        results = asyncio.run(_run())
+
+        assert results[:4] == [{"op": "post"}, {"op": "put"}, {"op": "patch"}, {}]
+        assert results[4]["etag"] == '"e1"'
+
+    def test_errors_keep_sync_semantics(self, mock_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/404", status_code=404)
+
+        async def _run():
+            async with AsyncNetcupClient(client=mock_client) as client:
+                return await client.request("GET", "/api/v1/servers/404")
+
+        with pytest.raises(APIError) as exc_info:
+            asyncio.run(_run())
+
+        assert exc_info.value.status_code == 404
+
+    def test_gather_return_exceptions_keeps_order(self, mock_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        requests_mock.get(f"{api_base_url}/api/v1/servers/2", status_code=500)
+        requests_mock.get(f"{api_base_url}/api/v1/servers/3", json={"id": 3})
+
+        async def _run():
+            async with AsyncNetcupClient(client=mock_client, concurrency=2) as client:
+                return await client.gather(
+                    *(client.get(f"/api/v1/servers/{i}") for i in (1, 2, 3)),
+                    return_exceptions=True,
+                )
+
+        results = asyncio.run(_run())
+
+        assert results[0] == {"id": 1}
+        assert isinstance(results[1], APIError)
+        assert results[2] == {"id": 3}
+
+
+@pytest.mark.unit
+class TestGather:
+
+    def test_limits_concurrency(self):
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        async def _task(i):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            await asyncio.sleep(0.01)
+            with lock:
+                state["running"] -= 1
+            return i
+
+        results = asyncio.run(gather((_task(i) for i in range(10)), limit=3))
+
+        assert results == list(range(10))
+        assert state["peak"] == 3
+
+    def test_runs_requests_concurrently(self, mock_client):
+        def _slow_get(path, params=None, accept="application/json"):
+            time.sleep(0.05)
+            return {"path": path}
+
+        mock_client.get = _slow_get
+
+        async def _run():
+            async with AsyncNetcupClient(client=mock_client, concurrency=10) as client:
+                return await client.gather(*(client.get(f"/api/v1/servers/{i}") for i in range(10)))
+
+        start = time.perf_counter()
+        results = asyncio.run(_run())
+        elapsed = time.perf_counter() - start
+
+        assert [r["path"] for r in results] == [f"/api/v1/servers/{i}" for i in range(10)]
+        assert elapsed < 0.4
@@ -0,0 +1,309 @@
+import os
+import stat
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from netcupctl.cache import ResponseCache, paths_related, resource_path
+from netcupctl.cli import cli
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.retry import RetryPolicy
+from tests.fixtures.api_responses import SERVER_LIST_RESPONSE
+from tests.fixtures.cli_helpers import create_mock_context, invoke_with_mocks
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return ResponseCache(tmp_path / "cache")
+
+
+@pytest.fixture
+def cached_client(mock_auth, cache):
+    return NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0), cache=cache)
+
+
+@pytest.mark.unit
+class TestResponseCache:
+
+    def test_key_depends_on_request(self):
+        base = ResponseCache.make_key("GET", "/api/v1/servers", {"limit": 10})
+
+        assert base == ResponseCache.make_key("get", "/api/v1/servers", {"limit": 10})
+        assert base != ResponseCache.make_key("GET", "/api/v1/servers", {"limit": 20})
+        assert base != ResponseCache.make_key("GET", "/api/v1/servers", {"limit": 10}, accept="text/plain")
+
+    def test_put_and_get(self, cache):
+        cache.put("k", "/api/v1/servers", SERVER_LIST_RESPONSE, etag='"v1"')
+
+        entry = cache.get("k")
+
+        assert entry["body"] == SERVER_LIST_RESPONSE
+        assert entry["etag"] == '"v1"'
+        assert entry["path"] == "/api/v1/servers"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX permissions")
+    def test_entries_are_private(self, cache):
+        cache.put("k", "/p", {"a": 1}, etag='"v1"')
+
+        mode = stat.S_IMODE(os.stat(cache.cache_dir / "k.json").st_mode)
+        assert mode == 0o600
+
+    def test_missing_and_corrupt_entries(self, cache):
+        assert cache.get("missing") is None
+
+        cache.cache_dir.mkdir(parents=True)
+        (cache.cache_dir / "bad.json").write_text("{not json")
+        assert cache.get("bad") is None
+
+    def test_unserializable_body_is_not_stored(self, cache):
+        cache.put("k", "/p", {"a": object()}, etag='"v1"')
+
+        assert cache.get("k") is None
+        assert not list(cache.cache_dir.glob("*.tmp"))
+
+    def test_delete_and_clear(self, cache):
+        cache.put("a", "/a", {}, etag='"1"')
+        cache.put("b", "/b", {}, etag='"2"')
+
+        cache.delete("a")
+        cache.delete("a")
+
+        assert cache.get("a") is None
+        assert cache.clear() == 1
+        assert cache.get("b") is None
+
+    def test_clear_without_directory(self, cache):
+        assert cache.clear() == 0
+
+    def test_max_age(self, cache):
+        cache.put("k", "/p", {"a": 1})
+
+        assert cache.get("k", max_age=60)["body"] == {"a": 1}
+        with patch("netcupctl.cache.time.time", return_value=time.time() + 120):
+            assert cache.get("k", max_age=60) is None
+
+    def test_evicts_least_recently_used(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_entries=2)
+        cache.put("a", "/a", {})
+        cache.put("b", "/b", {})
+        os.utime(tmp_path / "a.json", (1, 1))
+        os.utime(tmp_path / "b.json", (2, 2))
+        cache.get("a")
+
+        cache.put("c", "/c", {})
+
+        assert cache.get("b") is None
+        assert cache.get("a") is not None
+        assert cache.get("c") is not None
+
+    def test_evicts_by_size(self, tmp_path):
+        cache = ResponseCache(tmp_path, max_bytes=300)
+        cache.put("a", "/a", "x" * 100)
+        os.utime(tmp_path / "a.json", (1, 1))
+
+        cache.put("b", "/b", "y" * 100)
+
+        assert cache.get("a") is None
+        assert cache.get("b") is not None
+
+    @pytest.mark.parametrize("path, expected", [
+        ("/api/v1/servers/1/", "/api/v1/servers/1"),
+        ("/api/v1/servers/1?x=1", "/api/v1/servers/1"),
+        ("/api/v1/servers/1/interfaces/m/firewall:reapply", "/api/v1/servers/1/interfaces/m/firewall"),
+    ])
+    def test_resource_path(self, path, expected):
+        assert resource_path(path) == expected
+
+    @pytest.mark.parametrize("cached_path, related", [
+        ("/api/v1/servers/1", True),
+        ("/api/v1/servers/1/disks", True),
+        ("/api/v1/servers", True),
+        ("/api/v1/servers/10", False),
+        ("/api/v1/users/1", False),
+    ])
+    def test_paths_related(self, cached_path, related):
+        assert paths_related(cached_path, "/api/v1/servers/1") is related
+
+    def test_invalidate(self, cache):
+        cache.put("server", "/api/v1/servers/1", {})
+        cache.put("list", "/api/v1/servers", [])
+        cache.put("other", "/api/v1/servers/2", {})
+
+        assert cache.invalidate("/api/v1/servers/1") == 2
+        assert cache.get("other") is not None
+
+    def test_config_cache_dir(self, mock_config, temp_config_dir):
+        assert mock_config.cache_dir == temp_config_dir / "cache"
+
+
+@pytest.mark.unit
+class TestConditionalGet:
+
+    def test_stores_and_revalidates_with_etag(self, cached_client, requests_mock, api_base_url):
+        url = f"{api_base_url}/api/v1/servers"
+        requests_mock.get(url, json=SERVER_LIST_RESPONSE, headers={"ETag": '"v1"'})
+
+        assert cached_client.get("/api/v1/servers") == SERVER_LIST_RESPONSE
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+        requests_mock.get(url, status_code=304)
+
+        assert cached_client.get("/api/v1/servers") == SERVER_LIST_RESPONSE
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v1"'
+
+    def test_revalidates_with_last_modified(self, cached_client, requests_mock, api_base_url):
+        url = f"{api_base_url}/api/v1/servers/1"
+        stamp = "Wed, 21 Oct 2026 07:28:00 GMT"
+        requests_mock.get(url, json={"id": 1}, headers={"Last-Modified": stamp})
+        cached_client.get("/api/v1/servers/1")
+
+        requests_mock.get(url, status_code=304)
+
+        assert cached_client.get("/api/v1/servers/1") == {"id": 1}
+        assert requests_mock.last_request.headers["If-Modified-Since"] == stamp
+
+    def test_changed_resource_replaces_entry(self, cached_client, requests_mock, api_base_url):
+        url = f"{api_base_url}/api/v1/servers/1"
+        requests_mock.get(url, json={"v": 1}, headers={"ETag": '"v1"'})
+        cached_client.get("/api/v1/servers/1")
+
+        requests_mock.get(url, json={"v": 2}, headers={"ETag": '"v2"'})
+        assert cached_client.get("/api/v1/servers/1") == {"v": 2}
+
+        requests_mock.get(url, status_code=304)
+        assert cached_client.get("/api/v1/servers/1") == {"v": 2}
+        assert requests_mock.last_request.headers["If-None-Match"] == '"v2"'
+
+    def test_responses_without_validators_are_not_cached(self, cached_client, cache, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=SERVER_LIST_RESPONSE)
+
+        cached_client.get("/api/v1/servers")
+
+        assert cache.clear() == 0
+
+    def test_params_are_part_of_the_key(self, cached_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/tasks", json=[], headers={"ETag": '"t"'})
+
+        cached_client.get("/api/v1/tasks", params={"offset": 0})
+        cached_client.get("/api/v1/tasks", params={"offset": 50})
+
+        assert "If-None-Match" not in requests_mock.last_request.headers
+
+    def test_writes_are_not_cached(self, cached_client, cache, requests_mock, api_base_url):
+        requests_mock.post(f"{api_base_url}/api/v1/servers", json={"id": 1}, headers={"ETag": '"x"'})
+
+        cached_client.post("/api/v1/servers", json={})
+
+        assert cache.clear() == 0
+
+    def test_verbose_reports_cache_hit(self, mock_auth, cache, requests_mock, api_base_url, capsys):
+        client = NetcupClient(auth=mock_auth, verbose=True, cache=cache)
+        url = f"{api_base_url}/api/v1/servers"
+        requests_mock.get(url, json=[], headers={"ETag": '"v1"'})
+        client.get("/api/v1/servers")
+        requests_mock.get(url, status_code=304)
+
+        client.get("/api/v1/servers")
+
+        assert "Not modified" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("args, has_cache", [([], True), (["--no-cache"], False)])
+    def test_cli_no_cache_option(self, cli_runner, args, has_cache):
+        with patch("netcupctl.cli.NetcupClient") as client_cls:
+            client_cls.return_value.get.return_value = {"data": "OK"}
+            cli_runner.invoke(cli, args + ["ping"])
+
+        assert (client_cls.call_args[1]["cache"] is not None) == has_cache
+
+    def test_logout_clears_cache(self, cli_runner, mock_config):
+        ResponseCache(mock_config.cache_dir).put("k", "/api/v1/servers", [], etag='"v1"')
+        ctx = create_mock_context()
+        ctx.config = mock_config
+        ctx.auth.logout.return_value = True
+
+        result = invoke_with_mocks(cli_runner, ["auth", "logout"], ctx)
+
+        assert result.exit_code == 0
+        assert ResponseCache(mock_config.cache_dir).get("k") is None
+
+
+@pytest.mark.unit
+class TestCacheTtl:
+
+    @pytest.fixture
+    def ttl_client(self, mock_auth, cache):
+        return NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0), cache=cache, cache_ttl=30)
+
+    def test_fresh_entries_skip_the_network(self, ttl_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        for _ in range(10):
+            assert ttl_client.get("/api/v1/servers/1") == {"id": 1}
+
+        assert requests_mock.call_count == 1
+
+    def test_expired_entries_are_fetched_again(self, ttl_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        ttl_client.get("/api/v1/servers/1")
+
+        with patch("netcupctl.client.time.time", return_value=time.time() + 60):
+            ttl_client.get("/api/v1/servers/1")
+
+        assert requests_mock.call_count == 2
+
+    @pytest.mark.parametrize("method", ["post", "put", "patch", "delete"])
+    def test_writes_invalidate_entries(self, ttl_client, requests_mock, api_base_url, method):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"state": "ON"})
+        requests_mock.register_uri(method.upper(), f"{api_base_url}/api/v1/servers/1", json={})
+        ttl_client.get("/api/v1/servers/1")
+
+        getattr(ttl_client, method)("/api/v1/servers/1")
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"state": "OFF"})
+
+        assert ttl_client.get("/api/v1/servers/1") == {"state": "OFF"}
+
+    def test_failed_write_invalidates_entries(self, ttl_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[1])
+        requests_mock.post(f"{api_base_url}/api/v1/servers/1/snapshots", status_code=500)
+        ttl_client.get("/api/v1/servers")
+
+        with pytest.raises(APIError):
+            ttl_client.post("/api/v1/servers/1/snapshots", json={})
+
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[1, 2])
+        assert ttl_client.get("/api/v1/servers") == [1, 2]
+
+    def test_put_binary_invalidates_entries(self, ttl_client, cache, requests_mock, api_base_url):
+        path = "/api/v1/users/1/custom-images/x"
+        requests_mock.get(f"{api_base_url}{path}", json={})
+        requests_mock.put(f"{api_base_url}{path}/parts/1", status_code=200, text="")
+        ttl_client.get(path)
+
+        ttl_client.put_binary(f"{path}/parts/1", b"data")
+
+        assert cache.clear() == 0
+
+    def test_verbose_reports_ttl_hit(self, mock_auth, cache, requests_mock, api_base_url, capsys):
+        client = NetcupClient(auth=mock_auth, verbose=True, cache=cache, cache_ttl=30)
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+        client.get("/api/v1/servers")
+        client.get("/api/v1/servers")
+
+        assert "Using cached response" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("value, expected", [(None, 0.0), ("30s", 30.0), ("5m", 300.0), ("2", 2.0)])
+    def test_cli_cache_ttl_option(self, cli_runner, value, expected):
+        args = ["--cache-ttl", value] if value else []
+        with patch("netcupctl.cli.NetcupClient") as client_cls:
+            client_cls.return_value.get.return_value = {"data": "OK"}
+            cli_runner.invoke(cli, args + ["ping"])
+
+        assert client_cls.call_args[1]["cache_ttl"] == expected
+
+    def test_cli_rejects_invalid_cache_ttl(self, cli_runner):
+        result = cli_runner.invoke(cli, ["--cache-ttl", "soon", "ping"])
+
+        assert result.exit_code == 2
+        assert "Invalid duration" in result.output
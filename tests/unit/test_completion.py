@@ -0,0 +1,80 @@
+"""
+Tests for netcupctl.completion
+"""
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.completion import complete, split_line
+from netcupctl.inventory import Inventory
+
+
+@pytest.fixture
+def inventory():
+    return Inventory({
+        "servers": {
+            "12345": {"macs": ["00:11:22:33:44:55"], "snapshots": ["before-upgrade", "nightly"]},
+            "67890": {"macs": ["aa:bb:cc:dd:ee:ff"], "snapshots": []},
+        },
+        "policies": [{"id": "7", "name": "web"}, {"id": "8", "name": "ssh-only"}],
+    })
+
+
+@pytest.mark.unit
+class TestSplitLine:
+
+    def test_current_word(self):
+        assert split_line("servers ge") == (["servers"], "ge")
+
+    def test_after_space(self):
+        assert split_line("servers get ") == (["servers", "get"], "")
+
+    def test_strips_program_name(self):
+        assert split_line("netcupctl servers ") == (["servers"], "")
+
+    def test_empty(self):
+        assert split_line("") == ([], "")
+
+
+@pytest.mark.unit
+class TestComplete:
+
+    def test_subcommands(self, inventory):
+        assert complete(cli, inventory, "ser") == ["server", "servers"]
+        assert "snapshots" in complete(cli, inventory, "")
+
+    def test_nested_subcommands(self, inventory):
+        assert complete(cli, inventory, "snapshots re") == ["revert"]
+
+    def test_server_ids(self, inventory):
+        assert complete(cli, inventory, "servers get ") == ["12345", "67890"]
+        assert complete(cli, inventory, "servers get 6") == ["67890"]
+
+    def test_macs_of_server(self, inventory):
+        assert complete(cli, inventory, "interfaces get 67890 ") == ["aa:bb:cc:dd:ee:ff"]
+        assert complete(cli, inventory, "firewall show 12345 00:") == ["00:11:22:33:44:55"]
+
+    def test_snapshot_names(self, inventory):
+        assert complete(cli, inventory, "snapshots delete 12345 ") == ["before-upgrade", "nightly"]
+
+    def test_policies(self, inventory):
+        assert complete(cli, inventory, "firewall-policies get ") == ["7", "8"]
+        assert complete(cli, inventory, "firewall-policies upsert --name ") == ["ssh-only", "web"]
+        assert complete(cli, inventory, "firewall configure 12345 00:11:22:33:44:55 --name w") == ["web"]
+
+    def test_choice_values(self, inventory):
+        assert complete(cli, inventory, "--format y") == ["yaml"]
+
+    def test_global_options_are_skipped(self, inventory):
+        assert complete(cli, inventory, "--format json --verbose servers get 1") == ["12345"]
+
+    def test_option_names(self, inventory):
+        assert complete(cli, inventory, "servers list --") == ["--all", "--help", "--limit"]
+
+    def test_no_candidates_after_last_argument(self, inventory):
+        assert complete(cli, inventory, "servers get 12345 ") == []
+
+    def test_flags_do_not_take_values(self, inventory):
+        assert complete(cli, inventory, "snapshots delete --yes 12345 ") == ["before-upgrade", "nightly"]
+
+    def test_unknown_server(self, inventory):
+        assert complete(cli, inventory, "interfaces get 999 ") == []
@@ -0,0 +1,91 @@
+import threading
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.concurrency import map_requests
+
+
+@pytest.mark.unit
+class TestMapRequests:
+
+    def test_results_keep_call_order(self, mock_client, requests_mock, api_base_url):
+        for i in range(5):
+            requests_mock.get(f"{api_base_url}/api/v1/servers/{i}", json={"id": i})
+
+        calls = [("get", f"/api/v1/servers/{i}") for i in range(5)]
+        results = map_requests(mock_client, calls, max_workers=4)
+
+        assert results == [{"id": i} for i in range(5)]
+
+    def test_passes_keyword_arguments(self):
+        client = MagicMock(spec=NetcupClient)
+        client.get.return_value = []
+
+        map_requests(client, [("GET", "/api/v1/tasks", {"params": {"limit": 5}})])
+
+        client.get.assert_called_once_with("/api/v1/tasks", params={"limit": 5})
+
+    def test_runs_concurrently(self):
+        client = MagicMock(spec=NetcupClient)
+        lock = threading.Lock()
+        state = {"running": 0, "peak": 0}
+
+        def _get(path):
+            with lock:
+                state["running"] += 1
+                state["peak"] = max(state["peak"], state["running"])
+            time.sleep(0.02)
+            with lock:
+                state["running"] -= 1
+            return path
+
+        client.get.side_effect = _get
+
+        results = map_requests(client, [("get", f"/p/{i}") for i in range(12)], max_workers=4)
+
+        assert results == [f"/p/{i}" for i in range(12)]
+        assert state["peak"] == 4
+
+    def test_single_worker_runs_in_calling_thread(self):
+        client = MagicMock(spec=NetcupClient)
+        client.get.side_effect = lambda path: threading.current_thread().name
+
+        results = map_requests(client, [("get", "/a"), ("get", "/b")], max_workers=1)
+
+        assert results == [threading.current_thread().name] * 2
+
+    def test_raises_api_error_by_default(self):
+        client = MagicMock(spec=NetcupClient)
+        client.get.side_effect = [{"ok": True}, APIError("boom", status_code=500)]
+
+        with pytest.raises(APIError):
+            map_requests(client, [("get", "/a"), ("get", "/b")], max_workers=2)
+
+    def test_return_exceptions(self):
+        client = MagicMock(spec=NetcupClient)
+
+        def _get(path):
+            if path == "/b":
+                raise APIError("Resource not found.", status_code=404)
+            return path
+
+        client.get.side_effect = _get
+
+        results = map_requests(client, [("get", "/a"), ("get", "/b"), ("get", "/c")], return_exceptions=True)
+
+        assert results[0] == "/a"
+        assert isinstance(results[1], APIError)
+        assert results[2] == "/c"
+
+    def test_return_exceptions_does_not_swallow_other_errors(self):
+        client = MagicMock(spec=NetcupClient)
+        client.get.side_effect = KeyError("bug")
+
+        with pytest.raises(KeyError):
+            map_requests(client, [("get", "/a")], return_exceptions=True)
+
+    def test_empty_calls(self):
+        assert not map_requests(MagicMock(spec=NetcupClient), [])
@@ -0,0 +1,127 @@
+"""
+Tests for netcupctl.connection
+"""
+import json
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.client import NetcupClient
+from netcupctl.connection import ConnectionSettings
+from netcupctl.retry import RetryPolicy
+
+
+def _adapter(session):
+    return session.get_adapter("https://www.servercontrolpanel.de")
+
+
+@pytest.mark.unit
+class TestConnectionSettings:
+
+    def test_defaults(self):
+        settings = ConnectionSettings()
+
+        assert settings.timeout == (10.0, 30.0)
+        assert settings.upload_timeouts == (10.0, 300.0)
+        assert settings.pool_size(4) == (10, False)
+        assert settings.pool_size(32) == (32, False)
+
+    def test_configured_pool_blocks_beyond_its_size(self):
+        settings = ConnectionSettings(pool_maxsize=16)
+
+        assert settings.pool_size(8) == (16, False)
+        assert settings.pool_size(32) == (16, True)
+
+    def test_overrides_take_precedence_over_config(self):
+        settings = ConnectionSettings.from_config(
+            {"read_timeout": 60, "pool_maxsize": 20, "keep_alive": False, "unknown": 1},
+            read_timeout=5.0, pool_maxsize=None,
+        )
+
+        assert settings.read_timeout == 5.0
+        assert settings.pool_maxsize == 20
+        assert settings.keep_alive is False
+
+    @pytest.mark.parametrize("config", [
+        {"connect_timeout": 0},
+        {"read_timeout": "30"},
+        {"pool_maxsize": 2.5},
+        {"pool_connections": True},
+        {"keep_alive": "yes"},
+        {"api_url": "localhost:8080"},
+        {"api_url": "http://host/a?b=1"},
+    ])
+    def test_invalid_config(self, config):
+        with pytest.raises(ValueError, match=next(iter(config))):
+            ConnectionSettings.from_config(config)
+
+
+@pytest.mark.unit
+class TestClientSettings:
+
+    def test_timeouts(self, mock_auth, requests_mock, api_base_url):
+        settings = ConnectionSettings(connect_timeout=2, read_timeout=7, upload_timeout=70)
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), settings=settings)
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+        requests_mock.put(f"{api_base_url}/upload", json={"etag": "x"})
+
+        client.get("/api/v1/servers")
+        assert requests_mock.last_request.timeout == (2, 7)
+        client.put_binary("/upload", data=b"x")
+        assert requests_mock.last_request.timeout == (2, 70)
+
+    def test_api_url(self, mock_auth):
+        client = NetcupClient(mock_auth, settings=ConnectionSettings(api_url="http://127.0.0.1:9/"))
+
+        assert client.BASE_URL == "http://127.0.0.1:9"
+
+    def test_pool(self):
+        session = NetcupClient.create_session(32, ConnectionSettings(pool_connections=2, pool_maxsize=16))
+        adapter = _adapter(session)
+
+        assert (adapter._pool_connections, adapter._pool_maxsize, adapter._pool_block) == (2, 16, True)
+        assert session.headers["Connection"] == "keep-alive"
+
+    def test_keep_alive_disabled(self):
+        session = NetcupClient.create_session(settings=ConnectionSettings(keep_alive=False))
+
+        assert session.headers["Connection"] == "close"
+
+
+@pytest.mark.unit
+class TestConnectionOptions:
+
+    @pytest.fixture
+    def servers(self, requests_mock, api_base_url):
+        return requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+
+    def test_config_file(self, cli_runner, mock_context, servers, monkeypatch):
+        sessions = []
+        create_session = NetcupClient.create_session
+        monkeypatch.setattr(NetcupClient, "create_session",
+                            staticmethod(lambda *args: sessions.append(create_session(*args)) or sessions[-1]))
+        mock_context.config.save_config({"read_timeout": 45, "pool_maxsize": 4})
+
+        result = cli_runner.invoke(cli, ["--parallel", "8", "servers", "list"], obj=mock_context)
+
+        assert result.exit_code == 0, result.output
+        assert servers.last_request.timeout == (10.0, 45)
+        assert (_adapter(sessions[-1])._pool_maxsize, _adapter(sessions[-1])._pool_block) == (4, True)
+
+    def test_options_and_environment_override_config(self, cli_runner, mock_context, servers):
+        mock_context.config.save_config({"connect_timeout": 3, "read_timeout": 45})
+
+        result = cli_runner.invoke(cli, ["--read-timeout", "12", "servers", "list"], obj=mock_context,
+                                   env={"NETCUPCTL_CONNECT_TIMEOUT": "1.5"})
+
+        assert result.exit_code == 0, result.output
+        assert servers.last_request.timeout == (1.5, 12.0)
+
+    def test_invalid_config(self, cli_runner, mock_context):
+        mock_context.config.save_config({"pool_maxsize": 0})
+
+        result = cli_runner.invoke(cli, ["servers", "list"], obj=mock_context)
+
+        assert result.exit_code == 1
+        assert "Invalid setting" in result.output
+        assert "pool_maxsize must be a positive integer" in result.output
@@ -0,0 +1,267 @@
+import io
+import os
+import stat
+import sys
+import tempfile
+import threading
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from netcupctl import daemon as daemon_lib
+from netcupctl.cli import cli
+from netcupctl.daemon import DaemonServer, forward, send, should_forward
+from netcupctl.launcher import main
+
+pytestmark = pytest.mark.skipif(not daemon_lib.is_supported(), reason="Unix domain sockets")
+
+
+@pytest.fixture
+def sock_path():
+    # AF_UNIX paths are limited to about 100 characters, pytest's tmp_path can be longer
+    with tempfile.TemporaryDirectory(prefix="nc") as directory:
+        yield Path(directory) / "daemon.sock"
+
+
+@pytest.fixture
+def server(sock_path):
+    calls = []
+    envs = []
+
+    def runner(argv, stdin):
+        # Like the real commands, only "-" arguments and confirmations read stdin
+        text = stdin.read() if "-" in argv else stdin.readline() if "delete" in argv else ""
+        calls.append((argv, text, os.getcwd()))
+        envs.append(daemon_lib.netcupctl_env())
+        if argv == ["boom"]:
+            raise RuntimeError("kaputt")
+        return 3, f"out {' '.join(argv)}\n", "err\n"
+
+    server = DaemonServer(sock_path, runner)
+    server.calls = calls
+    server.envs = envs
+    thread = threading.Thread(target=server.serve, kwargs={"poll_interval": 0.05})
+    thread.start()
+    yield server
+    server.stopping.set()
+    thread.join(5)
+
+
+class _Tty(io.StringIO):
+    def isatty(self):
+        return True
+
+
+@pytest.mark.unit
+class TestForwardingRules:
+
+    @pytest.mark.parametrize("argv, expected", [
+        (["servers", "list"], True),
+        (["--format", "json", "servers", "list"], True),
+        (["auth", "login"], False),
+        (["daemon", "stop"], False),
+        (["--trace-file", "t.json", "auth", "login"], False),
+        (["--api-url", "http://127.0.0.1:8080", "batch", "-"], False),
+        (["--version"], False),
+    ])
+    def test_should_forward(self, monkeypatch, argv, expected):
+        monkeypatch.delenv("NETCUPCTL_NO_DAEMON", raising=False)
+        monkeypatch.setattr(sys, "stdin", io.StringIO())
+
+        assert should_forward(argv) is expected
+
+    def test_interactive_terminal_runs_locally(self, monkeypatch):
+        monkeypatch.delenv("NETCUPCTL_NO_DAEMON", raising=False)
+        monkeypatch.setattr(sys, "stdin", _Tty())
+        monkeypatch.setattr(sys, "stdout", _Tty())
+
+        assert should_forward(["servers", "list"]) is False
+
+    def test_environment_disables_forwarding(self, monkeypatch):
+        monkeypatch.setenv("NETCUPCTL_NO_DAEMON", "1")
+        monkeypatch.setattr(sys, "stdin", io.StringIO())
+
+        assert should_forward(["servers", "list"]) is False
+
+
+@pytest.mark.unit
+class TestDaemonServer:
+
+    def test_ping_and_stop(self, server, sock_path):
+        assert send(sock_path, {"op": "ping"})["pid"] == os.getpid()
+
+        send(sock_path, {"op": "stop"})
+
+        assert server.stopping.wait(1)
+
+    def test_socket_is_private(self, server, sock_path):
+        assert stat.S_IMODE(os.stat(sock_path).st_mode) & 0o077 == 0
+
+    def test_forward_replays_output(self, server, sock_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", _Tty())
+        exit_code = forward(sock_path, ["servers", "list"])
+
+        captured = capsys.readouterr()
+        assert exit_code == 3
+        assert captured.out == "out servers list\n"
+        assert captured.err == "err\n"
+        assert server.calls == [(["servers", "list"], "", os.getcwd())]
+
+    def test_forward_sends_stdin_for_dash(self, server, sock_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", io.StringIO("{}"))
+
+        forward(sock_path, ["firewall-policies", "create", "--rules-file", "-"])
+
+        assert server.calls[0][1] == "{}"
+
+    def test_forward_sends_piped_stdin_as_read(self, server, sock_path, monkeypatch, capsys):
+        stdin = io.StringIO("y\nn\n")
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        forward(sock_path, ["servers", "delete", "1"])
+        forward(sock_path, ["servers", "delete", "2"])
+
+        assert [call[1] for call in server.calls] == ["y\n", "n\n"]
+        assert stdin.read() == ""
+
+    def test_forward_leaves_unread_stdin_to_the_caller(self, server, sock_path, monkeypatch, capsys):
+        stdin = io.StringIO("1\n2\n")
+        monkeypatch.setattr(sys, "stdin", stdin)
+
+        for server_id in iter(stdin.readline, ""):
+            forward(sock_path, ["servers", "get", server_id.strip()])
+
+        assert [call[0] for call in server.calls] == [["servers", "get", "1"], ["servers", "get", "2"]]
+
+    def test_forward_applies_environment_per_command(self, server, sock_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", _Tty())
+        monkeypatch.setenv("NETCUPCTL_API_URL", "http://127.0.0.1:9")
+        monkeypatch.setenv("NETCUPCTL_READ_TIMEOUT", "5")
+
+        forward(sock_path, ["servers", "list"])
+        # The daemon runs in this process and restores its own environment after every command
+        assert daemon_lib.netcupctl_env() == {}
+        forward(sock_path, ["servers", "list"])
+
+        assert server.envs[0] == {"NETCUPCTL_API_URL": "http://127.0.0.1:9", "NETCUPCTL_READ_TIMEOUT": "5"}
+        assert server.envs[1] == {}
+
+    def test_forward_runs_locally_with_other_pool_settings(self, server, sock_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", _Tty())
+        monkeypatch.setenv("NETCUPCTL_POOL_MAXSIZE", "2")
+
+        assert forward(sock_path, ["servers", "list"]) is None
+        assert server.calls == []
+
+    def test_runner_failure(self, server, sock_path, monkeypatch, capsys):
+        monkeypatch.setattr(sys, "stdin", _Tty())
+        assert forward(sock_path, ["boom"]) == 1
+        assert "kaputt" in capsys.readouterr().err
+
+    def test_unknown_request(self, server, sock_path):
+        assert send(sock_path, {"op": "dance"})["ok"] is False
+
+    def test_no_daemon(self, sock_path):
+        assert send(sock_path, {"op": "ping"}) is None
+        assert forward(sock_path, ["servers", "list"]) is None
+
+    def test_stale_socket(self, sock_path):
+        sock_path.touch()
+
+        assert forward(sock_path, ["servers", "list"]) is None
+
+    def test_idle_timeout(self, sock_path):
+        server = DaemonServer(sock_path, lambda argv, stdin: (0, "", ""), idle_timeout=0.1)
+
+        server.serve(poll_interval=0.05)
+
+        assert not sock_path.exists()
+
+
+@pytest.mark.unit
+class TestDaemonCommands:
+
+    def test_status_without_daemon(self, cli_runner, mock_config):
+        with patch("netcupctl.cli.ConfigManager", return_value=mock_config):
+            result = cli_runner.invoke(cli, ["daemon", "status"])
+
+        assert result.exit_code == 1
+        assert "not running" in result.output
+
+    def test_stop_without_daemon(self, cli_runner, mock_config):
+        with patch("netcupctl.cli.ConfigManager", return_value=mock_config):
+            result = cli_runner.invoke(cli, ["daemon", "stop"])
+
+        assert result.exit_code == 0
+        assert "not running" in result.output
+
+    def test_status_and_stop_with_daemon(self, cli_runner, mock_config, server, sock_path):
+        with patch("netcupctl.commands.daemon.socket_path", return_value=sock_path), \
+                patch("netcupctl.cli.ConfigManager", return_value=mock_config):
+            status = cli_runner.invoke(cli, ["daemon", "status"])
+            start = cli_runner.invoke(cli, ["daemon", "start"])
+            stop = cli_runner.invoke(cli, ["daemon", "stop"])
+
+        assert status.exit_code == 0
+        assert f"pid {os.getpid()}" in status.output
+        assert "already running" in start.output
+        assert "[OK] Daemon stopped" in stop.output
+
+    def test_foreground_daemon_runs_commands(self, cli_runner, mock_config, sock_path, requests_mock, api_base_url,
+                                             valid_token_data):
+        mock_config.save_tokens(valid_token_data)
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+        thread = threading.Thread(target=self._start_foreground, args=(cli_runner, mock_config, sock_path))
+        thread.start()
+        try:
+            response = self._wait_for(sock_path)
+            assert response is not None
+
+            result = send(sock_path, {"op": "run", "argv": ["ping"], "cwd": os.getcwd()}, timeout=5)
+        finally:
+            send(sock_path, {"op": "stop"})
+            thread.join(5)
+
+        assert result["exit_code"] == 0
+        assert result["stdout"] == "pong\n"
+        assert requests_mock.last_request.headers["Authorization"] == f"Bearer {valid_token_data['access_token']}"
+
+    @staticmethod
+    def _start_foreground(cli_runner, mock_config, sock_path):
+        with patch("netcupctl.commands.daemon.socket_path", return_value=sock_path), \
+                patch("netcupctl.cli.ConfigManager", return_value=mock_config), \
+                patch("netcupctl.commands.daemon.signal.signal"):
+            cli_runner.invoke(cli, ["daemon", "start", "--foreground", "--idle-timeout", "0"])
+
+    @staticmethod
+    def _wait_for(sock_path):
+        for _ in range(100):
+            response = send(sock_path, {"op": "ping"})
+            if response:
+                return response
+            threading.Event().wait(0.05)
+        return None
+
+
+@pytest.mark.unit
+class TestLauncher:
+
+    def test_forwards_to_daemon(self, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["netcupctl", "servers", "list"])
+        with patch("netcupctl.launcher.should_forward", return_value=True), \
+                patch("netcupctl.launcher.forward", return_value=4) as forward_mock:
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 4
+        assert forward_mock.call_args[0][1] == ["servers", "list"]
+
+    def test_runs_locally_without_daemon(self, monkeypatch):
+        monkeypatch.setattr(sys, "argv", ["netcupctl", "--version"])
+        with patch("netcupctl.launcher.should_forward", return_value=True), \
+                patch("netcupctl.launcher.forward", return_value=None):
+            with pytest.raises(SystemExit) as exc_info:
+                main()
+
+        assert exc_info.value.code == 0
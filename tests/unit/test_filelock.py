@@ -0,0 +1,37 @@
+"""
+Tests for netcupctl.filelock
+"""
+import os
+import threading
+
+import pytest
+
+from netcupctl.filelock import lock_fd, unlock_fd
+
+
+@pytest.mark.unit
+class TestFileLock:
+
+    def test_lock_excludes_other_descriptors(self, tmp_path):
+        path = tmp_path / "state.lock"
+        first = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        second = os.open(path, os.O_RDWR | os.O_CREAT, 0o600)
+        acquired = threading.Event()
+
+        def _lock_second():
+            lock_fd(second)
+            acquired.set()
+            unlock_fd(second)
+
+        try:
+            lock_fd(first)
+            thread = threading.Thread(target=_lock_second)
+            thread.start()
+            assert not acquired.wait(0.2)
+
+            unlock_fd(first)
+            assert acquired.wait(5)
+            thread.join(5)
+        finally:
+            os.close(first)
+            os.close(second)
@@ -0,0 +1,69 @@
+"""
+Tests for netcupctl.inventory
+"""
+import time
+
+import pytest
+
+from netcupctl.inventory import Inventory
+
+
+@pytest.mark.unit
+class TestInventory:
+
+    def test_empty(self, mock_config):
+        inventory = Inventory.load(mock_config)
+
+        assert inventory.server_ids() == []
+        assert inventory.macs("1") == []
+        assert inventory.is_stale()
+
+    def test_save_and_load(self, mock_config):
+        inventory = Inventory({
+            "updated": time.time(),
+            "servers": {"1": {"macs": ["00:11:22:33:44:55"], "snapshots": ["s1"]}},
+            "policies": [{"id": "7", "name": "web"}],
+        })
+
+        inventory.save(mock_config)
+        loaded = Inventory.load(mock_config)
+
+        assert loaded.to_dict() == inventory.to_dict()
+        assert not loaded.is_stale()
+        assert loaded.snapshots("1") == ["s1"]
+        assert loaded.policy_ids() == ["7"]
+        assert loaded.policy_names() == ["web"]
+
+    def test_corrupted_file(self, mock_config):
+        mock_config.ensure_config_dir()
+        mock_config.inventory_file.write_text("[1, 2]", encoding="utf-8")
+
+        assert Inventory.load(mock_config).servers == {}
+
+    def test_fetch(self, mock_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[{"id": 1}, {"id": 2}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1/interfaces", json=[{"mac": "00:11:22:33:44:55"}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1/snapshots", json=[{"name": "nightly"}])
+        requests_mock.get(f"{api_base_url}/api/v1/servers/2/interfaces", status_code=500)
+        requests_mock.get(f"{api_base_url}/api/v1/servers/2/snapshots", json=[])
+        requests_mock.get(
+            f"{api_base_url}/api/v1/users/u1/firewall-policies",
+            json=[{"id": 7, "name": "web"}, {"name": "no-id"}],
+        )
+
+        inventory = Inventory.fetch(mock_client, "u1", max_workers=4)
+
+        assert inventory.server_ids() == ["1", "2"]
+        assert inventory.macs("1") == ["00:11:22:33:44:55"]
+        assert inventory.snapshots("1") == ["nightly"]
+        assert inventory.macs("2") == []
+        assert inventory.policies == [{"id": "7", "name": "web"}]
+        assert not inventory.is_stale()
+
+    def test_fetch_without_user(self, mock_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+
+        inventory = Inventory.fetch(mock_client, None, max_workers=1)
+
+        assert inventory.servers == {}
+        assert inventory.policies == []
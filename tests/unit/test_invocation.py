@@ -0,0 +1,138 @@
+import sys
+import threading
+
+import click
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.invocation import command_name, global_args, run_command
+
+
+@pytest.mark.unit
+class TestRunCommand:
+
+    def test_captures_output_and_exit_code(self, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        exit_code, out, err = run_command(cli, mock_context, ["ping"])
+
+        assert exit_code == 0
+        assert out == "pong\n"
+        assert err == ""
+
+    def test_command_errors(self, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", status_code=404)
+
+        exit_code, out, err = run_command(cli, mock_context, ["servers", "get", "1"])
+
+        assert exit_code == 404
+        assert "Resource not found" in err
+
+    def test_usage_errors(self, mock_context):
+        exit_code, _, err = run_command(cli, mock_context, ["servers", "frobnicate"])
+
+        assert exit_code == 2
+        assert "No such command" in err
+
+    def test_help(self, mock_context):
+        exit_code, out, _ = run_command(cli, mock_context, ["--help"])
+
+        assert exit_code == 0
+        assert "Usage: netcupctl" in out
+
+    def test_shares_session_and_auth(self, mock_context, requests_mock, api_base_url):
+        mock_context.session = mock_context.client.session
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+
+        run_command(cli, mock_context, ["--format", "json", "servers", "list"])
+
+        assert mock_context.formatter.format == "json"
+        assert requests_mock.last_request.headers["Authorization"] == "Bearer test_access_token_12345"
+
+    def test_per_invocation_options(self, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[{"id": 1}])
+
+        _, as_json, _ = run_command(cli, mock_context, ["--format", "json", "servers", "list"])
+        _, as_yaml, _ = run_command(cli, mock_context, ["--format", "yaml", "servers", "list"])
+
+        assert as_json.startswith("[")
+        assert as_yaml.startswith("- id: 1")
+
+    def test_stdin(self, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.post(f"{api_base_url}/api/v1/users/test_user_123/firewall-policies", json={"id": 7})
+
+        exit_code, out, _ = run_command(
+            cli, mock_context,
+            ["--format", "json", "firewall-policies", "create", "--name", "web", "--rules-file", "-"],
+            stdin='{"rules": []}',
+        )
+
+        assert exit_code == 0, out
+        assert requests_mock.last_request.json() == {"name": "web", "rules": []}
+
+    def test_concurrent_commands_capture_separately(self, mock_context, requests_mock, api_base_url):
+        for i in range(8):
+            requests_mock.get(f"{api_base_url}/api/v1/servers/{i}", json={"id": i})
+        results = {}
+
+        def _run(i):
+            results[i] = run_command(cli, mock_context, ["--format", "json", "servers", "get", str(i)])
+
+        threads = [threading.Thread(target=_run, args=(i,)) for i in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        for i in range(8):
+            assert results[i][0] == 0
+            assert f'"id": {i}' in results[i][1]
+
+    def test_restores_streams_of_the_calling_thread(self, mock_context, capsys):
+        run_command(cli, mock_context, ["--help"])
+        print("after")
+
+        assert capsys.readouterr().out == "after\n"
+        assert sys.stdout.isatty() is False
+
+
+@pytest.mark.unit
+class TestGlobalArgs:
+
+    def test_rebuilds_command_line_options(self, monkeypatch):
+        monkeypatch.setenv("NETCUPCTL_READ_TIMEOUT", "5")
+        argv = ["-v", "--no-keep-alive", "--format", "JSON", "--retries", "2", "--trace-file", "t.json", "ping"]
+
+        with cli.make_context("netcupctl", argv) as ctx:
+            assert global_args(ctx) == ["--format", "json", "--verbose", "--retries", "2", "--no-keep-alive"]
+
+    def test_defaults_are_left_out(self):
+        with cli.make_context("netcupctl", ["ping"]) as ctx:
+            assert global_args(ctx) == []
+
+
+_OPTIONS_WITH_VALUE = [param.opts[0] for param in cli.params if isinstance(param, click.Option) and not param.is_flag]
+
+
+@pytest.mark.unit
+class TestCommandName:
+
+    @pytest.mark.parametrize("argv, expected", [
+        (["servers", "list"], "servers"),
+        (["--format", "json", "-v", "tasks", "list"], "tasks"),
+        (["--cache-ttl", "30s", "--no-cache", "ping"], "ping"),
+        (["--api-url=http://127.0.0.1:8080", "ping"], "ping"),
+        (["--help"], None),
+    ])
+    def test_command_name(self, argv, expected):
+        assert command_name(cli, argv) == expected
+
+    @pytest.mark.parametrize("option", _OPTIONS_WITH_VALUE)
+    def test_skips_value_of_every_global_option(self, option):
+        assert command_name(cli, [option, "shell", "auth", "login"]) == "auth"
+
+    def test_covers_options_added_later(self):
+        assert {
+            "--api-url", "--trace-file", "--timings-file", "--slow-threshold", "--connect-timeout",
+            "--read-timeout", "--upload-timeout", "--pool-connections", "--pool-maxsize",
+        } <= set(_OPTIONS_WITH_VALUE)
@@ -0,0 +1,192 @@
+"""
+Tests for netcupctl.latency
+"""
+import json
+import random
+import threading
+
+import pytest
+
+from netcupctl.client import NetcupClient
+from netcupctl.latency import (
+    LatencyHistogram,
+    LatencyRecorder,
+    LatencyStats,
+    PathTemplates,
+    load_stats,
+    read_slow_log,
+    reset,
+)
+from netcupctl.retry import RetryPolicy
+
+TEMPLATES = [
+    "/api/v1/servers",
+    "/api/v1/servers/{serverId}",
+    "/api/v1/servers/{serverId}/snapshots",
+    "/api/v1/servers/{serverId}/snapshots/{name}",
+    "/api/v1/servers/{serverId}/snapshots/{name}:revert",
+    "/api/v1/tasks/{uuid}:cancel",
+]
+
+
+def _recorder(state_dir, threshold=1.0):
+    return LatencyRecorder(state_dir, lambda: PathTemplates(TEMPLATES), threshold)
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+
+    def test_empty(self):
+        histogram = LatencyHistogram()
+
+        assert histogram.percentile(99) == 0.0
+        assert histogram.mean == 0.0
+
+    def test_percentiles_within_relative_error(self):
+        rng = random.Random(1)
+        values = sorted(rng.expovariate(10) for _ in range(5000))
+        histogram = LatencyHistogram()
+        for value in values:
+            histogram.record(value)
+
+        for percent in (50, 90, 99):
+            exact = values[int(percent / 100 * len(values)) - 1]
+            assert exact <= histogram.percentile(percent) <= exact * 1.04 + 1e-6
+        assert histogram.percentile(100) == histogram.max == values[-1]
+        assert histogram.count == 5000
+
+    def test_merge_and_round_trip(self):
+        first, second = LatencyHistogram(), LatencyHistogram()
+        first.record(0.010)
+        second.record(0.200)
+        second.record(0.000005)
+
+        first.merge(LatencyHistogram.from_dict(json.loads(json.dumps(second.to_dict()))))
+
+        assert first.count == 3
+        assert first.max == 0.2
+        assert first.total == pytest.approx(0.210005)
+        assert first.percentile(100) == 0.2
+
+
+@pytest.mark.unit
+class TestPathTemplates:
+
+    @pytest.mark.parametrize("path,template", [
+        ("/api/v1/servers", "/api/v1/servers"),
+        ("/api/v1/servers/12345", "/api/v1/servers/{serverId}"),
+        ("/api/v1/servers/12345/snapshots", "/api/v1/servers/{serverId}/snapshots"),
+        ("/api/v1/servers/1/snapshots/daily:revert", "/api/v1/servers/{serverId}/snapshots/{name}:revert"),
+        ("/api/v1/servers/1/snapshots/daily", "/api/v1/servers/{serverId}/snapshots/{name}"),
+        ("/api/v1/tasks/0c8b-11:cancel", "/api/v1/tasks/{uuid}:cancel"),
+    ])
+    def test_spec_templates(self, path, template):
+        assert PathTemplates(TEMPLATES).normalize(path) == template
+
+    @pytest.mark.parametrize("path,template", [
+        ("/api/v1/users/42/ssh-keys", "/api/v1/users/{id}/ssh-keys"),
+        ("/api/v1/tasks/123e4567-e89b-12d3-a456-426614174000", "/api/v1/tasks/{id}"),
+        ("/api/v1/servers/1/interfaces/aa:bb:cc:dd:ee:ff", "/api/v1/servers/{id}/interfaces/{id}"),
+        ("/api/ping", "/api/ping"),
+    ])
+    def test_fallback(self, path, template):
+        assert PathTemplates().normalize(path) == template
+
+
+@pytest.mark.unit
+class TestLatencyRecorder:
+
+    def test_flush_merges_runs(self, tmp_path):
+        for seconds in (0.1, 0.3):
+            recorder = _recorder(tmp_path)
+            recorder.record("get", "/api/v1/servers/1", 200, seconds)
+            recorder.record("GET", "/api/v1/servers/2", 404, seconds)
+            recorder.flush()
+
+        rows = load_stats(tmp_path).rows()
+
+        assert len(rows) == 1
+        assert rows[0]["method"] == "GET"
+        assert rows[0]["path"] == "/api/v1/servers/{serverId}"
+        assert rows[0]["count"] == 4
+        assert rows[0]["max_ms"] == 300.0
+
+    def test_slow_requests(self, tmp_path):
+        recorder = _recorder(tmp_path, threshold=0.5)
+        recorder.record("GET", "/api/v1/servers", 200, 0.2)
+        recorder.record("GET", "/api/v1/servers/1", 200, 0.7)
+        recorder.record("GET", "/api/v1/servers/2", None, 2.0)
+        recorder.flush()
+
+        entries = read_slow_log(tmp_path, limit=10)
+
+        assert [(e["path"], e["status"], e["ms"]) for e in entries] == [
+            ("/api/v1/servers/1", 200, 700.0), ("/api/v1/servers/2", None, 2000.0)
+        ]
+        assert entries[0]["template"] == "/api/v1/servers/{serverId}"
+        # Attempts without a response are not part of the histograms
+        assert sum(row["count"] for row in load_stats(tmp_path).rows()) == 2
+        assert read_slow_log(tmp_path, limit=1) == entries[1:]
+
+    def test_flush_without_data_writes_nothing(self, tmp_path):
+        _recorder(tmp_path / "config").flush()
+
+        assert not (tmp_path / "config").exists()
+
+    def test_slow_log_rotation(self, tmp_path, monkeypatch):
+        monkeypatch.setattr(LatencyRecorder, "MAX_SLOW_LOG_BYTES", 10)
+        for _ in range(2):
+            recorder = _recorder(tmp_path, threshold=0)
+            recorder.record("GET", "/api/v1/servers", 200, 0.1)
+            recorder.flush()
+
+        assert len(read_slow_log(tmp_path, limit=10)) == 1
+        assert (tmp_path / "slow_requests.log.1").exists()
+
+    def test_concurrent_flushes(self, tmp_path):
+        def run():
+            recorder = _recorder(tmp_path)
+            for _ in range(10):
+                recorder.record("GET", "/api/v1/servers", 200, 0.01)
+            recorder.flush()
+
+        threads = [threading.Thread(target=run) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert load_stats(tmp_path).rows()[0]["count"] == 40
+
+    def test_malformed_files(self, tmp_path):
+        (tmp_path / "latency.json").write_text("{not json")
+        (tmp_path / "slow_requests.log").write_text('garbage\n{"path": "/api/ping"}\n')
+
+        assert load_stats(tmp_path).rows() == []
+        assert read_slow_log(tmp_path, limit=5) == [{"path": "/api/ping"}]
+        assert LatencyStats.from_dict({"endpoints": [{"method": "GET"}]}).rows() == []
+
+    def test_reset(self, tmp_path):
+        recorder = _recorder(tmp_path, threshold=0)
+        recorder.record("GET", "/api/v1/servers", 200, 0.1)
+        recorder.flush()
+
+        reset(tmp_path)
+        reset(tmp_path)
+
+        assert load_stats(tmp_path).rows() == []
+        assert read_slow_log(tmp_path, limit=5) == []
+
+
+@pytest.mark.unit
+class TestClientLatency:
+
+    def test_records_attempts(self, mock_auth, requests_mock, api_base_url, tmp_path):
+        recorder = _recorder(tmp_path)
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=1, backoff_factor=0), latency=recorder)
+        requests_mock.get(f"{api_base_url}/api/v1/servers/7", [{"status_code": 503}, {"json": {"id": 7}}])
+
+        client.get("/api/v1/servers/7")
+
+        histogram = recorder.stats.histograms[("GET", "/api/v1/servers/{serverId}")]
+        assert histogram.count == 2
@@ -0,0 +1,47 @@
+"""
+Tests for netcupctl.lazy_group
+"""
+import click
+import pytest
+from click.testing import CliRunner
+
+from netcupctl.lazy_group import LazyGroup
+
+
+@click.group(cls=LazyGroup, lazy_subcommands={
+    "vlans": "netcupctl.commands.vlans.vlans",
+    "alias": "netcupctl.commands.vlans.vlans",
+    "broken": "netcupctl.commands.vlans.get_authenticated_user_id",
+})
+def root():
+    pass
+
+
+@root.command()
+def eager():
+    click.echo("eager")
+
+
+@pytest.mark.unit
+class TestLazyGroup:
+
+    def test_list_commands(self):
+        assert root.list_commands(click.Context(root)) == ["alias", "broken", "eager", "vlans"]
+
+    def test_get_command(self):
+        from netcupctl.commands.vlans import vlans
+
+        assert root.get_command(click.Context(root), "vlans") is vlans
+        assert root.get_command(click.Context(root), "alias") is vlans
+        assert root.get_command(click.Context(root), "eager") is eager
+        assert root.get_command(click.Context(root), "missing") is None
+
+    def test_invoke_lazy_command(self):
+        result = CliRunner().invoke(root, ["vlans", "--help"])
+
+        assert result.exit_code == 0
+        assert "Usage: root vlans" in result.output
+
+    def test_not_a_command(self):
+        with pytest.raises(TypeError, match="not a click command"):
+            root.get_command(click.Context(root), "broken")
@@ -0,0 +1,222 @@
+"""
+Tests for netcupctl.testing.mockserver
+"""
+import json
+
+import pytest
+import requests
+from click.testing import CliRunner
+
+from netcupctl.auth import AuthManager
+from netcupctl.cli import cli
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.config import ConfigManager
+from netcupctl.retry import RetryPolicy
+from netcupctl.testing import mockserver
+from netcupctl.testing.mockserver import MockScpModel, MockServer, seed_tokens
+
+USER = "/api/v1/users/user_123"
+
+
+@pytest.fixture
+def server():
+    with MockServer(MockScpModel(servers=5, policies=2, logs=30), seed=1) as mock:
+        yield mock
+
+
+@pytest.fixture
+def client(server, mock_auth):
+    mock_auth._token_data["user_id"] = "user_123"
+    return NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=server.url + "/")
+
+
+@pytest.mark.unit
+class TestMockScpModel:
+
+    def test_seeded_from_fixtures(self):
+        model = MockScpModel()
+
+        assert list(model.servers) == ["srv-12345", "srv-67890"]
+        assert model.user_id == "user_123"
+
+    def test_scaled_servers_have_unique_macs(self):
+        model = MockScpModel(servers=300)
+
+        macs = {mac for interfaces in model.interfaces.values() for mac in interfaces}
+        assert len(model.servers) == 300
+        assert len(macs) == 300
+
+    def test_action_routes_match_before_plain_parameters(self):
+        model = MockScpModel()
+        _, task = model.handle(mockserver.MockRequest("PATCH", "/api/v1/servers/srv-12345", {}))
+
+        status, body = model.handle(mockserver.MockRequest("PUT", f"/api/v1/tasks/{task['id']}:cancel", {}))
+
+        assert status == 200
+        assert body["status"] == "canceled"
+
+
+@pytest.mark.unit
+class TestMockServer:
+
+    def test_paginated_lists(self, client):
+        servers = list(client.paginate("/api/v1/servers", page_size=2, prefetch=2))
+        logs = client.get(f"{USER}/logs", params={"limit": 10, "offset": 25})
+
+        assert len(servers) == 5
+        assert len({s["id"] for s in servers}) == 5
+        assert [entry["id"] for entry in logs] == [25, 26, 27, 28, 29]
+
+    def test_firewall_and_policies(self, client):
+        server_id = client.get("/api/v1/servers")[0]["id"]
+        mac = client.get(f"/api/v1/servers/{server_id}/interfaces")[0]["mac"]
+
+        firewall = client.get(f"/api/v1/servers/{server_id}/interfaces/{mac}/firewall")
+        client.delete(f"{USER}/firewall-policies/1000")
+
+        assert [p["id"] for p in firewall["userPolicies"]] == [42]
+        assert [p["id"] for p in client.get(f"{USER}/firewall-policies")] == [42, 1001]
+
+    def test_requires_bearer_token(self, server):
+        response = requests.get(f"{server.url}/api/v1/servers", timeout=5)
+
+        assert response.status_code == 401
+
+    def test_other_users_are_forbidden(self, client):
+        with pytest.raises(APIError) as exc_info:
+            client.get("/api/v1/users/someone-else/ssh-keys")
+
+        assert exc_info.value.status_code == 403
+
+    def test_unknown_route(self, client):
+        with pytest.raises(APIError) as exc_info:
+            client.get("/api/v1/unknown")
+
+        assert exc_info.value.status_code == 404
+
+    def test_queued_failures_are_retried(self, server, mock_auth):
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=2, backoff_factor=0), base_url=server.url)
+        server.fail_next(503, count=2, path_prefix="/api/v1/servers")
+
+        assert client.get("/api/ping", accept="text/plain") == {"data": "pong"}
+        assert len(client.get("/api/v1/servers")) == 5
+        assert [status for _, path, status in server.requests if path == "/api/v1/servers"] == [503, 503, 200]
+
+    def test_random_errors(self, mock_auth):
+        with MockServer(MockScpModel(), error_rate=1.0, error_status=500) as mock:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=mock.url)
+
+            with pytest.raises(APIError) as exc_info:
+                client.get("/api/v1/servers")
+
+        assert exc_info.value.status_code == 500
+
+    def test_throttling(self):
+        with MockServer(MockScpModel(), rate_limit=0.5, burst=1) as mock:
+            headers = {"Authorization": "Bearer token"}
+            first = requests.get(f"{mock.url}/api/v1/servers", headers=headers, timeout=5)
+            second = requests.get(f"{mock.url}/api/v1/servers", headers=headers, timeout=5)
+
+        assert first.status_code == 200
+        assert second.status_code == 429
+        assert second.headers["Retry-After"] == "2"
+
+    def test_latency(self):
+        with MockServer(MockScpModel(), latency=0.05, jitter=0.01, seed=3) as mock:
+            response = requests.get(f"{mock.url}/api/ping", timeout=5)
+
+        assert response.elapsed.total_seconds() >= 0.05
+
+    def test_multipart_upload(self, client, server):
+        upload_id = client.post(f"{USER}/images/disk.img")["uploadId"]
+        base = f"{USER}/images/disk.img/{upload_id}"
+        etags = [client.put_binary(f"{base}/parts/{n}", data=bytes([n]) * 1000)["etag"] for n in (1, 2)]
+
+        with pytest.raises(APIError) as exc_info:
+            client.post(base, json={"parts": [{"partNumber": 1, "etag": etags[1]}]})
+        result = client.post(base, json={"parts": [{"partNumber": n + 1, "etag": e} for n, e in enumerate(etags)]})
+
+        assert exc_info.value.status_code == 400
+        assert result["size"] == 2000
+        assert server.model.custom["images"]["disk.img"]["size"] == 2000
+        assert not server.model.uploads
+
+    def test_upload_part_limit_and_abort(self, client):
+        upload_id = client.post(f"{USER}/isos/rescue.iso")["uploadId"]
+        base = f"{USER}/isos/rescue.iso/{upload_id}"
+
+        with pytest.raises(APIError) as exc_info:
+            client.put_binary(f"{base}/parts/{mockserver.DEFAULT_MAX_PARTS + 1}", data=b"x")
+        client.delete(base)
+
+        assert exc_info.value.status_code == 400
+        with pytest.raises(APIError):
+            client.put_binary(f"{base}/parts/1", data=b"x")
+
+    def test_upload_bandwidth(self, mock_auth):
+        with MockServer(MockScpModel(), upload_bandwidth=100_000) as mock:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=mock.url)
+            mock_auth._token_data["user_id"] = "user_123"
+            upload_id = client.post(f"{USER}/images/a")["uploadId"]
+            response = requests.put(f"{mock.url}{USER}/images/a/{upload_id}/parts/1", data=b"x" * 20_000,
+                                    headers={"Authorization": "Bearer token"}, timeout=5)
+
+        assert response.elapsed.total_seconds() >= 0.15
+
+
+@pytest.mark.unit
+class TestSeedTokens:
+
+    def test_tokens_are_accepted(self, tmp_path):
+        seed_tokens(tmp_path / "netcupctl")
+
+        config = ConfigManager()
+        config.config_dir = tmp_path / "netcupctl"
+        config.tokens_file = config.config_dir / "tokens.json"
+        auth = AuthManager(config=config)
+
+        assert auth.get_token_info()["user_id"] == "user_123"
+        assert json.loads(config.tokens_file.read_text())["access_token"]
+
+
+@pytest.mark.unit
+class TestApiUrlOption:
+
+    def test_client_uses_api_url(self, cli_runner, mock_context, server, requests_mock):
+        requests_mock.real_http = True
+        result = cli_runner.invoke(cli, ["--format", "json", "--api-url", server.url, "servers", "get", "srv-12345"], obj=mock_context)
+
+        assert result.exit_code == 0, result.output
+        assert json.loads(result.stdout)["serverLiveInfo"]["state"] == "RUNNING"
+        assert server.requests == [("GET", "/api/v1/servers/srv-12345", 200)]
+
+    def test_api_url_from_environment(self, cli_runner, mock_context, server, requests_mock):
+        requests_mock.real_http = True
+        result = cli_runner.invoke(cli, ["ping"], obj=mock_context, env={"NETCUPCTL_API_URL": server.url})
+
+        assert result.exit_code == 0
+        assert "pong" in result.output
+
+    def test_invalid_api_url(self, cli_runner, mock_context):
+        result = cli_runner.invoke(cli, ["--api-url", "localhost", "ping"], obj=mock_context)
+
+        assert result.exit_code == 2
+        assert "API URL must be" in result.output
+
+
+@pytest.mark.unit
+class TestMain:
+
+    def test_serves_until_interrupted(self, tmp_path, monkeypatch):
+        def interrupt(_self):
+            raise KeyboardInterrupt
+
+        monkeypatch.setattr(MockServer, "serve_forever", interrupt)
+
+        result = CliRunner().invoke(mockserver.main, [
+            "--port", "0", "--servers", "3", "--upload-bandwidth", "5", "--seed-tokens", str(tmp_path / "nc"),
+        ])
+
+        assert result.exit_code == 0, result.output
+        assert "Serving 3 servers at http://127.0.0.1:" in result.output
+        assert (tmp_path / "nc" / "tokens.json").exists()
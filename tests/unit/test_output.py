@@ -225,3 +225,55 @@ class TestOutputFormatter:
             formatter.output({"test": "data"})
 
         mock_list.assert_called_once()
+
+
+@pytest.mark.unit
+class TestOutputStream:
+
+    @pytest.mark.parametrize("format_type", ["json", "yaml"])
+    @pytest.mark.parametrize("data", [[], [{"id": "1", "tags": ["a", "b"]}, {"id": "2", "name": "ü"}]])
+    def test_matches_output_of_complete_list(self, capsys, format_type, data):
+        formatter = OutputFormatter(format=format_type)
+
+        formatter.output(data)
+        expected = capsys.readouterr().out
+        formatter.output_stream(iter(data))
+
+        assert capsys.readouterr().out == expected
+
+    def test_items_are_written_before_iteration_ends(self, capsys):
+        formatter = OutputFormatter(format="json")
+        seen = []
+
+        def _items():
+            yield {"id": "1"}
+            seen.append(capsys.readouterr().out)
+            yield {"id": "2"}
+
+        formatter.output_stream(_items())
+
+        assert '"id": "1"' in seen[0]
+
+    def test_list_format_separates_items(self):
+        formatter = OutputFormatter(format="list")
+
+        with patch.object(formatter, "_output_list_item") as mock_item:
+            formatter.output_stream(iter([{"id": "1"}, {"id": "2"}]))
+
+        assert mock_item.call_count == 2
+
+    def test_list_format_empty(self):
+        formatter = OutputFormatter(format="list")
+
+        with patch.object(formatter.console, "print") as mock_print:
+            formatter.output_stream(iter([]))
+
+        assert "No data" in mock_print.call_args[0][0]
+
+    def test_table_format_collects_items(self):
+        formatter = OutputFormatter(format="table")
+
+        with patch.object(formatter, "_output_table") as mock_table:
+            formatter.output_stream(iter([{"id": "1"}]))
+
+        mock_table.assert_called_once_with([{"id": "1"}])
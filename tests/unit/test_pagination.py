@@ -0,0 +1,133 @@
+from unittest.mock import MagicMock
+
+import threading
+
+import pytest
+
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.pagination import paginate
+
+
+def _paged_client(total, fail_at=None):
+    client = MagicMock(spec=NetcupClient)
+
+    def _get(path, params=None):
+        if fail_at is not None and params["offset"] >= fail_at:
+            raise APIError("Server error", status_code=500)
+        start = params["offset"]
+        return [{"id": i} for i in range(start, min(start + params["limit"], total))]
+
+    client.get.side_effect = _get
+    return client
+
+
+@pytest.mark.unit
+class TestPaginate:
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 4])
+    @pytest.mark.parametrize("total", [0, 3, 10, 11, 47])
+    def test_yields_all_items_in_order(self, prefetch, total):
+        client = _paged_client(total)
+
+        items = list(paginate(client, "/api/v1/tasks", page_size=5, prefetch=prefetch))
+
+        assert items == [{"id": i} for i in range(total)]
+
+    def test_is_lazy(self):
+        client = _paged_client(100)
+
+        items = paginate(client, "/api/v1/tasks", page_size=10)
+        assert client.get.call_count == 0
+
+        next(items)
+        assert client.get.call_count == 1
+
+    def test_prefetches_next_page(self):
+        client = _paged_client(100)
+        items = paginate(client, "/api/v1/tasks", page_size=10, prefetch=1)
+
+        next(items)
+        items.close()
+
+        assert client.get.call_count == 2
+
+    def test_keeps_prefetch_windows_in_flight(self):
+        client = MagicMock(spec=NetcupClient)
+        in_flight = []
+        peak = []
+        lock = threading.Lock()
+        all_started = threading.Barrier(4, timeout=5)
+
+        def _get(path, params=None):
+            with lock:
+                in_flight.append(params["offset"])
+                peak.append(len(in_flight))
+            if 30 <= params["offset"] < 70:
+                all_started.wait()
+            with lock:
+                in_flight.remove(params["offset"])
+            return [{"id": i} for i in range(params["offset"], min(params["offset"] + 10, 75))]
+
+        client.get.side_effect = _get
+
+        items = list(paginate(client, "/api/v1/logs", page_size=10, prefetch=4))
+
+        assert items == [{"id": i} for i in range(75)]
+        assert max(peak) == 4
+
+    def test_widens_window_after_full_pages(self):
+        client = _paged_client(3)
+
+        assert len(list(paginate(client, "/api/v1/logs", page_size=10, prefetch=8))) == 3
+        assert client.get.call_count == 1
+
+        client = _paged_client(25)
+
+        assert len(list(paginate(client, "/api/v1/logs", page_size=10, prefetch=8))) == 25
+        assert client.get.call_count <= 6
+
+    def test_known_total_stops_requests(self):
+        client = _paged_client(30)
+
+        items = list(paginate(client, "/api/v1/logs", page_size=10, prefetch=8, total=30))
+
+        assert len(items) == 30
+        assert sorted(c[1]["params"]["offset"] for c in client.get.call_args_list) == [0, 10, 20]
+
+    def test_known_total_without_prefetch(self):
+        client = _paged_client(20)
+
+        assert len(list(paginate(client, "/api/v1/logs", page_size=10, total=20))) == 20
+        assert client.get.call_count == 2
+
+    def test_passes_filters_and_start_offset(self):
+        client = _paged_client(7)
+
+        items = list(paginate(client, "/api/v1/tasks", params={"q": "x", "limit": 99, "offset": 5}, page_size=5))
+
+        assert items == [{"id": 5}, {"id": 6}]
+        assert client.get.call_args[1]["params"] == {"q": "x", "limit": 5, "offset": 5}
+
+    def test_non_list_page_ends_iteration(self):
+        client = MagicMock(spec=NetcupClient)
+        client.get.return_value = {"unexpected": True}
+
+        assert list(paginate(client, "/api/v1/tasks")) == []
+
+    @pytest.mark.parametrize("prefetch", [0, 1, 3])
+    def test_errors_are_raised_after_earlier_items(self, prefetch):
+        client = _paged_client(100, fail_at=10)
+        items = paginate(client, "/api/v1/tasks", page_size=10, prefetch=prefetch)
+
+        assert len([next(items) for _ in range(10)]) == 10
+        with pytest.raises(APIError):
+            next(items)
+
+    def test_rejects_invalid_page_size(self):
+        with pytest.raises(ValueError):
+            list(paginate(MagicMock(), "/api/v1/tasks", page_size=0))
+
+    def test_client_method(self, mock_client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[{"id": 1}])
+
+        assert list(mock_client.paginate("/api/v1/servers", page_size=2)) == [{"id": 1}]
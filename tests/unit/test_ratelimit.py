@@ -0,0 +1,132 @@
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.client import NetcupClient
+from netcupctl.ratelimit import SharedTokenBucket, TokenBucket
+from netcupctl.retry import RetryPolicy
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+
+    def test_rejects_non_positive_rate(self):
+        with pytest.raises(ValueError):
+            TokenBucket(0)
+
+    def test_default_burst_follows_rate(self):
+        assert TokenBucket(5).burst == 5
+        assert TokenBucket(0.5).burst == 1
+
+    def test_burst_is_free_then_requests_are_spaced(self):
+        bucket = TokenBucket(rate=10, burst=3)
+
+        waits = [bucket.reserve() for _ in range(5)]
+
+        assert waits[:3] == [0.0, 0.0, 0.0]
+        assert waits[3] == pytest.approx(0.1, abs=0.01)
+        assert waits[4] == pytest.approx(0.2, abs=0.01)
+
+    def test_refills_over_time(self):
+        with patch("netcupctl.ratelimit.time.monotonic", side_effect=[100.0, 100.0, 101.0]):
+            bucket = TokenBucket(rate=10, burst=1)
+            assert bucket.reserve() == 0.0
+            assert bucket.reserve() == 0.0
+
+    def test_acquire_sleeps_for_reserved_wait(self):
+        bucket = TokenBucket(rate=4, burst=1)
+        with patch("netcupctl.ratelimit.time.sleep") as sleep:
+            bucket.acquire()
+            waited = bucket.acquire()
+
+        sleep.assert_called_once()
+        assert waited == pytest.approx(0.25, abs=0.01)
+
+    def test_thread_safe_reservations(self):
+        bucket = TokenBucket(rate=100, burst=10)
+        waits = []
+        lock = threading.Lock()
+
+        def _worker():
+            for _ in range(10):
+                wait = bucket.reserve()
+                with lock:
+                    waits.append(wait)
+
+        threads = [threading.Thread(target=_worker) for _ in range(5)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert len(waits) == 50
+        assert max(waits) == pytest.approx(0.4, abs=0.05)
+
+
+@pytest.mark.unit
+class TestSharedTokenBucket:
+
+    def test_state_is_shared_between_instances(self, tmp_path):
+        first = SharedTokenBucket(rate=10, burst=2, state_dir=tmp_path)
+        second = SharedTokenBucket(rate=10, burst=2, state_dir=tmp_path)
+
+        waits = [first.reserve(), second.reserve(), first.reserve(), second.reserve()]
+
+        assert waits[0] == 0.0
+        assert waits[1] == 0.0
+        assert waits[2] > 0
+        assert waits[3] > waits[2]
+        assert (tmp_path / "ratelimit.json").exists()
+
+    def test_corrupt_state_file_resets_bucket(self, tmp_path):
+        (tmp_path / "ratelimit.json").write_text("not json")
+        bucket = SharedTokenBucket(rate=1, burst=1, state_dir=tmp_path)
+
+        assert bucket.reserve() == 0.0
+
+    def test_creates_state_dir(self, tmp_path):
+        bucket = SharedTokenBucket(rate=1, burst=1, state_dir=tmp_path / "netcupctl")
+
+        bucket.reserve()
+
+        assert (tmp_path / "netcupctl" / "ratelimit.lock").exists()
+
+
+@pytest.mark.unit
+class TestClientRateLimit:
+
+    def test_every_attempt_passes_the_limiter(self, mock_auth, requests_mock, api_base_url):
+        limiter = MagicMock(spec=TokenBucket)
+        limiter.acquire.return_value = 0.0
+        client = NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=1), rate_limiter=limiter)
+        requests_mock.get(f"{api_base_url}/api/v1/servers", [{"status_code": 503}, {"json": []}])
+
+        with patch("netcupctl.client.time.sleep"):
+            client.get("/api/v1/servers")
+
+        assert limiter.acquire.call_count == 2
+
+    def test_verbose_reports_delay(self, mock_auth, requests_mock, api_base_url, capsys):
+        limiter = MagicMock(spec=TokenBucket)
+        limiter.acquire.return_value = 0.5
+        client = NetcupClient(auth=mock_auth, verbose=True, rate_limiter=limiter)
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+
+        client.get("/api/v1/servers")
+
+        assert "Rate limit" in capsys.readouterr().err
+
+    @pytest.mark.parametrize("args, expected", [
+        ([], type(None)),
+        (["--rate-limit", "5"], TokenBucket),
+        (["--rate-limit", "5", "--rate-burst", "2", "--shared-rate-limit"], SharedTokenBucket),
+    ])
+    def test_cli_options_select_limiter(self, cli_runner, args, expected):
+        with patch("netcupctl.cli.NetcupClient") as client_cls:
+            client_cls.return_value.get.return_value = {"data": "OK"}
+            cli_runner.invoke(cli, args + ["ping"])
+
+        limiter = client_cls.call_args[1]["rate_limiter"]
+        assert type(limiter) is expected
@@ -0,0 +1,150 @@
+import time
+from email.utils import format_datetime
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.retry import RetryPolicy
+
+
+def _response(status_code, headers=None):
+    response = MagicMock(spec=requests.Response)
+    response.status_code = status_code
+    response.headers = headers or {}
+    return response
+
+
+@pytest.mark.unit
+class TestRetryPolicy:
+
+    @pytest.mark.parametrize("method", ["GET", "PUT", "DELETE", "get"])
+    def test_idempotent_methods_retry_server_errors(self, method):
+        assert RetryPolicy().is_retryable(method, 503)
+        assert RetryPolicy().is_retryable(method, None)
+
+    @pytest.mark.parametrize("method", ["POST", "PATCH"])
+    def test_non_idempotent_methods_only_retry_429(self, method):
+        policy = RetryPolicy()
+
+        assert not policy.is_retryable(method, 503)
+        assert not policy.is_retryable(method, None)
+        assert policy.is_retryable(method, 429)
+
+    def test_client_errors_are_not_retried(self):
+        assert not RetryPolicy().is_retryable("GET", 404)
+
+    def test_backoff_is_capped_and_jittered(self):
+        policy = RetryPolicy(backoff_factor=1.0, max_backoff=4.0)
+
+        delays = [policy.backoff(10) for _ in range(50)]
+
+        assert all(0 <= d <= 4.0 for d in delays)
+        assert len(set(delays)) > 1
+
+    def test_retry_after_seconds(self):
+        assert RetryPolicy.retry_after(_response(429, {"Retry-After": "7"})) == 7.0
+
+    def test_retry_after_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        delay = RetryPolicy.retry_after(_response(503, {"Retry-After": format_datetime(when, usegmt=True)}))
+
+        assert 25 <= delay <= 31
+
+    @pytest.mark.parametrize("status_code, header", [(500, "5"), (429, None), (429, "soon")])
+    def test_retry_after_ignored(self, status_code, header):
+        headers = {"Retry-After": header} if header else {}
+
+        assert RetryPolicy.retry_after(_response(status_code, headers)) is None
+
+    def test_next_delay_prefers_retry_after(self):
+        policy = RetryPolicy(max_backoff=0.01)
+
+        assert policy.next_delay("GET", 0, time.monotonic(), _response(429, {"Retry-After": "2"})) == 2.0
+
+    def test_next_delay_stops_after_max_retries(self):
+        policy = RetryPolicy(max_retries=2)
+
+        assert policy.next_delay("GET", 1, time.monotonic()) is not None
+        assert policy.next_delay("GET", 2, time.monotonic()) is None
+
+    def test_next_delay_respects_deadline(self):
+        policy = RetryPolicy(deadline=10)
+
+        assert policy.next_delay("GET", 0, time.monotonic(), _response(429, {"Retry-After": "60"})) is None
+
+
+@pytest.mark.unit
+class TestClientRetry:
+
+    @pytest.fixture
+    def client(self, mock_auth):
+        return NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=3))
+
+    @pytest.fixture(autouse=True)
+    def no_sleep(self):
+        with patch("netcupctl.client.time.sleep") as sleep:
+            yield sleep
+
+    def test_get_retries_server_error(self, client, requests_mock, api_base_url):
+        requests_mock.get(
+            f"{api_base_url}/api/v1/servers",
+            [{"status_code": 503}, {"status_code": 502}, {"json": [{"id": 1}], "status_code": 200}],
+        )
+
+        assert client.get("/api/v1/servers") == [{"id": 1}]
+        assert requests_mock.call_count == 3
+
+    def test_get_retries_connection_error(self, client, requests_mock, api_base_url):
+        requests_mock.get(
+            f"{api_base_url}/api/v1/servers",
+            [{"exc": requests.ConnectionError}, {"json": [], "status_code": 200}],
+        )
+
+        assert client.get("/api/v1/servers") == []
+
+    def test_gives_up_after_max_retries(self, client, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", status_code=500)
+
+        with pytest.raises(APIError) as exc_info:
+            client.get("/api/v1/servers")
+
+        assert exc_info.value.status_code == 500
+        assert requests_mock.call_count == 4
+
+    def test_post_not_retried_on_server_error(self, client, requests_mock, api_base_url):
+        requests_mock.post(f"{api_base_url}/api/v1/servers", status_code=500)
+
+        with pytest.raises(APIError):
+            client.post("/api/v1/servers", json={})
+
+        assert requests_mock.call_count == 1
+
+    def test_post_retried_on_429_with_retry_after(self, client, requests_mock, api_base_url, no_sleep):
+        requests_mock.post(
+            f"{api_base_url}/api/v1/servers",
+            [{"status_code": 429, "headers": {"Retry-After": "3"}}, {"json": {"id": 1}, "status_code": 201}],
+        )
+
+        assert client.post("/api/v1/servers", json={}) == {"id": 1}
+        no_sleep.assert_called_once_with(3.0)
+
+    def test_put_binary_retries(self, client, requests_mock, api_base_url):
+        requests_mock.put(
+            f"{api_base_url}/api/v1/upload",
+            [{"exc": requests.Timeout}, {"status_code": 200, "headers": {"ETag": '"p1"'}, "text": ""}],
+        )
+
+        assert client.put_binary("/api/v1/upload", b"part")["etag"] == '"p1"'
+        assert requests_mock.call_count == 2
+        assert requests_mock.last_request.body == b"part"
+
+    def test_verbose_logs_retries(self, mock_auth, requests_mock, api_base_url, capsys):
+        client = NetcupClient(auth=mock_auth, verbose=True, retry=RetryPolicy(max_retries=1))
+        requests_mock.get(f"{api_base_url}/api/v1/servers", [{"status_code": 504}, {"json": []}])
+
+        client.get("/api/v1/servers")
+
+        assert "Retrying GET" in capsys.readouterr().err
@@ -0,0 +1,130 @@
+import threading
+import time
+
+import pytest
+
+from netcupctl.cache import ResponseCache
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.concurrency import map_requests
+from netcupctl.retry import RetryPolicy
+from netcupctl.singleflight import SingleFlight
+
+
+def _wait_for_waiters(flight, key, count, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while flight.waiters(key) < count:
+        if time.monotonic() > deadline:
+            raise AssertionError("followers did not join the call in flight")
+        time.sleep(0.001)
+
+
+def _run_threads(target, count):
+    results = [None] * count
+
+    def _worker(index):
+        try:
+            results[index] = target()
+        except Exception as exc:
+            results[index] = exc
+
+    threads = [threading.Thread(target=_worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    return threads, results
+
+
+@pytest.mark.unit
+class TestSingleFlight:
+
+    def test_sequential_calls_are_not_coalesced(self):
+        flight = SingleFlight()
+        calls = []
+
+        for _ in range(3):
+            flight.do("k", lambda: calls.append(1))
+
+        assert len(calls) == 3
+        assert flight.waiters("k") == 0
+
+    def test_concurrent_calls_share_one_execution(self):
+        flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def _slow():
+            calls.append(1)
+            release.wait(5)
+            return {"items": [1, 2]}
+
+        threads, results = _run_threads(lambda: flight.do("k", _slow), 4)
+        _wait_for_waiters(flight, "k", 3)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert len(calls) == 1
+        assert all(result == {"items": [1, 2]} for result in results)
+        assert len({id(result) for result in results}) == 4
+
+    def test_followers_receive_the_exception(self):
+        flight = SingleFlight()
+        release = threading.Event()
+
+        def _failing():
+            release.wait(5)
+            raise APIError("boom", status_code=500)
+
+        threads, results = _run_threads(lambda: flight.do("k", _failing), 3)
+        _wait_for_waiters(flight, "k", 2)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert all(isinstance(result, APIError) for result in results)
+        assert flight.waiters("k") == 0
+
+    def test_different_keys_run_independently(self):
+        flight = SingleFlight()
+
+        assert flight.do("a", lambda: 1) == 1
+        assert flight.do("b", lambda: 2) == 2
+
+
+@pytest.mark.unit
+class TestClientCoalescing:
+
+    def test_concurrent_identical_gets_share_one_request(self, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0))
+        release = threading.Event()
+
+        def _respond(request, context):
+            release.wait(5)
+            return [{"id": 1}]
+
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=_respond)
+
+        threads, results = _run_threads(lambda: client.get("/api/v1/servers"), 5)
+        _wait_for_waiters(client._in_flight, ResponseCache.make_key("GET", "/api/v1/servers"), 4)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        assert requests_mock.call_count == 1
+        assert results == [[{"id": 1}]] * 5
+
+    def test_fan_out_with_duplicates(self, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0))
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        results = map_requests(client, [("get", "/api/v1/servers/1")] * 6, max_workers=6)
+
+        assert results == [{"id": 1}] * 6
+        assert 1 <= requests_mock.call_count <= 6
+
+    def test_writes_are_not_coalesced(self, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(auth=mock_auth, retry=RetryPolicy(max_retries=0))
+        requests_mock.post(f"{api_base_url}/api/v1/servers/1/snapshots", json={})
+
+        map_requests(client, [("post", "/api/v1/servers/1/snapshots", {"json": {}})] * 3, max_workers=3)
+
+        assert requests_mock.call_count == 3
@@ -359,3 +359,23 @@ class TestSpecManager:
         manager = SpecManager(temp_data_dir)
         with pytest.raises(SpecError, match="Disk full"):
             manager.update_spec()
+
+    # get_local_paths tests
+    def test_get_local_paths(self, temp_data_dir):
+        """Test get_local_paths returns the path templates of the spec"""
+        spec = {"openapi": "3.0.0", "info": {"version": "1"},
+                "paths": {"/api/v1/servers": {}, "/api/v1/servers/{serverId}": {}}}
+        (temp_data_dir / "openapi.json").write_text(json.dumps(spec))
+
+        manager = SpecManager(temp_data_dir)
+        assert manager.get_local_paths() == ["/api/v1/servers", "/api/v1/servers/{serverId}"]
+
+    def test_get_local_paths_without_spec(self, temp_data_dir):
+        """Test get_local_paths without a local spec file"""
+        assert SpecManager(temp_data_dir).get_local_paths() == []
+
+    def test_get_local_paths_malformed(self, temp_data_dir):
+        """Test get_local_paths with a spec lacking a paths object"""
+        (temp_data_dir / "openapi.json").write_text(json.dumps({"paths": ["/api/v1/servers"]}))
+
+        assert SpecManager(temp_data_dir).get_local_paths() == []
@@ -0,0 +1,77 @@
+"""
+Start-up cost tests: modules imported by the CLI and an import-time budget.
+
+The budget can be adjusted for slow machines with NETCUPCTL_IMPORT_BUDGET_MS.
+"""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+IMPORT_BUDGET_MS = float(os.environ.get("NETCUPCTL_IMPORT_BUDGET_MS", "500"))
+
+# Modules that only specific commands or output formats need.
+DEFERRED_PREFIXES = ("rich", "yaml", "netcupctl.commands.")
+ALWAYS_LOADED = {"netcupctl.commands.validators"}
+
+
+def _run(*args):
+    return subprocess.run(
+        [sys.executable, *args],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={**os.environ, "NETCUPCTL_NO_DAEMON": "1"},
+    )
+
+
+def _loaded_modules(code):
+    """Run code in a fresh interpreter and return the names of all imported modules."""
+    result = _run("-c", f"{code}\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))")
+    return json.loads(result.stdout.splitlines()[-1])
+
+
+def _importtime(code):
+    """Run code with -X importtime and return {module: cumulative microseconds}."""
+    result = _run("-X", "importtime", "-c", code)
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            times[name.strip()] = int(cumulative)
+    return times
+
+
+def _deferred(modules):
+    return sorted(
+        m for m in modules
+        if m.startswith(DEFERRED_PREFIXES) and m not in ALWAYS_LOADED
+    )
+
+
+@pytest.mark.unit
+class TestStartup:
+
+    def test_cli_import_defers_commands_and_formatters(self):
+        assert _deferred(_loaded_modules("import netcupctl.cli")) == []
+
+    def test_invoked_command_is_imported(self):
+        code = (
+            "from netcupctl.cli import cli\n"
+            "cli(['--format', 'json', 'vlans', '--help'], standalone_mode=False)\n"
+        )
+        loaded = _deferred(_loaded_modules(code))
+
+        assert "netcupctl.commands.vlans" in loaded
+        assert "netcupctl.commands.servers" not in loaded
+        assert not any(m.startswith(("rich", "yaml")) for m in loaded)
+
+    def test_import_time_budget(self):
+        # Best of three runs to keep scheduler noise out of the measurement
+        best = min(_importtime("import netcupctl.cli")["netcupctl.cli"] for _ in range(3)) / 1000
+
+        assert best < IMPORT_BUDGET_MS, f"importing netcupctl.cli took {best:.0f} ms (budget {IMPORT_BUDGET_MS:.0f} ms)"
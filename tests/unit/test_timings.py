@@ -0,0 +1,212 @@
+"""
+Tests for netcupctl.timings and netcupctl.transport
+"""
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+
+from netcupctl.cli import cli
+from netcupctl.client import NetcupClient
+from netcupctl.output import OutputFormatter
+from netcupctl.retry import RetryPolicy
+from netcupctl.timings import HTTP_PHASES, Timings, collect_http_phases, collecting, record_phase
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        body = json.dumps([{"id": 1}]).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def local_server():
+    server = HTTPServer(("127.0.0.1", 0), _Handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.mark.unit
+class TestCollectHttpPhases:
+
+    def test_records_only_while_collecting(self):
+        record_phase("dns", 1.0)
+        assert not collecting()
+
+        with collect_http_phases() as phases:
+            assert collecting()
+            record_phase("dns", 0.5)
+            record_phase("dns", 0.25)
+
+        assert phases == {"dns": 0.75}
+        assert not collecting()
+
+    def test_per_thread(self):
+        with collect_http_phases() as phases:
+            worker = threading.Thread(target=record_phase, args=("ttfb", 1.0))
+            worker.start()
+            worker.join()
+
+        assert phases == {}
+
+
+@pytest.mark.unit
+class TestTimings:
+
+    def test_phases(self):
+        timings = Timings()
+        timings.add("render", 0.002)
+        with timings.measure("render"):
+            pass
+
+        data = timings.to_dict()
+
+        assert data["phases"]["render"]["count"] == 2
+        assert data["phases"]["render"]["max"] >= 0.002
+
+    def test_add_request_attributes_rest_to_download(self):
+        timings = Timings()
+
+        timings.add_request("get", "/api/v1/servers", 200, 0.5, {"connect": 0.1, "ttfb": 0.3})
+
+        request = timings.to_dict()["requests"][0]
+        assert request["method"] == "GET"
+        assert request["status"] == 200
+        assert request["dns"] == 0.0
+        assert request["download"] == pytest.approx(0.1)
+        assert timings.to_dict()["phases"]["http"]["count"] == 1
+
+    def test_format_summary(self):
+        timings = Timings()
+        timings.add("auth.token", 0.001)
+        timings.add_request("GET", "/api/v1/servers", None, 0.01, {})
+
+        summary = timings.format_summary()
+
+        assert "auth.token" in summary
+        assert "GET /api/v1/servers" in summary
+        assert all(phase in summary for phase in HTTP_PHASES)
+
+    def test_write(self, tmp_path):
+        timings = Timings()
+        timings.add("render", 0.001)
+
+        timings.write(tmp_path / "timings.json")
+
+        assert json.loads((tmp_path / "timings.json").read_text())["phases"]["render"]["count"] == 1
+
+
+@pytest.mark.unit
+class TestClientTimings:
+
+    def test_connection_phases(self, mock_auth, local_server, monkeypatch):
+        timings = Timings()
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), timings=timings)
+        monkeypatch.setattr(client, "BASE_URL", local_server)
+
+        assert client.get("/api/v1/servers") == [{"id": 1}]
+        client.get("/api/v1/servers/1")
+
+        first, second = timings.to_dict()["requests"]
+        assert first["path"] == "/api/v1/servers"
+        assert first["status"] == 200
+        assert first["connect"] > 0
+        assert first["ttfb"] > 0
+        assert first["total"] >= sum(first[phase] for phase in HTTP_PHASES) - 1e-6
+        # The second request reuses the pooled connection
+        assert second["dns"] == 0 and second["connect"] == 0
+        phases = timings.to_dict()["phases"]
+        assert phases["auth.token"]["count"] == 2
+        assert phases["json.decode"]["count"] == 2
+
+    def test_no_timings_by_default(self, mock_auth, local_server, monkeypatch):
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0))
+        monkeypatch.setattr(client, "BASE_URL", local_server)
+
+        assert client.get("/api/v1/servers") == [{"id": 1}]
+        assert client.timings is None
+
+    def test_failed_attempt_is_recorded(self, mock_auth, requests_mock, api_base_url):
+        timings = Timings()
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), timings=timings)
+        requests_mock.get(f"{api_base_url}/api/v1/servers", status_code=500)
+
+        with pytest.raises(Exception):
+            client.get("/api/v1/servers")
+
+        assert timings.to_dict()["requests"][0]["status"] == 500
+
+
+@pytest.mark.unit
+class TestRenderTimings:
+
+    def test_output(self, capsys):
+        timings = Timings()
+        OutputFormatter(format="json", timings=timings).output({"id": 1})
+
+        assert timings.to_dict()["phases"]["render"]["count"] == 1
+
+    def test_output_stream(self, capsys):
+        timings = Timings()
+        OutputFormatter(format="json", timings=timings).output_stream(iter([{"id": 1}, {"id": 2}]))
+
+        assert timings.to_dict()["phases"]["render"]["count"] == 2
+
+
+@pytest.mark.unit
+class TestTimingsOptions:
+
+    def test_summary_on_stderr(self, split_cli_runner, mock_context, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+
+        result = split_cli_runner.invoke(cli, ["--timings", "--format", "json", "servers", "get", "1"], obj=mock_context)
+
+        assert result.exit_code == 0
+        assert json.loads(result.stdout) == {"id": 1}
+        assert "GET /api/v1/servers/1" in result.stderr
+        assert "render" in result.stderr
+
+    def test_timings_file(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        path = tmp_path / "timings.json"
+
+        result = cli_runner.invoke(
+            cli, ["--timings-file", str(path), "--format", "json", "servers", "get", "1"], obj=mock_context
+        )
+
+        assert result.exit_code == 0
+        data = json.loads(path.read_text())
+        assert data["requests"][0]["path"] == "/api/v1/servers/1"
+        assert {"command", "import servers", "render", "http"} <= set(data["phases"])
+        assert "phase" not in result.output
+
+    def test_timings_written_on_error(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", status_code=404)
+        path = tmp_path / "timings.json"
+
+        result = cli_runner.invoke(cli, ["--timings-file", str(path), "servers", "get", "1"], obj=mock_context)
+
+        assert result.exit_code == 404
+        assert json.loads(path.read_text())["requests"][0]["status"] == 404
+
+    def test_unwritable_timings_file(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        result = cli_runner.invoke(
+            cli, ["--timings-file", str(tmp_path / "missing" / "t.json"), "ping"], obj=mock_context
+        )
+
+        assert "Could not write timings file" in result.output
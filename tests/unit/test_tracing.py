@@ -0,0 +1,217 @@
+"""
+Tests for netcupctl.tracing
+"""
+import asyncio
+import json
+import threading
+
+import pytest
+
+from netcupctl import tracing
+from netcupctl.async_client import AsyncNetcupClient
+from netcupctl.cli import cli
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.concurrency import map_requests
+from netcupctl.retry import RetryPolicy
+
+
+def _spans(tracer):
+    return {event["args"]["span_id"]: event for event in tracer.to_dict()["traceEvents"] if event["ph"] == "X"}
+
+
+def _named(spans, name):
+    return [span for span in spans.values() if span["name"] == name]
+
+
+@pytest.fixture
+def root():
+    tracer = tracing.Tracer()
+    span = tracer.start("root", "test")
+    token = tracing.activate(span)
+    yield span
+    tracing.deactivate(token)
+
+
+@pytest.mark.unit
+class TestSpans:
+
+    def test_noop_without_trace(self):
+        with tracing.span("work", "test") as span:
+            assert span is None
+        assert tracing.current() is None
+
+    def test_nesting(self, root):
+        with tracing.span("outer", "test", key="value") as outer:
+            with tracing.span("inner", "test") as inner:
+                assert tracing.current() is inner
+            outer.set(items=3)
+        root.end()
+
+        spans = _spans(root.tracer)
+        outer_event, inner_event = _named(spans, "outer")[0], _named(spans, "inner")[0]
+        assert outer_event["args"]["parent_id"] == root.span_id
+        assert inner_event["args"]["parent_id"] == outer.span_id
+        assert outer_event["args"]["key"] == "value" and outer_event["args"]["items"] == 3
+        assert outer_event["ts"] <= inner_event["ts"]
+        assert outer_event["ts"] + outer_event["dur"] >= inner_event["ts"] + inner_event["dur"]
+        assert "parent_id" not in _named(spans, "root")[0]["args"]
+
+    def test_error_recorded(self, root):
+        with pytest.raises(KeyError):
+            with tracing.span("fails", "test"):
+                raise KeyError("x")
+
+        assert _named(_spans(root.tracer), "fails")[0]["args"]["error"] == "KeyError"
+        assert tracing.current() is root
+
+    def test_bind_nests_across_threads(self, root):
+        def work():
+            with tracing.span("worker", "test"):
+                pass
+
+        worker = threading.Thread(target=tracing.bind(work), name="worker-thread")
+        worker.start()
+        worker.join()
+
+        events = root.tracer.to_dict()["traceEvents"]
+        span = _named(_spans(root.tracer), "worker")[0]
+        assert span["args"]["parent_id"] == root.span_id
+        assert span["tid"] != root.thread_id
+        flows = [e for e in events if e.get("cat") == "flow"]
+        assert {(e["ph"], e["tid"]) for e in flows} == {("s", root.thread_id), ("f", span["tid"])}
+        assert {"name": "thread_name", "ph": "M", "pid": root.tracer.pid, "tid": span["tid"],
+                "args": {"name": "worker-thread"}} in events
+
+    def test_write(self, root, tmp_path):
+        root.end()
+
+        root.tracer.write(tmp_path / "trace.json")
+
+        data = json.loads((tmp_path / "trace.json").read_text())
+        assert data["displayTimeUnit"] == "ms"
+        assert data["traceEvents"][0]["name"] == "process_name"
+
+
+@pytest.mark.unit
+class TestClientSpans:
+
+    def test_fan_out_nests_under_caller(self, root, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(mock_auth)
+        for server_id in range(4):
+            requests_mock.get(f"{api_base_url}/api/v1/servers/{server_id}", json={"id": server_id})
+
+        with tracing.span("fan-out", "test") as fan_out:
+            map_requests(client, [("get", f"/api/v1/servers/{i}") for i in range(4)], max_workers=4)
+
+        spans = _spans(root.tracer)
+        requests = [s for s in spans.values() if s["cat"] == "http"]
+        assert len(requests) == 4
+        assert all(s["args"]["parent_id"] == fan_out.span_id for s in requests)
+        attempts = _named(spans, "attempt")
+        assert {spans[a["args"]["parent_id"]]["name"] for a in attempts} == {
+            f"GET /api/v1/servers/{i}" for i in range(4)
+        }
+        assert all(a["args"]["status"] == 200 for a in attempts)
+
+    def test_retry(self, root, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=1, backoff_factor=0))
+        requests_mock.get(f"{api_base_url}/api/v1/servers", [{"status_code": 503}, {"json": []}])
+
+        client.get("/api/v1/servers")
+
+        spans = _spans(root.tracer)
+        request = _named(spans, "GET /api/v1/servers")[0]
+        children = sorted((s for s in spans.values()
+                           if s["args"].get("parent_id") == request["args"]["span_id"] and s["cat"] != "client"),
+                          key=lambda s: s["ts"])
+        assert [s["name"] for s in children] == ["attempt", "retry", "attempt"]
+        assert [children[0]["args"]["status"], children[2]["args"]["status"]] == [503, 200]
+        assert children[1]["args"]["reason"] == "HTTP 503"
+
+    def test_failed_request(self, root, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0))
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", status_code=404)
+
+        with pytest.raises(APIError):
+            client.get("/api/v1/servers/1")
+
+        assert _named(_spans(root.tracer), "GET /api/v1/servers/1")[0]["args"]["error"] == "APIError"
+
+    def test_prefetched_pages(self, root, mock_auth, requests_mock, api_base_url):
+        client = NetcupClient(mock_auth)
+        for offset, items in ((0, [1, 2]), (2, [3, 4]), (4, [5])):
+            requests_mock.get(f"{api_base_url}/api/v1/servers?offset={offset}", json=items)
+
+        assert list(client.paginate("/api/v1/servers", page_size=2, prefetch=3, total=5)) == [1, 2, 3, 4, 5]
+
+        spans = _spans(root.tracer)
+        pages = sorted(_named(spans, "page"), key=lambda s: s["args"]["offset"])
+        assert [p["args"]["offset"] for p in pages] == [0, 2, 4]
+        assert all(p["args"]["parent_id"] == root.span_id for p in pages)
+        assert sum(p["args"]["items"] for p in pages) == 5
+        requests = [s for s in spans.values() if s["cat"] == "http"]
+        assert {spans[r["args"]["parent_id"]]["name"] for r in requests} == {"page"}
+
+    def test_async_client(self, root, mock_auth, requests_mock, api_base_url):
+        requests_mock.get(f"{api_base_url}/api/v1/servers", json=[])
+
+        async def run():
+            async with AsyncNetcupClient(client=NetcupClient(mock_auth)) as client:
+                with tracing.span("async", "test") as span:
+                    await client.get("/api/v1/servers")
+                return span
+
+        span = asyncio.run(run())
+
+        assert _named(_spans(root.tracer), "GET /api/v1/servers")[0]["args"]["parent_id"] == span.span_id
+
+
+@pytest.mark.unit
+class TestTraceFileOption:
+
+    def test_trace_file(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        path = tmp_path / "trace.json"
+
+        result = cli_runner.invoke(
+            cli, ["--trace-file", str(path), "--format", "json", "servers", "get", "1"], obj=mock_context
+        )
+
+        assert result.exit_code == 0
+        events = json.loads(path.read_text())["traceEvents"]
+        spans = {e["args"]["span_id"]: e for e in events if e["ph"] == "X"}
+        command = _named(spans, "netcupctl servers")[0]
+        assert command["cat"] == "command"
+        request = _named(spans, "GET /api/v1/servers/1")[0]
+        render = _named(spans, "render")[0]
+        assert request["args"]["parent_id"] == command["args"]["span_id"]
+        assert render["args"]["parent_id"] == command["args"]["span_id"]
+        assert tracing.current() is None
+
+    def test_batch_commands_nest_under_batch(self, cli_runner, mock_context, requests_mock, api_base_url,
+                                             tmp_path):
+        requests_mock.get(f"{api_base_url}/api/v1/servers/1", json={"id": 1})
+        requests_mock.get(f"{api_base_url}/api/v1/servers/2", json={"id": 2})
+        commands = tmp_path / "commands.txt"
+        commands.write_text("servers get 1\nservers get 2\n")
+        path = tmp_path / "trace.json"
+
+        result = cli_runner.invoke(
+            cli, ["--trace-file", str(path), "batch", "--parallel", "2", str(commands)], obj=mock_context
+        )
+
+        assert result.exit_code == 0
+        spans = {e["args"]["span_id"]: e for e in json.loads(path.read_text())["traceEvents"] if e["ph"] == "X"}
+        batch = _named(spans, "netcupctl batch")[0]
+        inner = _named(spans, "netcupctl servers")
+        assert len(inner) == 2
+        assert all(s["args"]["parent_id"] == batch["args"]["span_id"] for s in inner)
+
+    def test_unwritable_trace_file(self, cli_runner, mock_context, requests_mock, api_base_url, tmp_path):
+        requests_mock.get(f"{api_base_url}/api/ping", text="pong")
+
+        result = cli_runner.invoke(
+            cli, ["--trace-file", str(tmp_path / "missing" / "trace.json"), "ping"], obj=mock_context
+        )
+
+        assert "Could not write trace file" in result.output
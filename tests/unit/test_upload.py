@@ -0,0 +1,363 @@
+"""
+Tests for netcupctl.upload
+"""
+import hashlib
+import threading
+import time
+import tracemalloc
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from netcupctl.client import APIError, NetcupClient
+from netcupctl.config import ConfigManager
+from netcupctl.retry import RetryPolicy
+from netcupctl.testing.mockserver import MockScpModel, MockServer
+from netcupctl import upload as upload_module
+from netcupctl.upload import (
+    FileWindow, MultipartUpload, Part, PartTuner, UploadJournal, UploadManifest, file_sha256, split_range,
+)
+
+USER = "/api/v1/users/user_123"
+
+
+@pytest.fixture
+def image(tmp_path):
+    path = tmp_path / "disk.img"
+    path.write_bytes(b"".join(bytes([n]) * 1000 for n in range(10)))
+    return str(path)
+
+
+@pytest.fixture
+def config(tmp_path):
+    manager = ConfigManager()
+    manager.config_dir = tmp_path / "netcupctl"
+    return manager
+
+
+@pytest.mark.unit
+class TestSplitRange:
+
+    def test_last_part_is_shorter(self):
+        assert split_range(4, 3, 1000, 2500) == [Part(4, 1000, 834), Part(5, 1834, 834), Part(6, 2668, 832)]
+
+    def test_empty_range(self):
+        assert split_range(1, 0, 0, 0) == []
+
+    def test_range_without_part_numbers(self):
+        with pytest.raises(ValueError, match="No part number left"):
+            split_range(3, 0, 1000, 10)
+
+
+@pytest.mark.unit
+class TestPartTuner:
+
+    def test_starts_small_with_two_parts_in_flight(self):
+        tuner = PartTuner(1024 * upload_module.MB, max_parallel=8)
+
+        assert tuner.part_size == upload_module.MIN_PART_SIZE
+        assert tuner.parallel == 2
+
+    def test_part_size_respects_part_count_limit(self):
+        file_size = upload_module.MAX_PARTS * upload_module.MIN_PART_SIZE * 3
+        tuner = PartTuner(file_size, max_parallel=4)
+
+        assert tuner.part_size == 3 * upload_module.MIN_PART_SIZE
+        assert tuner.next_size(5000, 2) == 5000
+        assert tuner.next_size(10 ** 9, 10) == 10 ** 8
+        assert PartTuner(0, 4, part_size=1000).next_size(5000, 2) == 2500
+        with pytest.raises(ValueError, match="more than"):
+            tuner.next_size(5000, 0)
+
+    def test_grows_while_throughput_rises(self, monkeypatch):
+        clock = [0.0]
+        monkeypatch.setattr(upload_module.time, "monotonic", lambda: clock[0])
+        tuner = PartTuner(10 ** 10, max_parallel=4)
+        size = upload_module.MIN_PART_SIZE
+
+        def finish_round(seconds):
+            clock[0] += seconds
+            return [tuner.finished(tuner.part_size) for _ in range(tuner.parallel)]
+
+        assert finish_round(1.0) == [False, True]
+        assert (tuner.part_size, tuner.parallel) == (2 * size, 3)
+        assert finish_round(1.0) == [False, False, True]
+        assert (tuner.part_size, tuner.parallel) == (4 * size, 4)
+        assert finish_round(10.0) == [False, False, False, False]
+        assert (tuner.part_size, tuner.parallel, tuner.tuning) == (4 * size, 4, False)
+
+    def test_fixed_part_size(self):
+        tuner = PartTuner(10 ** 10, max_parallel=1, part_size=1000)
+
+        assert tuner.finished(1000)
+        assert (tuner.part_size, tuner.parallel, tuner.tuning) == (1000, 1, False)
+
+
+@pytest.mark.unit
+class TestFileWindow:
+
+    def test_reads_only_its_range(self, image):
+        with FileWindow(image, 2000, 1500) as window:
+            head = window.read(600)
+            rest = window.read()
+
+            assert len(window) == 1500
+            assert head == bytes([2]) * 600
+            assert rest == bytes([2]) * 400 + bytes([3]) * 500
+            assert window.read(10) == b""
+
+    def test_md5_of_range_read_from_its_start(self, image):
+        expected = hashlib.md5(bytes([1]) * 1000).hexdigest()
+        with FileWindow(image, 1000, 1000) as window:
+            window.read(400)
+            assert window.md5 is None
+            window.seek(500)
+            window.read()
+            assert window.md5 is None
+            window.seek(0)
+            window.read(400)
+            window.read()
+            assert window.md5 == expected
+
+    def test_seek_and_tell(self, image):
+        with FileWindow(image, 1000, 1000) as window:
+            window.read(100)
+            assert window.tell() == 100
+            assert window.seek(0, 2) == 1000
+            assert window.seek(-1, 1) == 999
+            assert window.seek(0) == 0
+            assert window.read(1) == bytes([1])
+
+
+@pytest.mark.unit
+class TestMultipartUpload:
+
+    def test_upload_to_mock_server(self, image, mock_auth):
+        mock_auth._token_data["user_id"] = "user_123"
+        with MockServer(MockScpModel(), latency=0.01) as server:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=server.url)
+            upload_id = client.post(f"{USER}/images/disk.img")["uploadId"]
+            upload = MultipartUpload(client, f"{USER}/images/disk.img/{upload_id}", image, part_size=1000, parallel=4)
+            progress = []
+
+            parts = upload.upload_parts(progress.append)
+            result = upload.complete(parts)
+
+        assert [p["partNumber"] for p in parts] == list(range(1, 11))
+        assert parts[3]["etag"] == hashlib.md5(bytes([3]) * 1000).hexdigest()
+        assert progress == [1000] * 10
+        assert result["size"] == 10_000
+
+    def test_plan_fills_gaps_before_the_rest(self, config, image):
+        journal = UploadJournal(config, "user_123", "images", "disk.img")
+        journal.start("upload-1", image)
+        journal.record(Part(1, 0, 1000), "e1")
+        journal.record(Part(4, 3000, 1000), "e4")
+
+        upload = MultipartUpload(MagicMock(), "/upload", image, part_size=3000, journal=journal)
+
+        assert upload.sent_bytes == 2000
+        assert list(upload.plan()) == [
+            Part(2, 1000, 1000), Part(3, 2000, 1000), Part(5, 4000, 3000), Part(6, 7000, 3000)
+        ]
+
+    def test_logs_throughput_per_part(self, image):
+        client = MagicMock()
+        client.put_binary.return_value = {"etag": "e"}
+        lines = []
+
+        MultipartUpload(client, "/upload", image, part_size=5000, parallel=1, log=lines.append).upload_parts()
+
+        assert len([line for line in lines if line.startswith("Part ")]) == 2
+        assert "MB/s" in lines[0]
+
+    def test_parts_are_streamed_with_flat_memory(self, tmp_path, mock_auth):
+        part_size = 16 * 1024 * 1024
+        big = tmp_path / "big.img"
+        with open(big, "wb") as f:
+            f.truncate(2 * part_size)
+        mock_auth._token_data["user_id"] = "user_123"
+        with MockServer(MockScpModel()) as server:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=server.url)
+            upload_id = client.post(f"{USER}/images/big.img")["uploadId"]
+            upload = MultipartUpload(client, f"{USER}/images/big.img/{upload_id}", str(big),
+                                     part_size=part_size, parallel=2)
+            tracemalloc.start()
+            try:
+                parts = upload.upload_parts()
+                _, peak = tracemalloc.get_traced_memory()
+            finally:
+                tracemalloc.stop()
+
+        assert len(parts) == 2
+        assert peak < part_size / 2
+
+    def test_retried_part_is_sent_again_from_its_start(self, image, mock_auth):
+        mock_auth._token_data["user_id"] = "user_123"
+        with MockServer(MockScpModel()) as server:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=1, backoff_factor=0), base_url=server.url)
+            upload_id = client.post(f"{USER}/images/disk.img")["uploadId"]
+            path = f"{USER}/images/disk.img/{upload_id}"
+            server.fail_next(503, path_prefix=f"{path}/parts/2")
+
+            parts = MultipartUpload(client, path, image, part_size=5000).upload_parts()
+
+        statuses = [status for method, p, status in server.requests if p == f"{path}/parts/2"]
+        assert statuses == [503, 200]
+        assert parts[1]["etag"] == hashlib.md5(b"".join(bytes([n]) * 1000 for n in range(5, 10))).hexdigest()
+
+    def test_empty_file(self, tmp_path, mock_auth):
+        empty = tmp_path / "empty.img"
+        empty.write_bytes(b"")
+        mock_auth._token_data["user_id"] = "user_123"
+        with MockServer(MockScpModel()) as server:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=server.url)
+            upload_id = client.post(f"{USER}/images/empty.img")["uploadId"]
+            upload = MultipartUpload(client, f"{USER}/images/empty.img/{upload_id}", str(empty))
+
+            result = upload.complete(upload.upload_parts())
+
+        assert result["size"] == 0
+
+    def test_at_most_parallel_parts_in_flight(self, image):
+        lock, in_flight, peak = threading.Lock(), [0], [0]
+
+        def put_binary(path, data):
+            with lock:
+                in_flight[0] += 1
+                peak[0] = max(peak[0], in_flight[0])
+            time.sleep(0.01)
+            with lock:
+                in_flight[0] -= 1
+            return {"ETag": path.rsplit("/", 1)[1]}
+
+        client = MagicMock()
+        client.put_binary.side_effect = put_binary
+
+        parts = MultipartUpload(client, "/upload", image, part_size=1000, parallel=3).upload_parts()
+
+        assert peak[0] == 3
+        assert parts == [{"partNumber": n, "etag": str(n)} for n in range(1, 11)]
+
+    def test_failed_part_stops_reading_the_file(self, image):
+        client = MagicMock()
+        client.put_binary.side_effect = APIError("Upload failed", status_code=500)
+
+        with pytest.raises(APIError):
+            MultipartUpload(client, "/upload", image, part_size=1000, parallel=2).upload_parts()
+
+        assert client.put_binary.call_count == 2
+
+    def test_etag_not_matching_sent_data(self, image):
+        client = MagicMock()
+        client.put_binary.side_effect = lambda path, data: (data.read(), {"ETag": '"' + "0" * 32 + '"'})[1]
+
+        with pytest.raises(APIError, match="Part 1 was corrupted in transit"):
+            MultipartUpload(client, "/upload", image, part_size=10_000).upload_parts()
+
+    def test_abort_deletes_upload(self, image):
+        client = MagicMock()
+
+        MultipartUpload(client, "/upload", image).abort()
+
+        client.delete.assert_called_once_with("/upload")
+
+
+@pytest.mark.unit
+class TestUploadJournal:
+
+    def test_records_parts_after_each_part(self, config, image):
+        journal = UploadJournal(config, "user_123", "images", "disk/v1.img")
+        journal.start("upload-1", image)
+        journal.record(Part(2, 1000, 1000), "etag-2")
+
+        loaded = UploadJournal(config, "user_123", "images", "disk/v1.img")
+
+        assert journal.path == config.uploads_dir / "images-disk%2Fv1.img.json"
+        assert loaded.load(image)
+        assert (loaded.upload_id, loaded.parts) == ("upload-1", {2: (Part(2, 1000, 1000), "etag-2")})
+
+    def test_missing_or_foreign_journal_is_not_loaded(self, config, image):
+        UploadJournal(config, "other_user", "images", "disk.img").start("upload-1", image)
+
+        assert not UploadJournal(config, "user_123", "images", "disk.img").load(image)
+        assert not UploadJournal(config, "user_123", "isos", "disk.img").load(image)
+
+    def test_changed_file_is_rejected(self, config, image):
+        UploadJournal(config, "user_123", "images", "disk.img").start("upload-1", image)
+        with open(image, "ab") as f:
+            f.write(b"more")
+
+        with pytest.raises(ValueError, match="changed since"):
+            UploadJournal(config, "user_123", "images", "disk.img").load(image)
+
+    def test_journaled_upload_id_of_any_file(self, config, image):
+        UploadJournal(config, "user_123", "images", "disk.img").start("upload-1", image)
+        with open(image, "ab") as f:
+            f.write(b"more")
+
+        assert UploadJournal(config, "user_123", "images", "disk.img").journaled_upload_id() == "upload-1"
+        assert UploadJournal(config, "other_user", "images", "disk.img").journaled_upload_id() is None
+        assert UploadJournal(config, "user_123", "isos", "disk.img").journaled_upload_id() is None
+
+    def test_delete(self, config, image):
+        journal = UploadJournal(config, "user_123", "images", "disk.img")
+        journal.start("upload-1", image)
+
+        journal.delete()
+
+        assert not journal.path.exists()
+
+    def test_resume_sends_only_missing_parts(self, config, image, mock_auth):
+        mock_auth._token_data["user_id"] = "user_123"
+        with MockServer(MockScpModel()) as server:
+            client = NetcupClient(mock_auth, retry=RetryPolicy(max_retries=0), base_url=server.url)
+            upload_id = client.post(f"{USER}/images/disk.img")["uploadId"]
+            path = f"{USER}/images/disk.img/{upload_id}"
+            journal = UploadJournal(config, "user_123", "images", "disk.img")
+            journal.start(upload_id, image)
+            server.fail_next(500, path_prefix=f"{path}/parts/4")
+            with pytest.raises(APIError):
+                MultipartUpload(client, path, image, part_size=1000, parallel=1, journal=journal).upload_parts()
+
+            resumed = UploadJournal(config, "user_123", "images", "disk.img")
+            assert resumed.load(image)
+            upload = MultipartUpload(client, path, image, part_size=3000, parallel=4, journal=resumed)
+            sent_before = upload.sent_bytes
+            result = upload.complete(upload.upload_parts())
+
+        puts = [p for method, p, status in server.requests if method == "PUT" and status == 200]
+        assert sent_before == 3000
+        assert sorted(puts) == [f"{path}/parts/{n}" for n in range(1, 7)]
+        assert result["size"] == 10_000
+
+
+@pytest.mark.unit
+class TestUploadManifest:
+
+    def test_file_sha256(self, image):
+        assert file_sha256(image) == hashlib.sha256(Path(image).read_bytes()).hexdigest()
+
+    def test_digest_reuses_recorded_hash_of_unmodified_file(self, config, image):
+        manifest = UploadManifest(config, "user_123", "images", "disk.img")
+        manifest.record(image, "recorded")
+
+        assert manifest.digest(image) == "recorded"
+        with open(image, "ab") as f:
+            f.write(b"more")
+        assert manifest.digest(image) == file_sha256(image)
+
+    def test_unchanged(self, config, image):
+        manifest = UploadManifest(config, "user_123", "images", "disk.img")
+        assert not manifest.unchanged("abc", {"size": 10_000})
+
+        manifest.record(image, "abc")
+
+        assert manifest.unchanged("abc", {"size": 10_000})
+        assert manifest.unchanged("abc", {"sha256": "sha256:ABC"})
+        assert not manifest.unchanged("def", {"size": 10_000})
+        assert not manifest.unchanged("abc", None)
+        assert not manifest.unchanged("abc", {"size": 9_999})
+        assert not manifest.unchanged("abc", {"checksum": "def"})
+        assert not UploadManifest(config, "user_123", "isos", "disk.img").unchanged("abc", {"size": 10_000})
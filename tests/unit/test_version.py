@@ -0,0 +1,45 @@
+"""
+Tests for the netcupctl version lookup
+"""
+import importlib
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+import netcupctl
+from netcupctl import _version
+
+REPO_ROOT = Path(__file__).resolve().parents[2]
+
+
+@pytest.mark.unit
+class TestVersion:
+
+    def test_version_from_version_module(self):
+        assert netcupctl.__version__ == _version.__version__
+
+    def test_matches_release_manifest(self):
+        manifest = json.loads((REPO_ROOT / ".release-please-manifest.json").read_text(encoding="utf-8"))
+
+        assert _version.__version__ == manifest["."]
+
+    def test_import_skips_metadata_lookup(self):
+        code = "import sys, netcupctl; print('importlib.metadata' in sys.modules)"
+        result = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == "False"
+
+    def test_fallback_to_metadata(self, monkeypatch):
+        monkeypatch.setitem(sys.modules, "netcupctl._version", None)
+        monkeypatch.setattr("importlib.metadata.version", lambda name: "9.9.9")
+        try:
+            importlib.reload(netcupctl)
+            assert netcupctl.__version__ == "9.9.9"
+        finally:
+            monkeypatch.undo()
+            importlib.reload(netcupctl)
+
+        assert netcupctl.__version__ == _version.__version__